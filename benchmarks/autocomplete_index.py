@@ -0,0 +1,80 @@
+"""Build and query benchmark for ``hero.PrefixIndex``.
+
+Builds an index over a synthetic corpus of product names, then reports the
+median and 99th percentile latency of uncached prefix and infix queries, and of
+repeated (cached) queries.
+
+Usage:
+    python benchmarks/autocomplete_index.py [--size N] [--substring]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.autocomplete.index import PrefixIndex
+
+WORDS = (
+    "alpha bravo charlie delta echo foxtrot golf hotel india juliet kilo lima "
+    "mike november oscar papa quebec romeo sierra tango uniform victor whiskey"
+).split()
+
+
+def _corpus(size: int) -> list[str]:
+    rng = random.Random(0)
+    return [
+        f"{rng.choice(WORDS).title()} {rng.choice(WORDS)} {i:07d}" for i in range(size)
+    ]
+
+
+def _latencies(index: PrefixIndex, queries: list[str], cached: bool) -> list[float]:
+    latencies = []
+    for query in queries:
+        if not cached:
+            index._cache.clear()
+        start = time.perf_counter()
+        index.search(query, k=10)
+        latencies.append((time.perf_counter() - start) * 1e6)
+    return latencies
+
+
+def _report(name: str, latencies: list[float]) -> None:
+    p99 = statistics.quantiles(latencies, n=100)[98]
+    print(f"{name:<22} p50 {statistics.median(latencies):8.1f} us   p99 {p99:8.1f} us")
+
+
+def main() -> None:
+    """Build the index and print query latencies."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--substring", action="store_true")
+    args = parser.parse_args()
+
+    corpus = _corpus(args.size)
+    start = time.perf_counter()
+    index = PrefixIndex(corpus, substring=args.substring, cache_size=100_000)
+    print(
+        f"built index over {len(index):,} strings in {time.perf_counter() - start:.2f} s"
+    )
+
+    rng = random.Random(1)
+    prefixes = [f"{rng.choice(WORDS)[: rng.randint(1, 5)]}" for _ in range(1_000)] + [
+        f"{rng.choice(WORDS)} {rng.choice(WORDS)[:2]}" for _ in range(1_000)
+    ]
+    _report("prefix (uncached)", _latencies(index, prefixes, cached=False))
+    _latencies(index, prefixes, cached=True)
+    _report("prefix (cached)", _latencies(index, prefixes, cached=True))
+    if args.substring:
+        infixes = [
+            f"{rng.choice(WORDS)[1:4]} {rng.choice(WORDS)[:2]}" for _ in range(1_000)
+        ]
+        _report("infix (uncached)", _latencies(index, infixes, cached=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Compile-time benchmark for the HeroUI render cache.
+
+Builds a synthetic 200-page app out of the ``src`` components, where most
+buttons, chips and code blocks repeat the same static props across pages and a
+few are bound to state, then compiles every page to JavaScript with the render
+cache disabled and enabled.
+
+Usage:
+    python benchmarks/compile_pages.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import reflex as rx
+from reflex.compiler import compiler
+from reflex.components.component import StatefulComponent
+
+import heroui as hero
+from src.cache import render_cache
+
+PAGES = 200
+
+
+class BenchState(rx.State):
+    count: int = 0
+
+
+def _page(index: int) -> rx.Component:
+    """Build one page of the synthetic app.
+
+    Args:
+        index: The page number.
+
+    Returns:
+        The page component.
+    """
+    return rx.fragment(
+        hero.card(
+            hero.card_header(hero.chip("New", color="success", size="sm")),
+            hero.card_body(
+                hero.code("pip install heroui-provider", color="primary"),
+                hero.alert(
+                    title="Heads up", description="Static content", color="warning"
+                ),
+                *[
+                    hero.button(f"Action {i}", color="primary", size="sm")
+                    for i in range(10)
+                ],
+                *[hero.chip(tag, variant="flat") for tag in ("python", "reflex", "ui")],
+            ),
+            hero.card_footer(
+                hero.avatar(name="Jane Doe", size="sm"),
+                hero.badge(hero.avatar(name="John"), content="5", color="danger"),
+                hero.spinner(size="sm"),
+            ),
+        ),
+        hero.button(f"Page {index}", variant="bordered"),
+        hero.button(BenchState.count, on_click=BenchState.set_count(index)),
+    )
+
+
+def _compile_app() -> float:
+    start = time.perf_counter()
+    for index in range(PAGES):
+        component = _page(index)
+        component._add_style_recursive({})
+        component = StatefulComponent.compile_from(component) or component
+        compiler.compile_page(f"page-{index}", component, BenchState)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Compile the app with and without the render cache."""
+    render_cache.enabled = False
+    _compile_app()  # Warm up imports and Reflex's own caches.
+    uncached = _compile_app()
+
+    render_cache.enabled = True
+    render_cache.clear()
+    cached = _compile_app()
+
+    print(f"{PAGES} pages, render cache off: {uncached * 1000:8.1f} ms")
+    print(
+        f"{PAGES} pages, render cache on:  {cached * 1000:8.1f} ms "
+        f"({render_cache.hits} hits, {render_cache.misses} misses, "
+        f"{len(render_cache)} entries)"
+    )
+
+
+if __name__ == "__main__":
+    main()
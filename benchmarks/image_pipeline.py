@@ -0,0 +1,86 @@
+"""Throughput benchmark for the responsive image pipeline.
+
+Generates a directory of synthetic photos, then measures how many images per
+second the pipeline processes on a cold cache (serially and across all cores)
+and on a warm cache, which is what a rebuild with unchanged images costs.
+
+Usage:
+    python benchmarks/image_pipeline.py [--count N] [--size WxH]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PIL import Image as PILImage
+
+from src.image.pipeline import ImagePipeline
+
+
+def _make_images(directory: Path, count: int, size: tuple[int, int]) -> list[Path]:
+    """Write ``count`` distinct synthetic JPEGs to ``directory``.
+
+    Args:
+        directory: Where to write the images.
+        count: The number of images.
+        size: The width and height of every image.
+
+    Returns:
+        The paths of the written images.
+    """
+    paths = []
+    gradient = PILImage.linear_gradient("L").resize(size)
+    for i in range(count):
+        noise = PILImage.effect_noise(size, 32 + i % 64)
+        image = PILImage.merge("RGB", (gradient, noise, gradient.rotate(i % 360)))
+        path = directory / f"photo-{i:04d}.jpg"
+        image.save(path, quality=90)
+        paths.append(path)
+    return paths
+
+
+def _run(pipeline: ImagePipeline, paths: list[Path], workers: int) -> float:
+    start = time.perf_counter()
+    pipeline.process_many(paths, max_workers=workers)
+    return len(paths) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark and print images per second for each scenario."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=300)
+    parser.add_argument("--size", default="1600x1067")
+    args = parser.parse_args()
+    size = tuple(int(v) for v in args.size.split("x"))
+    cores = os.cpu_count() or 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        assets = Path(tmp) / "assets"
+        assets.mkdir()
+        paths = _make_images(assets, args.count, size)
+        serial_sample = paths[: max(1, args.count // 10)]
+
+        def pipeline(name: str) -> ImagePipeline:
+            return ImagePipeline(assets_dir=assets, output_dir=assets / name)
+
+        results = {
+            f"cold, 1 worker ({len(serial_sample)} images)": _run(
+                pipeline("serial"), serial_sample, 1
+            ),
+            f"cold, {cores} workers": _run(pipeline("parallel"), paths, cores),
+            # A fresh pipeline has no in-process memo, so this reads the disk cache.
+            "warm (disk cache)": _run(pipeline("parallel"), paths, 1),
+        }
+
+    print(f"{args.count} images of {args.size}")
+    for name, throughput in results.items():
+        print(f"{name:<32} {throughput:10.1f} images/s")
+
+
+if __name__ == "__main__":
+    main()
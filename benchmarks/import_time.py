@@ -0,0 +1,85 @@
+"""Cold import-time benchmark for the ``heroui`` package.
+
+Every Reflex worker (and every hot reload) starts a fresh interpreter, so this
+measures each scenario in a new ``python -X importtime`` subprocess and reports
+the cumulative microseconds spent under ``heroui`` and the ``src.*`` component
+modules. The parts of ``reflex`` every app loads anyway (``rx.State`` and
+``rx.Component``) are imported first so their cost is not attributed to us.
+
+Usage:
+    python benchmarks/import_time.py [--runs N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PRELUDE = "import reflex as rx; rx.State; rx.Component"
+
+SCENARIOS: dict[str, str] = {
+    # What ``import heroui`` cost before the lazy registry: every component module.
+    "eager (all components)": "import heroui; [getattr(heroui, n) for n in heroui.__all__]",
+    "lazy import only": "import heroui",
+    "lazy + hero.button": "import heroui; heroui.button",
+    "lazy + hero.card_body": "import heroui; heroui.card_body",
+}
+
+
+def _measure(statement: str) -> int:
+    """Run ``statement`` in a cold interpreter and return the heroui import cost.
+
+    Args:
+        statement: The Python statement to execute once reflex is loaded.
+
+    Returns:
+        The cumulative import time in microseconds of ``heroui`` and ``src.*``.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{PRELUDE}; {statement}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line[12:].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        # The field is a space then two per nesting level. Only count top-level
+        # entries of our own packages: the cumulative time covers what is nested.
+        name = module[1:]
+        if name != name.lstrip():
+            continue
+        name = name.rstrip()
+        if name == "heroui" or name == "src" or name.startswith("src."):
+            total += int(cumulative)
+    return total
+
+
+def main() -> None:
+    """Run every scenario and print the median cold import time."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    results = {
+        name: statistics.median(_measure(stmt) for _ in range(args.runs))
+        for name, stmt in SCENARIOS.items()
+    }
+    baseline = results["eager (all components)"]
+    for name, micros in results.items():
+        saving = baseline - micros
+        print(
+            f"{name:<26} {micros / 1000:8.1f} ms  (saves {saving / 1000:6.1f} ms per worker)"
+        )
+
+
+if __name__ == "__main__":
+    main()
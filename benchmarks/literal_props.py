@@ -0,0 +1,60 @@
+"""Create-time benchmark for the Literal prop tables.
+
+Creates 100,000 components with several Literal props each (buttons, chips and
+spacers), once through Reflex's generic prop type checks and once through the
+precomputed tables of ``LiteralProps``, and reports the time per component.
+
+Usage:
+    python benchmarks/literal_props.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import reflex as rx
+
+from src.button.button import Button
+from src.chip.chip import Chip
+from src.spacer.spacer import Spacer
+
+COMPONENTS = 100_000
+
+
+def _reflex_only(component: type[rx.Component]) -> type[rx.Component]:
+    """Subclass a component to skip the tables and use Reflex's checks."""
+    return type(
+        component.__name__,
+        (component,),
+        {"__module__": component.__module__, "_post_init": rx.Component._post_init},
+    )
+
+
+def _run(button: type, chip: type, spacer: type) -> float:
+    """Create ``COMPONENTS`` components and return the elapsed seconds."""
+    start = time.perf_counter()
+    for i in range(COMPONENTS // 3):
+        button.create("Save", color="primary", size="sm", variant="flat", radius="full")
+        chip.create("tag", color="success", size="sm", variant="dot")
+        spacer.create(x=4, y="px")
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Compare create times with and without the Literal prop tables."""
+    reflex = (_reflex_only(Button), _reflex_only(Chip), _reflex_only(Spacer))
+    tables = (Button, Chip, Spacer)
+    for classes in (reflex, tables):
+        for component in classes:
+            component.create()  # warm up field and type caches
+    before = _run(*reflex)
+    after = _run(*tables)
+    print(f"Reflex prop checks:  {before:6.2f} s ({before / COMPONENTS * 1e6:5.1f} µs)")
+    print(f"Literal prop tables: {after:6.2f} s ({after / COMPONENTS * 1e6:5.1f} µs)")
+    print(f"speedup: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Payload benchmark for ``hero.OptionsState`` over successive loads.
+
+Loads a 10,000 option list one window at a time and reports, for each load, the
+bytes of the state update sent to the browser, next to what resending every
+option loaded so far would cost. The update should stay at one window.
+
+Usage:
+    python benchmarks/options_windows.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import reflex as rx
+
+from src.listbox import OptionsState
+
+OPTIONS = 10_000
+LOADS = 10
+
+
+class BenchOptionsState(OptionsState, rx.State):
+    """An options state with the full list kept on the server."""
+
+
+def _update_bytes(state: rx.State) -> int:
+    """Get the size of the pending state update and mark it as sent."""
+    size = len(json.dumps(state.get_delta()).encode())
+    state._clean()
+    return size
+
+
+def main() -> None:
+    """Load ``LOADS`` windows and report the update size of each."""
+    state = BenchOptionsState(_reflex_internal_init=True)
+    options = [{"key": f"sku-{i}", "label": f"Option {i:05d}"} for i in range(OPTIONS)]
+    state._set_all_options(options)
+    total_sent = total_resend = 0
+    for load in range(1, LOADS + 1):
+        if load > 1:
+            state.load_more()
+        loaded = state.options_offset + len(state.options)
+        sent = _update_bytes(state)
+        resend = len(json.dumps(options[:loaded]).encode())
+        total_sent += sent
+        total_resend += resend
+        print(
+            f"load {load:2}: {loaded:5,} options, update {sent / 1024:6.1f} KiB "
+            f"(resending all: {resend / 1024:7.1f} KiB)"
+        )
+    print(
+        f"total: {total_sent / 1024:.1f} KiB sent, "
+        f"{total_resend / 1024:.1f} KiB when resending all"
+    )
+
+
+if __name__ == "__main__":
+    main()
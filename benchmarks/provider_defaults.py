@@ -0,0 +1,85 @@
+"""Page-size benchmark for Provider-level default props.
+
+Compiles a large generated page with the usual per-call-site overrides
+(``radius="full", size="sm"`` on every button, and so on), first as is and then
+with props equal to the HeroUI library defaults dropped, which every page under
+``hero.provider`` gets. It then compiles the page with the same values given once
+as ``hero.provider(defaults=...)`` instead. Reports the size of the emitted
+JavaScript for each, and the saving of each step. The saving comes from dropping
+the library defaults: resolving ``defaults=`` writes the same values into the page
+as the call sites would, so it saves typing rather than bytes.
+
+Usage:
+    python benchmarks/provider_defaults.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import reflex as rx
+from reflex.compiler import compiler
+
+import heroui as hero
+from src.provider.defaults import apply_defaults
+
+ROWS = 500
+
+DEFAULTS = {
+    "button": {"radius": "full", "size": "sm"},
+    "chip": {"variant": "flat", "size": "sm"},
+    "avatar": {"size": "sm"},
+}
+
+
+def _page(overrides: bool) -> rx.Component:
+    """Build a page of ``ROWS`` rows of cards.
+
+    Args:
+        overrides: Whether to repeat the defaults at every call site.
+
+    Returns:
+        The page component.
+    """
+
+    def props(name: str) -> dict:
+        return DEFAULTS[name] if overrides else {}
+
+    return rx.fragment(
+        *[
+            hero.card(
+                hero.card_body(
+                    hero.avatar(name=f"User {i}", **props("avatar")),
+                    hero.chip(f"tag-{i % 7}", **props("chip")),
+                    hero.button("Edit", color="primary", **props("button")),
+                    hero.button("Delete", color="danger", **props("button")),
+                )
+            )
+            for i in range(ROWS)
+        ]
+    )
+
+
+def _page_size(component: rx.Component) -> int:
+    return len(compiler.compile_page("index", component, None)[1].encode())
+
+
+def main() -> None:
+    """Compare the emitted page size of each way of setting the props."""
+    raw = _page_size(_page(overrides=True))
+    stripped = _page_size(apply_defaults(_page(overrides=True), {}))
+    resolved = _page_size(apply_defaults(_page(overrides=False), DEFAULTS))
+    print(f"{ROWS * 6} components, every prop emitted:      {raw / 1024:8.1f} KiB")
+    print(
+        f"{ROWS * 6} components, library defaults dropped: {stripped / 1024:8.1f} KiB"
+    )
+    print(
+        f"{ROWS * 6} components, provider defaults:        {resolved / 1024:8.1f} KiB"
+    )
+    print(f"library defaults: {(1 - stripped / raw) * 100:.1f}% smaller")
+    print(f"provider defaults: {(1 - resolved / stripped) * 100:.1f}% smaller")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""Benchmark suite for component creation and page compilation.
+
+Measures:
+
+- ``create.<factory>``: microseconds per ``.create()`` call of every factory
+  exported by ``heroui``.
+- ``compile.examples``: milliseconds to compile the ``examples`` app's page.
+- ``compile.synthetic_1000``: milliseconds to compile a page of 1,000 components.
+- ``memory.<page>``: peak KiB allocated while compiling each page.
+
+Every metric is "lower is better". Results are printed as JSON; with
+``--baseline`` they are compared against a stored run and the script exits with
+status 1 if any metric regressed by more than ``--tolerance``.
+
+Usage:
+    python benchmarks/suite.py                                  # print results
+    python benchmarks/suite.py --save benchmarks/baseline.json  # store a baseline
+    python benchmarks/suite.py --baseline benchmarks/baseline.json
+"""
+
+import argparse
+import contextlib
+import functools
+import gc
+import inspect
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from importlib.metadata import version
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "examples"))
+
+import reflex as rx
+from reflex.compiler import compiler
+from reflex.components.component import StatefulComponent
+
+import heroui as hero
+from src.cache import render_cache
+
+# Arguments for factories that are usually called with content.
+SAMPLE_ARGS: dict[str, tuple[tuple, dict]] = {
+    "alert": ((), {"title": "Heads up", "color": "warning"}),
+    "avatar": ((), {"name": "Jane Doe", "size": "sm"}),
+    "badge": (("5",), {"color": "danger"}),
+    "button": (("Click",), {"color": "primary", "size": "sm"}),
+    "chip": (("tag",), {"variant": "flat"}),
+    "code": (("pip install heroui-provider",), {}),
+    "image": ((), {"src": "https://heroui.com/images/hero-card.jpeg", "width": 300}),
+    "input": ((), {"placeholder": "Type something...", "debounce_ms": 300}),
+    "snippet": (("echo hello",), {}),
+    "textarea": ((), {"placeholder": "Type something..."}),
+    "theme": ((), {"primary": "#006FEE", "danger": "#F31260"}),
+}
+
+
+def _sample_args(name: str) -> tuple[tuple, dict]:
+    """Get the arguments to call a factory with.
+
+    Args:
+        name: The name of the factory.
+
+    Returns:
+        The positional and keyword arguments.
+    """
+    if name == "loading_boundary":
+        # Takes a state event handler, only available once the state exists.
+        state = _bench_state()
+        return (hero.button("Save"),), {"on": state.set_count}
+    return SAMPLE_ARGS.get(name, ((), {}))
+
+
+def _factories() -> dict[str, Callable]:
+    """Find every component factory exported by ``heroui``.
+
+    Returns:
+        The factories by name.
+    """
+    factories = {}
+    for name in hero.__all__:
+        factory = getattr(hero, name)
+        if (
+            name[0].islower()
+            and inspect.ismethod(factory)
+            and isinstance(factory.__self__, type)
+            and issubclass(factory.__self__, rx.Component)
+        ):
+            factories[name] = factory
+    return factories
+
+
+def _best_of(func: Callable[[], object], number: int, repeat: int) -> float:
+    """Time ``func`` and return the best mean seconds per call.
+
+    Args:
+        func: The function to time.
+        number: Calls per measurement.
+        repeat: Measurements taken.
+
+    Returns:
+        The best seconds per call.
+    """
+    for _ in range(max(1, number // 10)):
+        func()  # Warm up.
+    best = float("inf")
+    # Like timeit, keep the garbage collector from adding noise to the timings.
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            best = min(best, (time.perf_counter() - start) / number)
+    finally:
+        gc.enable()
+    return best
+
+
+@functools.cache
+def _bench_state() -> type[rx.State]:
+    # Defined on first use, creating a state loads the app config (and its warnings).
+    class BenchState(rx.State):
+        count: int = 0
+
+    return BenchState
+
+
+def _synthetic_page() -> rx.Component:
+    """Build a page of 1,000 HeroUI components, a fifth of them bound to state.
+
+    Returns:
+        The page component.
+    """
+    state = _bench_state()
+    rows = []
+    for i in range(100):
+        rows.append(
+            hero.card(
+                hero.card_header(hero.chip(f"#{i}", size="sm")),
+                hero.card_body(
+                    hero.avatar(name=f"User {i}"),
+                    hero.code(f"item-{i}"),
+                    hero.button("Edit", color="primary"),
+                    hero.button(state.count, on_press=state.set_count(i)),
+                    hero.switch(is_selected=state.count > i),
+                ),
+                hero.card_footer(hero.spinner(size="sm")),
+            )
+        )
+    return hero.provider(rx.vstack(*rows))
+
+
+def _examples_page() -> rx.Component:
+    from examples.examples import index
+
+    return index()
+
+
+def _compile(page: Callable[[], rx.Component]) -> str:
+    """Compile a page the way ``rx.App`` does, with a cold render cache.
+
+    Args:
+        page: The function building the page.
+
+    Returns:
+        The compiled JavaScript.
+    """
+    render_cache.clear()
+    component = page()
+    component._add_style_recursive({})
+    component = StatefulComponent.compile_from(component) or component
+    return compiler.compile_page("index", component, None)[1]
+
+
+def run(quick: bool = False) -> dict:
+    """Run every benchmark.
+
+    Args:
+        quick: Whether to use fewer iterations (for smoke runs).
+
+    Returns:
+        The results, with environment metadata.
+    """
+    number, repeat = (50, 2) if quick else (200, 7)
+    metrics: dict[str, float] = {}
+
+    factories = _factories()
+    for name, factory in factories.items():
+        # Import every component module before timing anything.
+        args, kwargs = _sample_args(name)
+        factory(*args, **kwargs)
+    for name, factory in factories.items():
+        args, kwargs = _sample_args(name)
+        seconds = _best_of(
+            lambda factory=factory, args=args, kwargs=kwargs: factory(*args, **kwargs),
+            number,
+            repeat,
+        )
+        metrics[f"create.{name}"] = round(seconds * 1e6, 2)
+
+    pages = {"examples": _examples_page, "synthetic_1000": _synthetic_page}
+    for name, page in pages.items():
+        _compile(page)  # Warm up imports and Reflex's own caches.
+        seconds = _best_of(lambda page=page: _compile(page), 1, 3 if quick else 5)
+        metrics[f"compile.{name}"] = round(seconds * 1e3, 2)
+
+        tracemalloc.start()
+        _compile(page)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        metrics[f"memory.{name}"] = round(peak / 1024, 1)
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "reflex": version("reflex"),
+        },
+        "units": {"create": "us", "compile": "ms", "memory": "KiB"},
+        "metrics": metrics,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Find the metrics that regressed against a baseline.
+
+    Metrics missing from the baseline are not compared, with a warning.
+
+    Args:
+        results: The current results.
+        baseline: The stored results.
+        tolerance: The allowed relative slowdown, e.g. 0.2 for 20%.
+
+    Returns:
+        A description of every regressed metric.
+    """
+    regressions = []
+    for name, value in results["metrics"].items():
+        reference = baseline["metrics"].get(name)
+        if reference is None:
+            print(f"WARNING {name}: not in the baseline", file=sys.stderr)
+        elif reference and value > reference * (1 + tolerance):
+            regressions.append(
+                f"{name}: {value} vs {reference} (+{(value / reference - 1) * 100:.0f}%)"
+            )
+    return regressions
+
+
+def main() -> None:
+    """Run the suite from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", type=Path, help="Write the results to this file.")
+    parser.add_argument("--baseline", type=Path, help="Compare against this file.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="Allowed relative regression before failing (default: 0.5).",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="Use fewer iterations (smoke run)."
+    )
+    args = parser.parse_args()
+    save = args.save and args.save.resolve()
+    baseline = args.baseline and args.baseline.resolve()
+    # Run from the example app, whose .gitignore covers the assets Reflex links.
+    os.chdir(ROOT / "examples")
+
+    # Keep stdout machine-readable, Reflex prints its warnings there.
+    with contextlib.redirect_stdout(sys.stderr):
+        results = run(quick=args.quick)
+    print(json.dumps(results, indent=2))
+    if save:
+        save.write_text(json.dumps(results, indent=2) + "\n")
+    if baseline:
+        regressions = compare(results, json.loads(baseline.read_text()), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Time-to-first-rows and server memory benchmark for ``hero.TableState``.
+
+Feeds a table state from synthetic paged data sources of increasing size and
+reports how long the first chunk takes to load, then loads ``LOADS`` chunks in
+a row and reports the size of each state update sent to the browser and the
+peak memory allocated over all loads. All should stay flat as the data source
+grows to 1M rows and as more chunks are loaded.
+
+Usage:
+    python benchmarks/table_first_rows.py
+"""
+
+import asyncio
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import reflex as rx
+
+from src.table import TableState
+
+SIZES = (10_000, 100_000, 1_000_000)
+LOADS = 10
+
+
+def _row(index: int) -> dict:
+    return {"key": str(index), "sku": f"SKU-{index:07d}", "price": index % 997}
+
+
+def _make_state(total: int) -> TableState:
+    """Create a table state backed by a paged source of ``total`` rows.
+
+    Args:
+        total: The number of rows in the data source.
+
+    Returns:
+        A fresh state instance.
+    """
+
+    async def _fetch_rows(self, offset, limit, sort_column, descending, query):
+        for i in range(offset, min(offset + limit, total)):
+            yield _row(total - 1 - i if descending else i)
+
+    state_cls = type(
+        f"BenchTableState{total}", (TableState, rx.State), {"_fetch_rows": _fetch_rows}
+    )
+    return state_cls(_reflex_internal_init=True)
+
+
+def _update_bytes(state: TableState) -> int:
+    """Get the size of the pending state update and mark it as sent."""
+    size = len(json.dumps(state.get_delta()).encode())
+    state._clean()
+    return size
+
+
+async def _load(state: TableState) -> tuple[float, list[int]]:
+    """Load the first chunk, then ``LOADS - 1`` more.
+
+    Returns:
+        The seconds to the first chunk, and the update size of every load.
+    """
+    start = time.perf_counter()
+    await state.sort({"column": "sku", "direction": "descending"})
+    elapsed = time.perf_counter() - start
+    sizes = [_update_bytes(state)]
+    for _ in range(LOADS - 1):
+        await state.load_more()
+        sizes.append(_update_bytes(state))
+    return elapsed, sizes
+
+
+def main() -> None:
+    """Run the benchmark for every data source size."""
+    for total in SIZES:
+        state = _make_state(total)
+        tracemalloc.start()
+        elapsed, sizes = asyncio.run(_load(state))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        loaded = state.rows_offset + len(state.rows)
+        print(
+            f"{total:>9,} rows: first {state.page_size} rows in "
+            f"{elapsed * 1000:6.2f} ms; {loaded:,} rows in {LOADS} loads, "
+            f"updates {min(sizes) / 1024:.1f}-{max(sizes) / 1024:.1f} KiB, "
+            f"peak {peak / 1024:7.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
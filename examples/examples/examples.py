@@ -24,7 +24,7 @@ class State(rx.State):
 def index() -> rx.Component:
     return rx.container(
         hero.provider(
-            # hero.theme(),
+            hero.theme(primary="#006FEE", success="#17C964", danger="#F31260"),
             rx.vstack(
                 hero.badge(
                     hero.avatar(
@@ -34,14 +34,16 @@ def index() -> rx.Component:
                     ),
                     content="1",
                 ),
-                hero.snippet(
-                    rx.el.span("echo 'Hello, World!'"),
-                ),
-                hero.alert(
-                    color="success",
-                    title="🐚 Sea of Packages",
-                    description="Don't forget to check out the documentation.",
-                    # variant="solid",
+                hero.static(
+                    hero.snippet(
+                        rx.el.span("echo 'Hello, World!'"),
+                    ),
+                    hero.alert(
+                        color="success",
+                        title="🐚 Sea of Packages",
+                        description="Don't forget to check out the documentation.",
+                        # variant="solid",
+                    ),
                 ),
                 rx.flex(
                     hero.button("Increment", on_press=State.increment, color="success"),
@@ -64,6 +66,7 @@ def index() -> rx.Component:
                     size="lg",
                     color_scheme="blue",
                     on_value_change=State.set_description,
+                    debounce_ms=300,
                 ),
                 hero.spacer(x="2", y="2"),
                 hero.card(
@@ -87,6 +90,7 @@ def index() -> rx.Component:
                     variant="default",
                 ),
             ),
+            critical_css=True,
         )
     )
 
@@ -2,24 +2,317 @@
 HeroUI - Modern UI components for Reflex Web Framework
 """
 
-# Import components from src
-from src.alert import *
-from src.avatar import *
-from src.button import *
-from src.card import *
-from src.checkbox import *
-from src.input import *
-from src.radio import *
-from src.textarea import *
-from src.image import *
-from src.spacer import *
-from src.spinner import *
-from src.switch import *
-from src.chip import *
-from src.code import *
-from src.badge import *
-from src.snippet import *
-
-# Import provider related components
-from src.provider import *
-from src.provider.types import *
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Map of source module -> public names it provides. Component modules are only
+# imported the first time one of their names is accessed (e.g. ``hero.card_body``).
+_SUBMOD_ATTRS: dict[str, list[str]] = {
+    "src.alert": ["Alert", "alert"],
+    "src.avatar": [
+        "Avatar",
+        "AvatarGroup",
+        "AvatarGroupState",
+        "avatar",
+        "avatar_group",
+    ],
+    "src.button": ["Button", "ButtonGroup", "button", "button_group", "button_list"],
+    "src.card": [
+        "Card",
+        "CardHeader",
+        "CardBody",
+        "CardFooter",
+        "card",
+        "card_header",
+        "card_body",
+        "card_footer",
+    ],
+    "src.checkbox": ["Checkbox", "CheckboxGroup", "checkbox", "checkbox_group"],
+    "src.input": ["Input", "input"],
+    "src.radio": ["Radio", "RadioGroup", "radio", "radio_group"],
+    "src.textarea": ["Textarea", "textarea"],
+    "src.form": ["Form", "form"],
+    "src.image": ["Image", "ImagePipeline", "ResponsiveImage", "image"],
+    "src.spacer": ["Spacer", "spacer"],
+    "src.spinner": ["Spinner", "spinner"],
+    "src.switch": ["Switch", "switch"],
+    "src.chip": ["Chip", "chip", "chip_list"],
+    "src.code": [
+        "Code",
+        "HIGHLIGHT_THEMES",
+        "HighlightedCode",
+        "Highlighter",
+        "code",
+        "highlight",
+        "highlighted_code",
+        "highlighter",
+    ],
+    "src.badge": ["Badge", "badge"],
+    "src.snippet": ["Snippet", "snippet"],
+    "src.lazy": ["Lazy", "lazy"],
+    "src.loading": [
+        "BackgroundTasks",
+        "LoadingBoundary",
+        "background_event",
+        "loading_boundary",
+    ],
+    "src.events": [
+        "ImageInfo",
+        "MouseInfo",
+        "PressInfo",
+        "image_event",
+        "mouse_event",
+        "press_event",
+    ],
+    "src.cache": ["RenderCache", "render_cache"],
+    "src.static": ["Static", "static"],
+    "src.npm": ["PACKAGE_VERSIONS", "versioned", "used_packages"],
+    "src.tailwind": ["HEROUI_PLUGIN", "tailwind_config", "theme_components"],
+    "src.theme": ["SHADES", "Theme", "foreground", "palette", "theme", "theme_css"],
+    "src.autocomplete": [
+        "Autocomplete",
+        "AutocompleteItem",
+        "PrefixIndex",
+        "autocomplete",
+        "autocomplete_item",
+    ],
+    "src.listbox": [
+        "Listbox",
+        "ListboxItem",
+        "OptionsState",
+        "listbox",
+        "listbox_item",
+    ],
+    "src.select": ["Select", "SelectItem", "select", "select_item"],
+    "src.table": [
+        "Table",
+        "TableHeader",
+        "TableColumn",
+        "TableBody",
+        "TableRow",
+        "TableCell",
+        "TableState",
+        "table",
+        "table_header",
+        "table_column",
+        "table_body",
+        "table_row",
+        "table_cell",
+    ],
+    # Provider related components
+    "src.provider": [
+        "LazyMotion",
+        "Provider",
+        "inline_critical_css",
+        "lazy_motion",
+        "provider",
+    ],
+    "src.provider.types": [
+        "Href",
+        "RouterOptions",
+        "CalendarDate",
+        "Calendar",
+        "SupportedCalendars",
+        "SupportedLocales",
+        "DefaultDatesType",
+        "HeroUIProviderProps",
+    ],
+}
+
+_ATTR_TO_MODULE: dict[str, str] = {
+    attr: module for module, attrs in _SUBMOD_ATTRS.items() for attr in attrs
+}
+
+# A literal list so linters can read it; tests/test_registry.py keeps it in sync.
+__all__ = [
+    "Alert",
+    "Autocomplete",
+    "AutocompleteItem",
+    "Avatar",
+    "AvatarGroup",
+    "AvatarGroupState",
+    "BackgroundTasks",
+    "Badge",
+    "Button",
+    "ButtonGroup",
+    "Calendar",
+    "CalendarDate",
+    "Card",
+    "CardBody",
+    "CardFooter",
+    "CardHeader",
+    "Checkbox",
+    "CheckboxGroup",
+    "Chip",
+    "Code",
+    "DefaultDatesType",
+    "Form",
+    "HEROUI_PLUGIN",
+    "HIGHLIGHT_THEMES",
+    "HeroUIProviderProps",
+    "HighlightedCode",
+    "Highlighter",
+    "Href",
+    "Image",
+    "ImageInfo",
+    "ImagePipeline",
+    "Input",
+    "Lazy",
+    "LazyMotion",
+    "Listbox",
+    "ListboxItem",
+    "LoadingBoundary",
+    "MouseInfo",
+    "OptionsState",
+    "PACKAGE_VERSIONS",
+    "PrefixIndex",
+    "PressInfo",
+    "Provider",
+    "Radio",
+    "RadioGroup",
+    "RenderCache",
+    "ResponsiveImage",
+    "RouterOptions",
+    "SHADES",
+    "Select",
+    "SelectItem",
+    "Snippet",
+    "Spacer",
+    "Spinner",
+    "Static",
+    "SupportedCalendars",
+    "SupportedLocales",
+    "Switch",
+    "Table",
+    "TableBody",
+    "TableCell",
+    "TableColumn",
+    "TableHeader",
+    "TableRow",
+    "TableState",
+    "Textarea",
+    "Theme",
+    "alert",
+    "autocomplete",
+    "autocomplete_item",
+    "avatar",
+    "avatar_group",
+    "background_event",
+    "badge",
+    "button",
+    "button_group",
+    "button_list",
+    "card",
+    "card_body",
+    "card_footer",
+    "card_header",
+    "checkbox",
+    "checkbox_group",
+    "chip",
+    "chip_list",
+    "code",
+    "foreground",
+    "form",
+    "highlight",
+    "highlighted_code",
+    "highlighter",
+    "image",
+    "image_event",
+    "inline_critical_css",
+    "input",
+    "lazy",
+    "lazy_motion",
+    "listbox",
+    "listbox_item",
+    "loading_boundary",
+    "mouse_event",
+    "palette",
+    "press_event",
+    "provider",
+    "radio",
+    "radio_group",
+    "render_cache",
+    "select",
+    "select_item",
+    "snippet",
+    "spacer",
+    "spinner",
+    "static",
+    "switch",
+    "table",
+    "table_body",
+    "table_cell",
+    "table_column",
+    "table_header",
+    "table_row",
+    "tailwind_config",
+    "textarea",
+    "theme",
+    "theme_components",
+    "theme_css",
+    "used_packages",
+    "versioned",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module providing ``name`` on first access and cache the result.
+
+    Args:
+        name: The attribute being looked up on the package.
+
+    Returns:
+        The component class, factory or type exported under ``name``.
+
+    Raises:
+        AttributeError: If ``name`` is not part of the public API.
+    """
+    module_name = _ATTR_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public API without importing any component module.
+
+    Returns:
+        The sorted public names of the package.
+    """
+    return __all__
+
+
+if TYPE_CHECKING:
+    from src.alert import *
+    from src.avatar import *
+    from src.button import *
+    from src.card import *
+    from src.checkbox import *
+    from src.input import *
+    from src.radio import *
+    from src.textarea import *
+    from src.form import *
+    from src.image import *
+    from src.spacer import *
+    from src.spinner import *
+    from src.switch import *
+    from src.chip import *
+    from src.code import *
+    from src.badge import *
+    from src.snippet import *
+    from src.lazy import *
+    from src.loading import *
+    from src.events import *
+    from src.cache import *
+    from src.static import *
+    from src.npm import *
+    from src.tailwind import *
+    from src.theme import *
+    from src.autocomplete import *
+    from src.listbox import *
+    from src.select import *
+    from src.table import *
+    from src.provider import *
+    from src.provider.types import *
@@ -1,10 +1,11 @@
 import reflex as rx
 from typing import Any, Literal, Optional
+from ..cache.cache import CachedRender
+from ..npm.npm import lib_deps, versioned
+from ..props.props import LiteralProps
 
 
-lib_deps: list = ["@heroui/theme", "@heroui/system", "framer-motion"]
-
-class Alert(rx.Component):
+class Alert(LiteralProps, CachedRender, rx.Component):
     """A component that displays important messages to the user.
 
     Attributes:
@@ -28,7 +29,7 @@ class Alert(rx.Component):
         on_visible_change: Callback when visibility changes.
     """
 
-    library = "@heroui/alert"
+    library = versioned("@heroui/alert")
     lib_dependencies: list = lib_deps
     tag = "Alert"
 
@@ -0,0 +1,5 @@
+from .autocomplete import Autocomplete, AutocompleteItem
+from .index import PrefixIndex
+
+autocomplete = Autocomplete.create
+autocomplete_item = AutocompleteItem.create
@@ -0,0 +1,164 @@
+import reflex as rx
+from typing import Any, Literal, Optional
+from reflex.constants.compiler import MemoizationMode
+from ..listbox.listbox import render_items
+from ..npm.npm import lib_deps, versioned
+from ..props.props import LiteralProps
+
+
+class Autocomplete(LiteralProps, rx.Component):
+    """A text input that suggests matching options while the user types.
+
+    Attributes:
+        library: The library the component belongs to.
+        lib_dependencies: Dependencies required by the component.
+        tag: The tag name for the component.
+        variant: The visual style variant of the input.
+        color: The color scheme of the input.
+        size: The size of the input.
+        radius: The border radius of the input.
+        label: The label text of the autocomplete.
+        placeholder: The placeholder text of the input.
+        description: The description text of the autocomplete.
+        error_message: The error message text of the autocomplete.
+        name: The name attribute of the input element.
+        input_value: The text in the input (controlled).
+        default_input_value: The initial text in the input.
+        selected_key: The key of the selected option (controlled).
+        default_selected_key: The key of the initially selected option.
+        disabled_keys: The keys of the disabled options.
+        allows_custom_value: Whether the input may hold text that matches no option.
+        allows_empty_collection: Whether the listbox opens when there are no options.
+        menu_trigger: What opens the listbox (focus, input, manual).
+        label_placement: The placement of the label relative to the input.
+        is_loading: Whether to show a loading spinner in the listbox.
+        is_disabled: Whether the autocomplete is disabled.
+        is_required: Whether the autocomplete is required.
+        is_invalid: Whether the autocomplete is in an invalid state.
+        is_read_only: Whether the autocomplete is read-only.
+        is_clearable: Whether to show a button that clears the input.
+        is_virtualized: Whether to only mount the options in view.
+        max_listbox_height: The height of the listbox when virtualized, in pixels.
+        item_height: The height of a single option when virtualized, in pixels.
+        full_width: Whether the autocomplete should take the full width of its container.
+        disable_animation: Whether to disable animations.
+        on_input_change: Event handler called with the text in the input, debounced
+            in the browser unless ``input_value`` is set (see ``debounce_ms`` of
+            ``create``).
+        on_selection_change: Event handler called with the key of the selected option.
+        on_open_change: Event handler called when the listbox opens or closes.
+        on_clear: Event handler called when the input is cleared.
+    """
+
+    library = versioned("@heroui/autocomplete")
+    lib_dependencies: list = lib_deps
+    tag = "Autocomplete"
+
+    # Collection children (the items) must stay direct children.
+    _memoization_mode = MemoizationMode(recursive=False)
+
+    # Props
+    variant: rx.Var[Literal["flat", "bordered", "faded", "underlined"]] = "flat"
+    color: rx.Var[
+        Literal["default", "primary", "secondary", "success", "warning", "danger"]
+    ] = "default"
+    size: rx.Var[Literal["sm", "md", "lg"]] = "md"
+    radius: rx.Var[Literal["none", "sm", "md", "lg", "full"]]
+    label: rx.Var[Optional[Any]]
+    placeholder: rx.Var[Optional[str]]
+    description: rx.Var[Optional[Any]]
+    error_message: rx.Var[Optional[Any]]
+    name: rx.Var[Optional[str]]
+    input_value: rx.Var[Optional[str]]
+    default_input_value: rx.Var[Optional[str]]
+    selected_key: rx.Var[Optional[str]]
+    default_selected_key: rx.Var[Optional[str]]
+    disabled_keys: rx.Var[Optional[list[str]]]
+    allows_custom_value: rx.Var[bool] = False
+    allows_empty_collection: rx.Var[bool] = True
+    menu_trigger: rx.Var[Literal["focus", "input", "manual"]] = "focus"
+    label_placement: rx.Var[Literal["inside", "outside", "outside-left"]] = "inside"
+    is_loading: rx.Var[bool] = False
+    is_disabled: rx.Var[bool] = False
+    is_required: rx.Var[bool] = False
+    is_invalid: rx.Var[bool] = False
+    is_read_only: rx.Var[bool] = False
+    is_clearable: rx.Var[bool] = True
+    is_virtualized: rx.Var[bool] = False
+    max_listbox_height: rx.Var[Optional[int]]
+    item_height: rx.Var[Optional[int]]
+    full_width: rx.Var[bool] = True
+    disable_animation: rx.Var[bool] = False
+
+    # Events
+    on_input_change: rx.EventHandler[lambda value: [value]]
+    on_selection_change: rx.EventHandler[lambda key: [key]]
+    on_open_change: rx.EventHandler[lambda is_open: [is_open]]
+    on_clear: rx.EventHandler[lambda: []]
+
+    @classmethod
+    def create(
+        cls,
+        *children,
+        items: Optional[rx.Var[list[dict[str, Any]]]] = None,
+        key_field: str = "key",
+        label_field: str = "label",
+        debounce_ms: Optional[int] = 150,
+        **props,
+    ) -> rx.Component:
+        """Create an Autocomplete, optionally rendering its options from a state list.
+
+        Args:
+            *children: The options of the autocomplete.
+            items: A state var holding the options, rendered with ``rx.foreach``.
+            key_field: The field holding the unique key of an option.
+            label_field: The field holding the text shown for an option.
+            debounce_ms: Only send ``on_input_change`` once typing pauses for this
+                many milliseconds; ``None`` sends every keystroke. A controlled
+                input (``input_value``) is never debounced: until the event is
+                sent, the state's value would reset the text being typed.
+            **props: The props of the component.
+
+        Returns:
+            The Autocomplete component.
+        """
+        if items is not None:
+            children = (
+                *children,
+                render_items(AutocompleteItem, items, key_field, label_field),
+            )
+        handler = props.get("on_input_change")
+        controlled = props.get("input_value") is not None
+        if handler is not None and debounce_ms is not None and not controlled:
+            chain = rx.EventChain.create(
+                handler, args_spec=lambda value: [value], key="on_input_change"
+            )
+            if isinstance(chain, rx.EventChain):
+                props["on_input_change"] = chain.debounce(debounce_ms)
+        return super().create(*children, **props)
+
+
+class AutocompleteItem(LiteralProps, rx.Component):
+    """A single option of an Autocomplete.
+
+    Attributes:
+        library: The library the component belongs to.
+        lib_dependencies: Dependencies required by the component.
+        tag: The tag name for the component.
+        text_value: The plain text of the option, put in the input when selected.
+        description: The description text of the option.
+        start_content: Content to display at the start of the option.
+        end_content: Content to display at the end of the option.
+        is_disabled: Whether the option is disabled.
+    """
+
+    library = versioned("@heroui/autocomplete")
+    lib_dependencies: list = lib_deps
+    tag = "AutocompleteItem"
+
+    # Props
+    text_value: rx.Var[Optional[str]]
+    description: rx.Var[Optional[Any]]
+    start_content: rx.Var[Optional[Any]]
+    end_content: rx.Var[Optional[Any]]
+    is_disabled: rx.Var[bool] = False
@@ -0,0 +1,122 @@
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Iterable
+
+
+# Sorts after every other character, closing the range of a prefix search.
+_MAX_CHAR = "\U0010ffff"
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class PrefixIndex:
+    """An in-memory type-ahead index over a corpus of strings.
+
+    Prefix queries use binary search over the case-folded, sorted corpus, so they
+    cost ``O(log n + k)`` regardless of corpus size. With ``substring=True`` a
+    trigram index also finds matches in the middle of a string. Results of recent
+    queries are kept in a thread-safe LRU cache shared by every session using the
+    index, so create one index per corpus at module level.
+
+    Example:
+        skus = hero.PrefixIndex(load_sku_names(), substring=True)
+
+        class SkuState(rx.State):
+            suggestions: list[dict[str, str]] = []
+
+            def search(self, query: str):
+                self.suggestions = [{"key": s, "label": s} for s in skus.search(query)]
+    """
+
+    def __init__(
+        self,
+        corpus: Iterable[str],
+        substring: bool = False,
+        cache_size: int = 1024,
+    ):
+        """Build the index.
+
+        Args:
+            corpus: The strings to search; duplicates are dropped.
+            substring: Whether to also build a trigram index for infix matches.
+            cache_size: How many query results to keep in the LRU cache.
+        """
+        # Strings equal but for case are ordered by their own value, not by hash.
+        self._values: list[str] = sorted(
+            set(corpus), key=lambda value: (value.casefold(), value)
+        )
+        self._keys: list[str] = [value.casefold() for value in self._values]
+        self._postings: dict[str, array] = {}
+        if substring:
+            for i, key in enumerate(self._keys):
+                for trigram in _trigrams(key):
+                    posting = self._postings.get(trigram)
+                    if posting is None:
+                        posting = self._postings[trigram] = array("I")
+                    posting.append(i)
+        self._cache: OrderedDict[tuple[str, int], list[str]] = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _prefix(self, query: str, k: int) -> list[int]:
+        lo = bisect_left(self._keys, query)
+        hi = bisect_left(self._keys, query + _MAX_CHAR, lo)
+        return list(range(lo, min(hi, lo + k)))
+
+    def _substring(self, query: str, k: int, exclude: set[int]) -> list[int]:
+        postings = []
+        for trigram in _trigrams(query):
+            posting = self._postings.get(trigram)
+            if posting is None:
+                return []
+            postings.append(posting)
+        matches = []
+        # Verify candidates of the rarest trigram; they come out in sorted order.
+        for i in min(postings, key=len):
+            if i not in exclude and query in self._keys[i]:
+                matches.append(i)
+                if len(matches) == k:
+                    break
+        return matches
+
+    def search(self, query: str, k: int = 10) -> list[str]:
+        """Find up to ``k`` strings matching ``query``, case-insensitively.
+
+        Prefix matches come first, in sorted order, followed by infix matches when
+        the index was built with ``substring=True``.
+
+        Args:
+            query: The text typed so far.
+            k: The maximum number of results.
+
+        Returns:
+            The matching strings.
+        """
+        query = query.casefold()
+        cache_key = (query, k)
+        with self._lock:
+            if cache_key in self._cache:
+                self._cache.move_to_end(cache_key)
+                self.hits += 1
+                return list(self._cache[cache_key])
+            self.misses += 1
+
+        ids = self._prefix(query, k)
+        if self._postings and len(query) >= 3 and len(ids) < k:
+            ids += self._substring(query, k - len(ids), set(ids))
+        results = [self._values[i] for i in ids]
+
+        with self._lock:
+            self._cache[cache_key] = results
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return list(results)
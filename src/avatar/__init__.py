@@ -1,4 +1,5 @@
 from .avatar import Avatar, AvatarGroup
+from .state import AvatarGroupState
 
 avatar = Avatar.create
 avatar_group = AvatarGroup.create
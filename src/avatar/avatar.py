@@ -1,11 +1,14 @@
 import reflex as rx
+from reflex.constants.compiler import MemoizationMode
+from reflex.vars.function import ArgsFunctionOperation
 from typing import Any, Dict, Literal, Optional, Union
+from ..cache.cache import CachedRender
+from ..collection.collection import appended_windows
+from ..npm.npm import lib_deps, versioned
+from ..props.props import LiteralProps
 
 
-lib_deps: list = ["@heroui/theme", "@heroui/system", "framer-motion"]
-
-
-class Avatar(rx.Component):
+class Avatar(LiteralProps, CachedRender, rx.Component):
     """A component that displays a user's profile picture, initials, or fallback icon.
 
     Attributes:
@@ -26,7 +29,7 @@ class Avatar(rx.Component):
         disable_animation: Whether to disable animations.
     """
 
-    library = "@heroui/avatar"
+    library = versioned("@heroui/avatar")
     lib_dependencies: list = lib_deps
     tag = "Avatar"
 
@@ -51,7 +54,7 @@ class Avatar(rx.Component):
     disable_animation: rx.Var[bool] = False
 
 
-class AvatarGroup(rx.Component):
+class AvatarGroup(LiteralProps, CachedRender, rx.Component):
     """A component that displays a group of avatars.
 
     Attributes:
@@ -59,28 +62,110 @@ class AvatarGroup(rx.Component):
         lib_dependencies: Dependencies required by the component.
         tag: The tag name for the component.
         max: Maximum number of avatars to display before showing the count.
+        total: The number of hidden avatars shown in the count, overriding the
+            number of children past ``max``.
         is_grid: Whether to display avatars in a grid layout.
         is_bordered: Whether all avatars in the group have borders.
         is_disabled: Whether all avatars in the group are disabled.
         disable_animation: Whether to disable animations.
+        render_count: A function of the hidden count returning the "+N" element.
         size: The size of all avatars in the group.
         radius: The border radius of all avatars in the group.
         color: The color scheme of all avatars in the group.
     """
 
-    library = "@heroui/avatar"
+    library = versioned("@heroui/avatar")
     lib_dependencies: list = lib_deps
     tag = "AvatarGroup"
 
     # Props
     max: rx.Var[Optional[int]] = 5
+    total: rx.Var[Optional[int]]
     is_grid: rx.Var[bool] = False
     is_bordered: rx.Var[bool] = False
     is_disabled: rx.Var[bool] = False
     disable_animation: rx.Var[bool] = False
-    render_count: rx.Var[Optional[int]]  # Kind of suspicious, take a look at this
+    render_count: rx.Var[Any]
     size: rx.Var[Literal["sm", "md", "lg"]] = "md"
     radius: rx.Var[Literal["none", "sm", "md", "lg", "full"]] = "full"
     color: rx.Var[
         Literal["default", "primary", "secondary", "success", "warning", "danger"]
     ] = "default"
+
+    # The avatars of a data-driven group are a foreach, keep them in the group.
+    _memoization_mode = MemoizationMode(recursive=False)
+
+    @classmethod
+    def create(
+        cls,
+        *children,
+        items: Optional[rx.Var[list[dict[str, Any]]]] = None,
+        on_overflow: Optional[Any] = None,
+        window_offset: Optional[rx.Var[int]] = None,
+        key_field: str = "key",
+        src_field: str = "src",
+        name_field: str = "name",
+        **props,
+    ) -> rx.Component:
+        """Create an avatar group, optionally rendering its avatars from a state list.
+
+        In data-driven mode only the members in ``items`` are mounted, and the
+        "+N" count is computed from ``total`` (the size of the whole group) so
+        the server never has to send the hidden members. Unless ``max`` is given,
+        it follows the length of ``items``; pair it with ``hero.AvatarGroupState``,
+        whose ``max_visible`` decides how many members are sent.
+
+        Args:
+            *children: The avatars of the group.
+            items: A state var holding the members to show, one dict per member.
+            on_overflow: Event handler called when the count is clicked, to load
+                more members into ``items``.
+            window_offset: A state var holding the offset of ``items`` when it only
+                holds the latest window of the members; see ``appended_windows``.
+            key_field: The field holding the unique key of a member.
+            src_field: The field holding the image URL of a member.
+            name_field: The field holding the name of a member.
+            **props: The props of the component.
+
+        Returns:
+            The avatar group component.
+        """
+        if items is not None:
+            items = rx.Var.create(items)
+            if window_offset is not None:
+                items = appended_windows(items, window_offset).guess_type()
+            children = (
+                *children,
+                rx.foreach(
+                    items,
+                    lambda item: Avatar.create(
+                        src=item[src_field],
+                        name=item[name_field],
+                        key=item[key_field],
+                    ),
+                ),
+            )
+            if props.get("max") is None:
+                # Everything sent is shown.
+                props["max"] = items.length()
+                shown = items.length()
+            else:
+                max_shown = rx.Var.create(props["max"])
+                shown = rx.cond(items.length() < max_shown, items.length(), max_shown)
+            if props.get("total") is not None:
+                # The count covers the members not shown, sent or not.
+                props["total"] = rx.Var.create(props["total"]) - shown
+
+        if on_overflow is not None and "render_count" not in props:
+            props["render_count"] = ArgsFunctionOperation.create(
+                ("count",),
+                rx.Var.create(
+                    Avatar.create(
+                        name=rx.Var(_js_expr="`+${count}`", _var_type=str),
+                        on_click=on_overflow,
+                        class_name="hover:-translate-x-0 cursor-pointer",
+                    )
+                ),
+            )
+
+        return super().create(*children, **props)
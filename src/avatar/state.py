@@ -0,0 +1,90 @@
+import reflex as rx
+from typing import Any, ClassVar
+
+
+class AvatarGroupState(rx.State, mixin=True):
+    """Serves the members of a large avatar group, sending only the visible ones.
+
+    Only the latest window of ``members`` (the first ``max_visible`` members,
+    then each overflow window) and the ``total`` count are part of the state sent
+    to the browser, which appends each window to the members it already has; the
+    full list stays on the server. Either call ``_set_all_members`` or override
+    ``_fetch_members`` and ``_count_members`` to read from a database.
+
+    Example:
+        class TeamState(hero.AvatarGroupState, rx.State):
+            def _fetch_members(self, offset, limit):
+                return db.members(offset=offset, limit=limit)
+
+            def _count_members(self):
+                return db.count_members()
+
+        hero.avatar_group(items=TeamState.members,
+                          window_offset=TeamState.members_offset,
+                          total=TeamState.total, on_overflow=TeamState.load_overflow)
+
+    Attributes:
+        members: The latest window of members, one dict per member.
+        members_offset: The index of the first member of the window.
+        total: The number of members in the whole group.
+        max_visible: How many members are sent before the overflow is requested.
+        page_size: How many overflow members are loaded per request.
+    """
+
+    members: list[dict[str, Any]] = []
+    members_offset: int = 0
+    total: int = 0
+
+    _all_members: list[dict[str, Any]] = []
+    _loaded: int = 0
+
+    max_visible: ClassVar[int] = 5
+    page_size: ClassVar[int] = 50
+
+    def _fetch_members(self, offset: int, limit: int) -> list[dict[str, Any]]:
+        """Fetch a window of members; override to load them from elsewhere.
+
+        Args:
+            offset: The index of the first member to return.
+            limit: The maximum number of members to return.
+
+        Returns:
+            The members of the window.
+        """
+        return self._all_members[offset : offset + limit]
+
+    def _count_members(self) -> int:
+        """Count the members of the group; override alongside ``_fetch_members``.
+
+        Returns:
+            The number of members in the whole group.
+        """
+        return len(self._all_members)
+
+    def _set_all_members(self, members: list[dict[str, Any]]):
+        """Keep the full member list on the server and send the visible members.
+
+        Args:
+            members: All members, one dict per member.
+        """
+        self._all_members = list(members)
+        self.refresh_members()
+
+    @rx.event
+    def refresh_members(self):
+        """Reset the group to its first ``max_visible`` members."""
+        self.total = self._count_members()
+        self.members = self._fetch_members(0, self.max_visible)
+        self.members_offset = 0
+        self._loaded = len(self.members)
+
+    @rx.event
+    def load_overflow(self):
+        """Append the next window of overflow members, if any are left."""
+        left = self.total - self._loaded
+        if left <= 0:
+            return
+        window = self._fetch_members(self._loaded, min(self.page_size, left))[:left]
+        self.members = window
+        self.members_offset = self._loaded
+        self._loaded += len(window)
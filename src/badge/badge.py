@@ -1,11 +1,12 @@
 import reflex as rx
 from typing import Any, Literal, Optional, Union
+from ..cache.cache import CachedRender
+from ..npm.npm import lib_deps, versioned
+from ..props.props import LiteralProps
 
-lib_deps: list = ["@heroui/theme", "@heroui/system", "framer-motion"]
 
-
-class Badge(rx.Component):
-    library = "@heroui/badge"
+class Badge(LiteralProps, CachedRender, rx.Component):
+    library = versioned("@heroui/badge")
     lib_dependencies: list = lib_deps
     tag = "Badge"
     content: rx.Var[Union[str, int, Any]]
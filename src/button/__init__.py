@@ -1,3 +1,3 @@
-from .button import Button, ButtonGroup
+from .button import Button, ButtonGroup, button_list
 button = Button.create
-button_group = ButtonGroup.create
\ No newline at end of file
+button_group = ButtonGroup.create
@@ -1,11 +1,14 @@
 import reflex as rx
 from typing import Any, Literal, Optional, Union
+from reflex.event import key_event
+from ..cache.cache import CachedRender
+from ..collection.collection import render_collection
+from ..events.events import mouse_event, press_event
+from ..npm.npm import lib_deps, versioned
+from ..props.props import LiteralProps
 
 
-lib_deps: list = ["@heroui/theme", "@heroui/system", "framer-motion"]
-
-
-class Button(rx.Component):
+class Button(LiteralProps, CachedRender, rx.Component):
     """A clickable button component that triggers an action or event.
 
     Attributes:
@@ -17,6 +20,7 @@ class Button(rx.Component):
         color: The color scheme of the button.
         size: The size of the button.
         radius: The border radius of the button.
+        type: The native type of the button; ``"submit"`` submits its form.
         start_content: Content to display at the start of the button.
         end_content: Content to display at the end of the button.
         spinner: Custom spinner component to show when loading.
@@ -29,7 +33,7 @@ class Button(rx.Component):
         disable_animation: Whether to disable animations.
     """
 
-    library = "@heroui/button"
+    library = versioned("@heroui/button")
     lib_dependencies: list = lib_deps
     tag = "Button"
 
@@ -43,6 +47,7 @@ class Button(rx.Component):
     ] = "default"
     size: rx.Var[Literal["sm", "md", "lg"]] = "md"
     radius: rx.Var[Literal["none", "sm", "md", "lg", "full"]]
+    type: rx.Var[Literal["button", "submit", "reset"]]
     start_content: rx.Var[Optional[Any]]
     end_content: rx.Var[Optional[Any]]
     spinner: rx.Var[Optional[Any]]
@@ -55,17 +60,17 @@ class Button(rx.Component):
     disable_animation: rx.Var[bool] = False
 
     # Events
-    on_press: rx.EventHandler[lambda e: [e]]
-    on_press_start: rx.EventHandler[lambda e: [e]]
-    on_press_end: rx.EventHandler[lambda e: [e]]
+    on_press: rx.EventHandler[press_event]
+    on_press_start: rx.EventHandler[press_event]
+    on_press_end: rx.EventHandler[press_event]
     on_press_change: rx.EventHandler[lambda is_pressed: [is_pressed]]
-    on_press_up: rx.EventHandler[lambda e: [e]]
-    on_key_down: rx.EventHandler[lambda e: [e]]
-    on_key_up: rx.EventHandler[lambda e: [e]]
-    on_click: rx.EventHandler[lambda e: [e]]
+    on_press_up: rx.EventHandler[press_event]
+    on_key_down: rx.EventHandler[key_event]
+    on_key_up: rx.EventHandler[key_event]
+    on_click: rx.EventHandler[mouse_event]
 
 
-class ButtonGroup(rx.Component):
+class ButtonGroup(LiteralProps, CachedRender, rx.Component):
     """A group of buttons with consistent styling.
 
     Attributes:
@@ -81,7 +86,7 @@ class ButtonGroup(rx.Component):
         is_disabled: Whether all buttons in the group are disabled.
     """
 
-    library = "@heroui/button"
+    library = versioned("@heroui/button")
     lib_dependencies: list = lib_deps
     tag = "ButtonGroup"
 
@@ -97,3 +102,27 @@ class ButtonGroup(rx.Component):
     radius: rx.Var[Literal["none", "sm", "md", "lg", "full"]] = "xl"
     full_width: rx.Var[bool] = False
     is_disabled: rx.Var[bool] = False
+
+
+def button_list(
+    items: rx.Var[list[Any]],
+    on_press: Optional[rx.EventHandler] = None,
+    key_field: str = "key",
+    label_field: str = "label",
+    **props,
+) -> rx.Component:
+    """Render a state list of actions as buttons with a single ``.map()``.
+
+    Args:
+        items: A state var holding the actions, as strings or dicts.
+        on_press: Event handler called with the key of the pressed button.
+        key_field: The field holding the unique key of a dict action.
+        label_field: The field holding the text shown for a dict action.
+        **props: Props shared by every button.
+
+    Returns:
+        The foreach component rendering the buttons.
+    """
+    return render_collection(
+        Button, items, key_field, label_field, {"on_press": on_press}, **props
+    )
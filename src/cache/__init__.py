@@ -0,0 +1 @@
+from .cache import CachedRender, RenderCache, render_cache, static_key
@@ -0,0 +1,216 @@
+import copy
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from reflex.components.base.bare import Bare
+from reflex.constants.base import REFLEX_VAR_OPENING_TAG
+from reflex.utils.imports import ParsedImportDict
+from reflex.vars.base import LiteralVar, Var
+
+
+def _var_key(value: Any) -> Optional[str]:
+    """Get the JS expression of a static value, or None if it depends on anything.
+
+    Args:
+        value: A prop value, usually a Var.
+
+    Returns:
+        The JS expression, or None if the value carries state, hooks or imports.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, (bool, int, float)) or (
+        isinstance(value, str) and REFLEX_VAR_OPENING_TAG not in value
+    ):
+        return repr(value)
+    var = value if isinstance(value, Var) else LiteralVar.create(value)
+    if var._get_all_var_data() is not None:
+        return None
+    return var._js_expr
+
+
+def static_key(component: Any) -> Optional[Hashable]:
+    """Compute the cache key of a component whose output depends only on its props.
+
+    The key covers the component class, every prop, the common component fields
+    and, recursively, the children. Components bound to state vars, hooks or event
+    handlers, and children that are not themselves cacheable, yield no key.
+
+    Args:
+        component: The component instance.
+
+    Returns:
+        The key, or None if the component must be rendered normally.
+    """
+    if isinstance(component, Bare):
+        contents = _var_key(component.contents)
+        return None if contents is None else ("", contents)
+    if not isinstance(component, CachedRender):
+        return None
+    if component.event_triggers or component.special_props:
+        return None
+
+    parts: list[Hashable] = [
+        type(component),
+        component.tag,
+        component.alias,
+        component.library,
+    ]
+    for name in component.get_props():
+        value = _var_key(getattr(component, name))
+        if value is None:
+            return None
+        parts.append(value)
+    for value in (
+        component.style or None,
+        component.class_name,
+        component.id,
+        component.key,
+        component.autofocus,
+    ):
+        value = _var_key(value)
+        if value is None:
+            return None
+        parts.append(value)
+    for name, value in component.custom_attrs.items():
+        value = _var_key(value)
+        if value is None:
+            return None
+        parts.append((name, value))
+    for child in component.children:
+        child_key = static_key(child)
+        if child_key is None:
+            return None
+        parts.append(child_key)
+    return tuple(parts)
+
+
+class RenderCache:
+    """A bounded, thread-safe LRU cache of rendered component output.
+
+    Reflex renders every component instance from scratch, so the same
+    ``hero.button("Save", color="primary")`` used on hundreds of pages is
+    formatted hundreds of times. Components using ``CachedRender`` look up their
+    rendered template dict and imports here, keyed by ``static_key``; anything
+    bound to state or events bypasses the cache.
+
+    Set ``HEROUI_RENDER_CACHE=0`` in the environment to disable it.
+
+    Attributes:
+        maxsize: The maximum number of entries kept.
+        enabled: Whether components use the cache.
+        hits: The number of lookups answered from the cache.
+        misses: The number of lookups that had to render.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        """Create an empty cache.
+
+        Args:
+            maxsize: The maximum number of entries kept.
+        """
+        self.maxsize = maxsize
+        self.enabled = os.environ.get("HEROUI_RENDER_CACHE", "1") != "0"
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[dict, ParsedImportDict]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of entries.
+
+        Returns:
+            The number of cached entries.
+        """
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[tuple[dict, ParsedImportDict]]:
+        """Look up an entry, marking it as recently used.
+
+        Args:
+            key: The key returned by ``static_key``.
+
+        Returns:
+            The rendered dict and imports, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Hashable, entry: tuple[dict, ParsedImportDict]):
+        """Store an entry, evicting the least recently used one when full.
+
+        Args:
+            key: The key returned by ``static_key``.
+            entry: The rendered dict and imports of the component.
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+render_cache = RenderCache()
+"""The cache shared by every HeroUI component."""
+
+
+class CachedRender:
+    """Mixin reusing the rendered output of state-free component instances.
+
+    List it before ``rx.Component`` in the bases of a component class.
+    """
+
+    def _cached_output(self) -> Optional[tuple[dict, ParsedImportDict]]:
+        if not render_cache.enabled:
+            return None
+        key = static_key(self)
+        if key is None:
+            return None
+        entry = render_cache.get(key)
+        if entry is None:
+            entry = (super().render(), super()._get_all_imports())  # pyright: ignore [reportAttributeAccessIssue]
+            render_cache.put(key, entry)
+        return entry
+
+    def render(self) -> dict:
+        """Render the component, reusing the output of an identical instance.
+
+        Returns:
+            The dictionary for template of component.
+        """
+        entry = self._cached_output()
+        if entry is None:
+            return super().render()  # pyright: ignore [reportAttributeAccessIssue]
+        # Callers may edit the nested dicts and lists, e.g. to add props.
+        return copy.deepcopy(entry[0])
+
+    def _get_all_imports(self, collapse: bool = False) -> ParsedImportDict:
+        """Get the imports of the component and its children, from the cache if possible.
+
+        Args:
+            collapse: Whether to collapse the imports by removing duplicates.
+
+        Returns:
+            The import dict with the required imports.
+        """
+        entry = None if collapse else self._cached_output()
+        if entry is None:
+            return super()._get_all_imports(collapse=collapse)  # pyright: ignore [reportAttributeAccessIssue]
+        return {lib: list(fields) for lib, fields in entry[1].items()}
@@ -1,11 +1,12 @@
 import reflex as rx
 from typing import Any, Literal, Optional
+from ..cache.cache import CachedRender
+from ..events.events import press_event
+from ..npm.npm import lib_deps, versioned
+from ..props.props import LiteralProps
 
 
-lib_deps: list = ["@heroui/theme", "@heroui/system", "framer-motion"]
-
-
-class Card(rx.Component):
+class Card(LiteralProps, CachedRender, rx.Component):
     """A surface component that contains and groups related content.
 
     Attributes:
@@ -30,7 +31,7 @@ class Card(rx.Component):
         on_press_up: Event handler called when a press is released.
     """
 
-    library = "@heroui/card"
+    library = versioned("@heroui/card")
     lib_dependencies: list = lib_deps
     tag = "Card"
 
@@ -50,15 +51,15 @@ class Card(rx.Component):
     
 
     # Events
-    on_press: rx.EventHandler[lambda e: [e]]
-    on_press_start: rx.EventHandler[lambda e: [e]]
-    on_press_end: rx.EventHandler[lambda e: [e]]
-    on_press_change: rx.EventHandler[lambda e: [e]]
-    on_press_up: rx.EventHandler[lambda e: [e]]
+    on_press: rx.EventHandler[press_event]
+    on_press_start: rx.EventHandler[press_event]
+    on_press_end: rx.EventHandler[press_event]
+    on_press_change: rx.EventHandler[lambda is_pressed: [is_pressed]]
+    on_press_up: rx.EventHandler[press_event]
 
 
 
-class CardHeader(rx.Component):
+class CardHeader(LiteralProps, CachedRender, rx.Component):
     """The header section of a card.
 
     Attributes:
@@ -67,12 +68,12 @@ class CardHeader(rx.Component):
         tag: The tag name for the component.
     """
 
-    library = "@heroui/card"
+    library = versioned("@heroui/card")
     lib_dependencies: list = lib_deps
     tag = "CardHeader"
 
 
-class CardBody(rx.Component):
+class CardBody(LiteralProps, CachedRender, rx.Component):
     """The body section of a card.
 
     Attributes:
@@ -81,12 +82,12 @@ class CardBody(rx.Component):
         tag: The tag name for the component.
     """
 
-    library = "@heroui/card"
+    library = versioned("@heroui/card")
     lib_dependencies: list = lib_deps
     tag = "CardBody"
 
 
-class CardFooter(rx.Component):
+class CardFooter(LiteralProps, CachedRender, rx.Component):
     """The footer section of a card.
 
     Attributes:
@@ -95,6 +96,6 @@ class CardFooter(rx.Component):
         tag: The tag name for the component.
     """
 
-    library = "@heroui/card"
+    library = versioned("@heroui/card")
     lib_dependencies: list = lib_deps
     tag = "CardFooter"
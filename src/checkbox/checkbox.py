@@ -1,11 +1,12 @@
 import reflex as rx
 from typing import Any, Literal, Optional
+from reflex.event import checked_input_event
+from ..cache.cache import CachedRender
+from ..npm.npm import lib_deps, versioned
+from ..props.props import LiteralProps
 
 
-lib_deps: list = ["@heroui/theme", "@heroui/system", "framer-motion"]
-
-
-class Checkbox(rx.Component):
+class Checkbox(LiteralProps, CachedRender, rx.Component):
     """A component that allows users to select multiple options from a set.
 
     Attributes:
@@ -29,7 +30,7 @@ class Checkbox(rx.Component):
         default_selected: Whether the checkbox is selected by default.
     """
 
-    library = "@heroui/checkbox"
+    library = versioned("@heroui/checkbox")
     lib_dependencies: list = lib_deps
     tag = "Checkbox"
 
@@ -56,10 +57,10 @@ class Checkbox(rx.Component):
 
     # Events
     on_value_change: rx.EventHandler[lambda is_selected: [is_selected]]
-    on_change: rx.EventHandler[lambda e: [e]]
+    on_change: rx.EventHandler[checked_input_event]
 
 
-class CheckboxGroup(rx.Component):
+class CheckboxGroup(LiteralProps, CachedRender, rx.Component):
     """A group of checkboxes.
 
     Attributes:
@@ -80,7 +81,7 @@ class CheckboxGroup(rx.Component):
         is_required: Whether the checkbox group is required.
     """
 
-    library = "@heroui/checkbox"
+    library = versioned("@heroui/checkbox")
     lib_dependencies: list = lib_deps
     tag = "CheckboxGroup"
     # Props
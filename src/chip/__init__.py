@@ -1,3 +1,3 @@
-from .chip import Chip
+from .chip import Chip, chip_list
 
 chip = Chip.create
@@ -1,10 +1,14 @@
 import reflex as rx
 from typing import Any, Dict, Literal, Optional, Union
+from ..cache.cache import CachedRender
+from ..collection.collection import render_collection
+from ..events.events import press_event
+from ..npm.npm import lib_deps, versioned
+from ..props.props import LiteralProps
 
-lib_deps: list = ["@heroui/theme", "@heroui/system", "framer-motion"]
 
-class Chip(rx.Component):
-    library = "@heroui/chip"
+class Chip(LiteralProps, CachedRender, rx.Component):
+    library = versioned("@heroui/chip")
     lib_dependencies: list = lib_deps
     tag = "Chip"
     variant: rx.Var[Literal["solid","bordered","light", "flat","faded", "shadow", "dot"]] = "solid"
@@ -16,4 +20,28 @@ class Chip(rx.Component):
     start_content: rx.Var[Optional[Any]]
     end_content: rx.Var[Optional[Any]]
     is_disabled: rx.Var[bool] = False
-    on_close: rx.EventHandler[lambda e: [e]]
\ No newline at end of file
+    on_close: rx.EventHandler[press_event]
+
+
+def chip_list(
+    items: rx.Var[list[Any]],
+    on_close: Optional[rx.EventHandler] = None,
+    key_field: str = "key",
+    label_field: str = "label",
+    **props,
+) -> rx.Component:
+    """Render a state list of tags as chips with a single ``.map()``.
+
+    Args:
+        items: A state var holding the tags, as strings or dicts.
+        on_close: Event handler called with the key of the closed chip.
+        key_field: The field holding the unique key of a dict tag.
+        label_field: The field holding the text shown for a dict tag.
+        **props: Props shared by every chip.
+
+    Returns:
+        The foreach component rendering the chips.
+    """
+    return render_collection(
+        Chip, items, key_field, label_field, {"on_close": on_close}, **props
+    )
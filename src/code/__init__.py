@@ -1,3 +1,11 @@
 from .code import Code
+from .highlight import (
+    HIGHLIGHT_THEMES,
+    HighlightedCode,
+    Highlighter,
+    highlight,
+    highlighter,
+)
 
-code = Code.create
\ No newline at end of file
+code = Code.create
+highlighted_code = HighlightedCode.create
@@ -1,11 +1,13 @@
 import reflex as rx
-from typing import Any, Dict, Literal, Optional, Union
+from typing import Any, Literal, Optional
+from ..cache.cache import CachedRender
+from ..npm.npm import lib_deps, versioned
+from ..props.props import LiteralProps
+from .highlight import highlighted_children
 
-lib_deps: list = ["@heroui/theme", "@heroui/system", "framer-motion"]
 
-
-class Code(rx.Component):
-    library = "@heroui/code"
+class Code(LiteralProps, CachedRender, rx.Component):
+    library = versioned("@heroui/code")
     lib_dependencies: list = lib_deps
     tag = "Code"
     size: rx.Var[Literal["sm", "md", "lg"]] = "md"
@@ -14,3 +16,29 @@ class Code(rx.Component):
     is_disabled: rx.Var[bool] = False
     children: rx.Var[Optional[Any]] = None
     code: rx.Var[Optional[str]] = None
+
+    @classmethod
+    def create(
+        cls,
+        *children,
+        language: Optional[str] = None,
+        theme: str = "heroui",
+        chunk_lines: int = 200,
+        **props,
+    ) -> rx.Component:
+        """Create a Code, optionally highlighted on the server.
+
+        Args:
+            *children: The code to display.
+            language: The Pygments name of the language to highlight, e.g.
+                ``"python"``; the code is shown as plain text when left out.
+            theme: The highlight theme, a key of ``HIGHLIGHT_THEMES``.
+            chunk_lines: The number of lines rendered per animation frame.
+            **props: The props of the component.
+
+        Returns:
+            The Code component.
+        """
+        if language is not None:
+            children, _ = highlighted_children(children, language, theme, chunk_lines)
+        return super().create(*children, **props)
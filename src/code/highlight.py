@@ -0,0 +1,358 @@
+import functools
+import hashlib
+import html
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import reflex as rx
+from reflex.utils.imports import ImportVar
+
+
+# Tailwind classes of each token type, by theme. Token types without an entry use
+# the class of their closest parent (``Name.Function`` falls back to ``Name``).
+HIGHLIGHT_THEMES: dict[str, dict[str, str]] = {
+    "heroui": {
+        "Keyword": "text-primary",
+        "Keyword.Constant": "text-warning",
+        "Keyword.Type": "text-secondary",
+        "Name.Builtin": "text-secondary",
+        "Name.Function": "text-secondary",
+        "Name.Class": "text-secondary font-semibold",
+        "Name.Decorator": "text-warning",
+        "Name.Tag": "text-primary",
+        "Name.Attribute": "text-warning",
+        "Literal.String": "text-success",
+        "Literal.Number": "text-warning",
+        "Operator": "text-default-500",
+        "Punctuation": "text-default-500",
+        "Comment": "text-default-400 italic",
+        "Generic.Deleted": "text-danger",
+        "Generic.Inserted": "text-success",
+        "Generic.Error": "text-danger",
+        "Error": "text-danger",
+    },
+}
+
+# Renders the highlighted chunks one per animation frame, so very large code
+# does not block the page while it mounts.
+HIGHLIGHTED_CODE = """
+function HeroHighlightedCode({ chunks }) {
+  const [count, setCount] = useState(1);
+  useEffect(() => setCount(1), [chunks]);
+  useEffect(() => {
+    if (count >= chunks.length) return;
+    const id = requestAnimationFrame(() => setCount((n) => n + 1));
+    return () => cancelAnimationFrame(id);
+  }, [count, chunks]);
+  return jsx(
+    "span",
+    { style: { whiteSpace: "pre" } },
+    chunks.slice(0, count).map((chunk, i) =>
+      jsx("span", { key: i, dangerouslySetInnerHTML: { __html: chunk } })
+    )
+  );
+}"""
+
+
+def _require_pygments():
+    try:
+        import pygments.lexers
+    except ImportError as err:
+        raise ImportError(
+            "Syntax highlighting requires Pygments. Install it with "
+            "`pip install 'heroui-provider[highlight]'`."
+        ) from err
+    return pygments.lexers
+
+
+@functools.lru_cache(maxsize=64)
+def _lexer(language: str) -> Any:
+    lexers = _require_pygments()
+    from pygments.util import ClassNotFound
+
+    try:
+        return lexers.get_lexer_by_name(language, stripnl=False, ensurenl=False)
+    except ClassNotFound as err:
+        raise ValueError(f"Unknown language {language!r} for highlighting.") from err
+
+
+def _theme_digest(theme: str) -> str:
+    """Hash the token classes of a theme, so edits to it invalidate cached results.
+
+    Args:
+        theme: The name of the theme in ``HIGHLIGHT_THEMES``.
+
+    Returns:
+        A digest of the theme's token types and classes.
+    """
+    classes = json.dumps(HIGHLIGHT_THEMES[theme], sort_keys=True)
+    return hashlib.sha256(classes.encode("utf-8")).hexdigest()[:16]
+
+
+@functools.lru_cache(maxsize=1024)
+def _token_class(theme: str, theme_digest: str, token_type: Any) -> str:
+    # ``theme_digest`` is only part of the cache key.
+    classes = HIGHLIGHT_THEMES[theme]
+    while token_type:
+        name = str(token_type).removeprefix("Token.")
+        if name in classes:
+            return classes[name]
+        token_type = token_type.parent
+    return ""
+
+
+def _render(code: str, language: str, theme: str, chunk_lines: int) -> list[str]:
+    """Tokenize code into chunks of HTML spans with the theme's classes.
+
+    Args:
+        code: The source code.
+        language: The Pygments name of the language.
+        theme: The name of the theme in ``HIGHLIGHT_THEMES``.
+        chunk_lines: The number of lines per chunk.
+
+    Returns:
+        The HTML of each chunk.
+    """
+    theme_digest = _theme_digest(theme)
+    chunks: list[str] = []
+    parts: list[str] = []
+    lines = 0
+    # Runs of text with the same class are merged into one span.
+    run_class, run = "", []
+
+    def flush():
+        if run:
+            text = html.escape("".join(run), quote=False)
+            if run_class:
+                text = f'<span class="{run_class}">{text}</span>'
+            parts.append(text)
+            run.clear()
+
+    for token_type, value in _lexer(language).get_tokens(code):
+        css_class = _token_class(theme, theme_digest, token_type)
+        for i, text in enumerate(value.split("\n")):
+            if i:
+                flush()
+                parts.append("\n")
+                lines += 1
+                if lines % chunk_lines == 0:
+                    chunks.append("".join(parts))
+                    parts = []
+            if text:
+                if css_class != run_class:
+                    flush()
+                    run_class = css_class
+                run.append(text)
+    flush()
+    if parts or not chunks:
+        chunks.append("".join(parts))
+    return chunks
+
+
+class Highlighter:
+    """Highlights code on the server, with a bounded LRU and optional disk cache.
+
+    Results are keyed by a hash of the code, the language, the theme with its
+    token classes, and the chunk size. With ``cache_dir`` (or
+    ``HEROUI_HIGHLIGHT_CACHE_DIR``) they are also written to disk, so rebuilds and
+    other workers reuse them.
+
+    Attributes:
+        maxsize: The maximum number of results kept in memory.
+        cache_dir: Where results are persisted, if anywhere.
+        hits: The number of lookups answered from memory or disk.
+        misses: The number of lookups that had to highlight.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        cache_dir: Union[str, os.PathLike, None] = None,
+    ):
+        """Create an empty highlighter.
+
+        Args:
+            maxsize: The maximum number of results kept in memory.
+            cache_dir: Where to persist results; defaults to
+                ``HEROUI_HIGHLIGHT_CACHE_DIR`` if set.
+        """
+        cache_dir = cache_dir or os.environ.get("HEROUI_HIGHLIGHT_CACHE_DIR")
+        self.maxsize = maxsize
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, list[str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of results in memory.
+
+        Returns:
+            The number of cached results.
+        """
+        return len(self._entries)
+
+    def _load(self, key: str) -> Optional[list[str]]:
+        if self.cache_dir is None:
+            return None
+        try:
+            return json.loads((self.cache_dir / f"{key}.json").read_text("utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, key: str, chunks: list[str]):
+        if self.cache_dir is None:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / f"{key}.json"
+        temp = path.with_suffix(f".{os.getpid()}.tmp")
+        temp.write_text(json.dumps(chunks), "utf-8")
+        temp.replace(path)
+
+    def highlight(
+        self,
+        code: str,
+        language: str,
+        theme: str = "heroui",
+        chunk_lines: int = 200,
+    ) -> list[str]:
+        """Highlight code into chunks of HTML spans.
+
+        Args:
+            code: The source code.
+            language: The Pygments name of the language, e.g. ``"python"``.
+            theme: The name of the theme in ``HIGHLIGHT_THEMES``.
+            chunk_lines: The number of lines per chunk.
+
+        Returns:
+            The HTML of each chunk.
+
+        Raises:
+            ValueError: If the language or theme is unknown.
+        """
+        if theme not in HIGHLIGHT_THEMES:
+            raise ValueError(f"Unknown highlight theme {theme!r}.")
+        digest = hashlib.sha256(code.encode("utf-8"))
+        digest.update(
+            f"|{language}|{theme}|{_theme_digest(theme)}|{chunk_lines}".encode()
+        )
+        key = digest.hexdigest()[:32]
+
+        with self._lock:
+            chunks = self._entries.get(key)
+            if chunks is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return list(chunks)
+        chunks = self._load(key)
+        if chunks is None:
+            chunks = _render(code, language, theme, chunk_lines)
+            self._store(key, chunks)
+            with self._lock:
+                self.misses += 1
+        else:
+            with self._lock:
+                self.hits += 1
+
+        with self._lock:
+            self._entries[key] = chunks
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return list(chunks)
+
+
+highlighter = Highlighter()
+
+
+def highlight(
+    code: str,
+    language: str,
+    theme: str = "heroui",
+    chunk_lines: int = 200,
+) -> list[str]:
+    """Highlight code with the shared ``highlighter``.
+
+    Use it in event handlers to highlight code only known at runtime, and pass
+    the chunks to ``hero.highlighted_code``.
+
+    Args:
+        code: The source code.
+        language: The Pygments name of the language, e.g. ``"python"``.
+        theme: The name of the theme in ``HIGHLIGHT_THEMES``.
+        chunk_lines: The number of lines per chunk.
+
+    Returns:
+        The HTML of each chunk.
+    """
+    return highlighter.highlight(code, language, theme, chunk_lines)
+
+
+class HighlightedCode(rx.Component):
+    """Code highlighted on the server, rendered progressively one chunk at a time.
+
+    Attributes:
+        tag: The tag name for the component.
+        chunks: The HTML of each chunk, from ``highlight``.
+    """
+
+    tag = "HeroHighlightedCode"
+
+    chunks: rx.Var[list[str]]
+
+    def add_imports(self) -> dict[str, list[ImportVar]]:
+        """Add the imports for the component.
+
+        Returns:
+            The React hooks used by the component.
+        """
+        return {
+            "react": [
+                ImportVar(tag="useEffect"),
+                ImportVar(tag="useState"),
+            ]
+        }
+
+    def add_custom_code(self) -> list[str]:
+        """Define the component next to the page.
+
+        Returns:
+            The code of the component.
+        """
+        return [HIGHLIGHTED_CODE]
+
+
+def highlighted_children(
+    children: tuple,
+    language: str,
+    theme: str = "heroui",
+    chunk_lines: int = 200,
+) -> tuple[tuple, str]:
+    """Replace the text children of a component by their highlighted code.
+
+    Args:
+        children: The children, each a string of code.
+        language: The Pygments name of the language.
+        theme: The name of the theme in ``HIGHLIGHT_THEMES``.
+        chunk_lines: The number of lines per chunk.
+
+    Returns:
+        The highlighted children, and the plain code they show.
+
+    Raises:
+        ValueError: If a child is not a string.
+    """
+    if not all(isinstance(child, str) for child in children):
+        raise ValueError(
+            "language= highlights string children at compile time; for code held "
+            "in state, call hero.highlight in an event handler and render the "
+            "chunks with hero.highlighted_code."
+        )
+    highlighted = tuple(
+        HighlightedCode.create(chunks=highlight(child, language, theme, chunk_lines))
+        for child in children
+    )
+    return highlighted, "\n".join(children)
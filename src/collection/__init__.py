@@ -0,0 +1 @@
+from .collection import render_collection
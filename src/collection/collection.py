@@ -0,0 +1,87 @@
+from typing import Any, Callable, Optional, get_args
+
+import reflex as rx
+from reflex.utils.imports import ImportVar
+from reflex.vars import get_unique_variable_name
+from reflex.vars.base import VarData
+
+
+def render_collection(
+    component: type[rx.Component],
+    items: rx.Var[list[Any]],
+    key_field: str = "key",
+    label_field: str = "label",
+    events: Optional[dict[str, Optional[Callable]]] = None,
+    **props,
+) -> rx.Component:
+    """Render a state list as one component per item with ``rx.foreach``.
+
+    The page gets a single ``.map()`` over the array with one item template,
+    instead of a node per item. Items are strings, used as both key and label, or
+    dicts with a key and a label field. Each item is keyed by its key, and the
+    event handlers in ``events`` are called with the key of the item instead of
+    the event of the component.
+
+    Args:
+        component: The component class of an item (e.g. ``Chip``).
+        items: A state var holding the items.
+        key_field: The field holding the unique key of a dict item.
+        label_field: The field holding the text shown for a dict item.
+        events: Event handlers by trigger name, each taking the item key.
+        **props: Props shared by every item.
+
+    Returns:
+        The foreach component rendering the items.
+    """
+    item_types = get_args(items._var_type)
+    plain = bool(item_types) and item_types[0] in (str, int)
+    events = {name: event for name, event in (events or {}).items() if event}
+
+    def render(item: rx.Var) -> rx.Component:
+        key = item if plain else item[key_field]
+        label = item if plain else item[label_field]
+        return component.create(
+            label,
+            key=key,
+            **{name: event(key) for name, event in events.items()},
+            **props,
+        )
+
+    return rx.foreach(items, render)
+
+
+def appended_windows(window: rx.Var[list], offset: rx.Var[int]) -> rx.Var[list]:
+    """Rebuild a long list in the browser from the windows the server sends.
+
+    The server only sends the latest window of the list and the offset it starts
+    at, so each load costs one window on the wire instead of every item loaded
+    so far. In the browser, the window replaces the items from its offset on,
+    and an offset of 0 starts the list over.
+
+    Args:
+        window: A state var holding the latest window of items.
+        offset: A state var holding the index of the window's first item.
+
+    Returns:
+        A var holding the items loaded so far.
+    """
+    name = get_unique_variable_name()
+    items, start = window._js_expr, offset._js_expr
+    hook = (
+        f"const {name}_loaded = useRef([]);\n"
+        f"const {name} = useMemo(() => ({name}_loaded.current = {start} === 0 "
+        f"? {items} : {name}_loaded.current.slice(0, {start}).concat({items})), "
+        f"[{items}, {start}]);"
+    )
+    return rx.Var(
+        _js_expr=name,
+        _var_type=window._var_type,
+        _var_data=VarData.merge(
+            window._get_all_var_data(),
+            offset._get_all_var_data(),
+            VarData(
+                hooks={hook: None},
+                imports={"react": [ImportVar(tag="useMemo"), ImportVar(tag="useRef")]},
+            ),
+        ),
+    )
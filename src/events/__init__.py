@@ -0,0 +1,8 @@
+from .events import (
+    ImageInfo,
+    MouseInfo,
+    PressInfo,
+    image_event,
+    mouse_event,
+    press_event,
+)
@@ -0,0 +1,151 @@
+import dataclasses
+from typing import TypedDict
+
+from reflex.vars import Var
+from reflex.vars.object import ObjectVar
+
+
+@dataclasses.dataclass(
+    init=True,
+    frozen=True,
+)
+class JavascriptPressEvent:
+    """Interface for a React Aria PressEvent https://react-spectrum.adobe.com/react-aria/usePress.html."""
+
+    pointerType: str = ""
+    altKey: bool = False
+    ctrlKey: bool = False
+    metaKey: bool = False
+    shiftKey: bool = False
+
+
+@dataclasses.dataclass(
+    init=True,
+    frozen=True,
+)
+class JavascriptMouseEvent:
+    """Interface for a Javascript MouseEvent https://developer.mozilla.org/en-US/docs/Web/API/MouseEvent."""
+
+    button: int = 0
+    altKey: bool = False
+    ctrlKey: bool = False
+    metaKey: bool = False
+    shiftKey: bool = False
+
+
+@dataclasses.dataclass(
+    init=True,
+    frozen=True,
+)
+class JavascriptHTMLImageElement:
+    """Interface for a Javascript HTMLImageElement https://developer.mozilla.org/en-US/docs/Web/API/HTMLImageElement."""
+
+    naturalWidth: int = 0
+    naturalHeight: int = 0
+    currentSrc: str = ""
+
+
+@dataclasses.dataclass(
+    init=True,
+    frozen=True,
+)
+class JavascriptImageEvent:
+    """Interface for the load and error events of an image."""
+
+    target: JavascriptHTMLImageElement = JavascriptHTMLImageElement()
+
+
+class PressInfo(TypedDict):
+    """What a press event sends to the server."""
+
+    pointer_type: str
+    alt_key: bool
+    ctrl_key: bool
+    meta_key: bool
+    shift_key: bool
+
+
+class MouseInfo(TypedDict):
+    """What a click sends to the server."""
+
+    button: int
+    alt_key: bool
+    ctrl_key: bool
+    meta_key: bool
+    shift_key: bool
+
+
+class ImageInfo(TypedDict):
+    """What an image load or error event sends to the server."""
+
+    natural_width: int
+    natural_height: int
+    src: str
+
+
+def press_event(e: ObjectVar[JavascriptPressEvent]) -> tuple[Var[PressInfo]]:
+    """Get the pointer type and modifier keys of a press event.
+
+    Handlers receive a ``PressInfo`` dict instead of the whole event object. To
+    send less, take no argument, or pick fields with a lambda, e.g.
+    ``on_press=lambda info: State.open(info["pointer_type"])``.
+
+    Args:
+        e: The press event.
+
+    Returns:
+        The pointer type and modifier keys.
+    """
+    return (
+        Var.create(
+            {
+                "pointer_type": e.pointerType,
+                "alt_key": e.altKey,
+                "ctrl_key": e.ctrlKey,
+                "meta_key": e.metaKey,
+                "shift_key": e.shiftKey,
+            },
+        ).to(PressInfo),
+    )
+
+
+def mouse_event(e: ObjectVar[JavascriptMouseEvent]) -> tuple[Var[MouseInfo]]:
+    """Get the button and modifier keys of a click.
+
+    Args:
+        e: The mouse event.
+
+    Returns:
+        The button pressed and the modifier keys.
+    """
+    return (
+        Var.create(
+            {
+                "button": e.button,
+                "alt_key": e.altKey,
+                "ctrl_key": e.ctrlKey,
+                "meta_key": e.metaKey,
+                "shift_key": e.shiftKey,
+            },
+        ).to(MouseInfo),
+    )
+
+
+def image_event(e: ObjectVar[JavascriptImageEvent]) -> tuple[Var[ImageInfo]]:
+    """Get the intrinsic size and source of a loaded (or failed) image.
+
+    Args:
+        e: The load or error event.
+
+    Returns:
+        The natural width and height, and the source actually used.
+    """
+    return (
+        Var.create(
+            {
+                "natural_width": e.target.naturalWidth,
+                "natural_height": e.target.naturalHeight,
+                "src": e.target.currentSrc,
+            },
+        ).to(ImageInfo),
+    )
@@ -0,0 +1,3 @@
+from .form import Form
+
+form = Form.create
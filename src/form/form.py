@@ -0,0 +1,189 @@
+from typing import Any, Literal, Optional, Union
+
+import reflex as rx
+from reflex.event import no_args_event_spec
+from reflex.utils.imports import ImportVar
+from ..npm.npm import lib_deps, versioned
+from ..props.props import LiteralProps
+
+
+# Keeps the field values in the DOM and reads them only on submit (and, with
+# ``syncMs``, on an interval to send the fields that changed since last time).
+# Checkboxes sharing a name, or inside a group, give lists; a lone checkbox a
+# boolean; number inputs numbers; radios the checked value or null.
+UNCONTROLLED_FORM = """
+const heroFormValues = (form) => {
+  const values = {};
+  const boxes = new Map();
+  for (const el of form.elements) {
+    if (!el.name || el.disabled) continue;
+    if (["submit", "button", "reset", "image", "file"].includes(el.type)) {
+      continue;
+    }
+    if (el.type === "checkbox") {
+      boxes.set(el.name, [...(boxes.get(el.name) ?? []), el]);
+    } else if (el.type === "radio") {
+      if (el.checked) values[el.name] = el.value;
+      else if (!(el.name in values)) values[el.name] = null;
+    } else if (el.type === "select-multiple") {
+      values[el.name] = Array.from(el.selectedOptions, (option) => option.value);
+    } else if (el.type === "number" || el.type === "range") {
+      values[el.name] = el.value === "" ? null : el.valueAsNumber;
+    } else {
+      values[el.name] = el.value;
+    }
+  }
+  boxes.forEach((group, name) => {
+    values[name] =
+      group.length === 1 && !group[0].closest('[role="group"]')
+        ? group[0].checked
+        : group.filter((box) => box.checked).map((box) => box.value);
+  });
+  return values;
+};
+
+// The first field with a displayed error, required but left empty, or failing
+// its own constraints (``pattern``, ``minLength``, ``type="email"``, ...), which
+// the browser still checks on named inputs with aria validation.
+const heroFormInvalid = (form) =>
+  Array.from(
+    form.querySelectorAll('[aria-invalid="true"], [aria-required="true"], [name]')
+  ).find((el) => {
+    if (el.getAttribute("aria-invalid") === "true") return true;
+    if (el.getAttribute("aria-required") === "true") {
+      if (el.type === "checkbox" || el.type === "radio") return !el.checked;
+      if (!("value" in el)) return !el.querySelector("input:checked");
+      if (el.value === "") return true;
+    }
+    return el.willValidate === true && !el.validity.valid;
+  });
+
+function HeroForm({ onSubmit, onDirty, syncMs, resetOnSubmit, children, ...props }) {
+  const ref = useRef(null);
+  const synced = useRef(null);
+  const handlers = useRef({});
+  handlers.current = { onSubmit, onDirty };
+
+  useEffect(() => {
+    synced.current = heroFormValues(ref.current);
+    if (!syncMs) return;
+    const id = setInterval(() => {
+      if (!ref.current || !handlers.current.onDirty) return;
+      const values = heroFormValues(ref.current);
+      const dirty = {};
+      for (const [name, value] of Object.entries(values)) {
+        if (JSON.stringify(value) !== JSON.stringify(synced.current[name])) {
+          dirty[name] = value;
+        }
+      }
+      synced.current = values;
+      if (Object.keys(dirty).length) handlers.current.onDirty(dirty);
+    }, syncMs);
+    return () => clearInterval(id);
+  }, [syncMs]);
+
+  const submit = (e) => {
+    e.preventDefault();
+    const form = e.currentTarget;
+    // Native validation already blocked the submit; aria validation does not.
+    const invalid = heroFormInvalid(form);
+    if (invalid) {
+      const field = invalid.matches("input, textarea, select")
+        ? invalid
+        : invalid.querySelector("input");
+      field?.focus();
+      return;
+    }
+    const values = heroFormValues(form);
+    synced.current = values;
+    handlers.current.onSubmit?.(values);
+    if (resetOnSubmit) form.reset();
+  };
+
+  return jsx(HeroUIForm, { ...props, ref, onSubmit: submit }, children);
+}"""
+
+
+def _form_data_spec(data: rx.Var[dict[str, Any]]) -> list[rx.Var[dict[str, Any]]]:
+    return [data]
+
+
+class Form(LiteralProps, rx.Component):
+    """A form whose fields keep their values on the client until it is submitted.
+
+    Fields inside take ``name`` and, instead of a ``value`` bound to state, an
+    optional ``default_value``: typing, checking and selecting cause no server
+    round trips. Validation (``is_required``, ``min_length``, ``pattern``, ...)
+    also runs in the browser, following ``validation_behavior`` or else the
+    Provider's, and ``on_submit`` receives every value in a single dict.
+
+    Attributes:
+        tag: The tag name for the component.
+        lib_dependencies: Dependencies required by the component.
+        validation_behavior: Whether to use native or ARIA validation; inherited
+            from the Provider when unset.
+        validation_errors: Server-side errors to show, by field name.
+        reset_on_submit: Whether to clear the fields after a successful submit.
+        sync_ms: How often to send the fields changed since the last sync to
+            ``on_dirty``, in milliseconds.
+        on_submit: Event handler called with the values of all named fields.
+        on_dirty: Event handler called with the values of the fields changed
+            since the last sync or submit.
+        on_reset: Event handler called when the form is reset.
+    """
+
+    tag = "HeroForm"
+    lib_dependencies: list = lib_deps
+
+    # Props
+    validation_behavior: rx.Var[Optional[Literal["native", "aria"]]]
+    validation_errors: rx.Var[Optional[dict[str, Union[str, list[str]]]]]
+    reset_on_submit: rx.Var[bool] = False
+    sync_ms: rx.Var[Optional[int]]
+
+    # Events
+    on_submit: rx.EventHandler[_form_data_spec]
+    on_dirty: rx.EventHandler[_form_data_spec]
+    on_reset: rx.EventHandler[no_args_event_spec]
+
+    @classmethod
+    def create(cls, *children, **props) -> rx.Component:
+        """Create an uncontrolled form.
+
+        Args:
+            *children: The fields and buttons of the form.
+            **props: The props of the component.
+
+        Returns:
+            The Form component.
+
+        Raises:
+            ValueError: If ``sync_ms`` is given without ``on_dirty``, or is not
+                positive.
+        """
+        sync_ms = props.get("sync_ms")
+        if sync_ms is not None and not isinstance(sync_ms, rx.Var):
+            if "on_dirty" not in props:
+                raise ValueError("`sync_ms` sends changes to `on_dirty`; pass both.")
+            if sync_ms <= 0:
+                raise ValueError("`sync_ms` must be a positive number of milliseconds.")
+        return super().create(*children, **props)
+
+    def add_imports(self) -> dict[str, list[ImportVar]]:
+        """Add the imports for the component.
+
+        Returns:
+            The HeroUI form and the React hooks.
+        """
+        return {
+            versioned("@heroui/form"): [ImportVar(tag="Form", alias="HeroUIForm")],
+            "react": [ImportVar(tag="useEffect"), ImportVar(tag="useRef")],
+        }
+
+    def add_custom_code(self) -> list[str]:
+        """Define the component next to the page.
+
+        Returns:
+            The code of the component.
+        """
+        return [UNCONTROLLED_FORM]
@@ -1,3 +1,4 @@
 from .image import Image
+from .pipeline import ImagePipeline, ResponsiveImage
 
 image = Image.create
@@ -1,10 +1,13 @@
 import reflex as rx
 from typing import Any, Literal, Optional
+from ..cache.cache import CachedRender
+from ..events.events import image_event
+from ..npm.npm import lib_deps, versioned
+from ..props.props import LiteralProps
+from .pipeline import ImagePipeline, default_pipeline, has_pillow
 
-lib_deps: list = ["@heroui/theme", "@heroui/system", "framer-motion"]
 
-
-class Image(rx.Component):
+class Image(LiteralProps, CachedRender, rx.Component):
     """A component that displays images with various styling and loading options.
 
     Attributes:
@@ -26,9 +29,15 @@ class Image(rx.Component):
         disable_skeleton: Whether to disable the skeleton loading animation.
         on_load: Event handler called when the image loads successfully.
         on_error: Event handler called when the image fails to load.
+
+    When ``src`` points at a local asset (e.g. ``"/photo.jpg"``) and Pillow is
+    installed, resized variants are generated at compile time and ``src_set``,
+    ``sizes`` and the intrinsic ``width``/``height`` are filled in automatically.
+    A tiny blurred copy is inlined as ``fallback_src`` and shown in place of the
+    skeleton until the image has loaded and faded in.
     """
 
-    library = "@heroui/image"
+    library = versioned("@heroui/image")
     lib_dependencies: list = lib_deps
     tag = "Image"
     src: rx.Var[str]
@@ -44,5 +53,50 @@ class Image(rx.Component):
     is_zoomed: rx.Var[bool] = False
     remove_wrapper: rx.Var[bool] = False
     disable_skeleton: rx.Var[bool] = False
-    on_load: rx.EventHandler[lambda e: [e]]
-    on_error: rx.EventHandler[lambda e: [e]]
+    on_load: rx.EventHandler[image_event]
+    on_error: rx.EventHandler[image_event]
+
+    @classmethod
+    def create(
+        cls,
+        *children,
+        responsive: bool = True,
+        placeholder: bool = True,
+        pipeline: Optional[ImagePipeline] = None,
+        **props,
+    ) -> rx.Component:
+        """Create an Image, generating responsive variants for local assets.
+
+        Props that are passed explicitly are never overridden.
+
+        Args:
+            *children: The children of the component.
+            responsive: Whether to run local images through the pipeline.
+            placeholder: Whether to show a blurred placeholder while loading.
+            pipeline: The pipeline to use instead of the default one.
+            **props: The props of the component.
+
+        Returns:
+            The Image component.
+        """
+        src = props.get("src")
+        if responsive and isinstance(src, str) and has_pillow():
+            pipeline = pipeline or default_pipeline
+            path = pipeline.resolve(src)
+            if path is not None:
+                result = pipeline.process(path)
+                width, height = props.get("width"), props.get("height")
+                if width is None and height is None:
+                    props["width"], props["height"] = result.width, result.height
+                elif height is None and isinstance(width, int):
+                    props["height"] = round(width * result.height / result.width)
+                elif width is None and isinstance(height, int):
+                    props["width"] = round(height * result.width / result.height)
+                props.setdefault("src_set", result.src_set)
+                props.setdefault(
+                    "sizes", f"{width}px" if isinstance(width, int) else "100vw"
+                )
+                if placeholder and result.placeholder:
+                    props.setdefault("fallback_src", result.placeholder)
+                    props.setdefault("disable_skeleton", True)
+        return super().create(*children, **props)
@@ -0,0 +1,287 @@
+import base64
+import hashlib
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Literal, Optional
+
+from reflex import constants
+
+
+# Widths (in pixels) of the generated variants. Images are never upscaled.
+DEFAULT_BREAKPOINTS: tuple[int, ...] = (320, 640, 960, 1280, 1920)
+
+# Source file extensions the pipeline knows how to resize.
+SUPPORTED_EXTENSIONS: frozenset[str] = frozenset(
+    {".jpg", ".jpeg", ".png", ".webp", ".avif", ".bmp", ".tif", ".tiff"}
+)
+
+# Folder (below the app's shared assets) that generated variants are written to.
+OUTPUT_SUBFOLDER = Path("heroui") / "images"
+
+
+@dataclass(frozen=True)
+class ResponsiveImage:
+    """The result of running a local image through the pipeline.
+
+    Attributes:
+        width: The intrinsic width of the source image in pixels.
+        height: The intrinsic height of the source image in pixels.
+        src_set: The ``srcset`` value listing every generated variant.
+        variants: The generated ``(width, url)`` pairs, smallest first.
+        placeholder: A tiny blurred version of the image as a ``data:`` URI.
+    """
+
+    width: int
+    height: int
+    src_set: str
+    variants: tuple[tuple[int, str], ...]
+    placeholder: str = ""
+
+
+def _require_pillow():
+    try:
+        from PIL import Image as PILImage
+    except ImportError as err:
+        raise ImportError(
+            "Responsive images require Pillow. Install it with "
+            "`pip install 'heroui-provider[images]'`."
+        ) from err
+    return PILImage
+
+
+def has_pillow() -> bool:
+    """Check whether Pillow is available for the pipeline.
+
+    Returns:
+        Whether Pillow can be imported.
+    """
+    try:
+        _require_pillow()
+    except ImportError:
+        return False
+    return True
+
+
+@dataclass
+class ImagePipeline:
+    """Generates resized variants of local images with a content-hashed cache.
+
+    Variants and a small JSON manifest are written to the app's shared assets
+    folder, named after a hash of the source bytes and the pipeline settings, so
+    unchanged images are never processed twice.
+
+    Attributes:
+        breakpoints: The widths to generate, in pixels.
+        format: The output format of the variants.
+        quality: The encoder quality (1-100).
+        placeholder_width: The width of the inline blurred placeholder, in pixels.
+        assets_dir: The app's assets directory.
+        output_dir: Where variants are written, inside ``assets_dir``; defaults
+            to a folder in the shared assets.
+    """
+
+    breakpoints: tuple[int, ...] = DEFAULT_BREAKPOINTS
+    format: Literal["webp", "avif"] = "webp"
+    quality: int = 75
+    placeholder_width: int = 16
+    assets_dir: Path = field(default_factory=lambda: Path(constants.Dirs.APP_ASSETS))
+    output_dir: Optional[Path] = None
+
+    # In-process memo of (path, mtime, size) -> result, to skip re-hashing.
+    _memo: dict[tuple[str, int, int], ResponsiveImage] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if self.output_dir is not None:
+            output_dir = Path(self.output_dir).resolve()
+            assets_dir = Path(self.assets_dir).resolve()
+            if output_dir != assets_dir and assets_dir not in output_dir.parents:
+                raise ValueError(
+                    f"ImagePipeline.output_dir ({self.output_dir}) must be inside "
+                    f"assets_dir ({self.assets_dir}), which is where the app "
+                    "serves images from."
+                )
+
+    @property
+    def _output_dir(self) -> Path:
+        if self.output_dir is not None:
+            return Path(self.output_dir)
+        return self.assets_dir / constants.Dirs.EXTERNAL_APP_ASSETS / OUTPUT_SUBFOLDER
+
+    def _url(self, name: str) -> str:
+        output_dir = self._output_dir.resolve()
+        relative = (output_dir / name).relative_to(self.assets_dir.resolve())
+        return "/" + relative.as_posix()
+
+    def resolve(self, src: str) -> Optional[Path]:
+        """Find the local file an image ``src`` points at.
+
+        Args:
+            src: The ``src`` passed to the image component.
+
+        Returns:
+            The path of the local asset, or None if ``src`` is not a local image.
+        """
+        if not src.startswith("/") or src.startswith("//"):
+            return None
+        path = self.assets_dir / src.lstrip("/")
+        if path.suffix.lower() not in SUPPORTED_EXTENSIONS or not path.is_file():
+            return None
+        if self._output_dir.resolve() in path.resolve().parents:
+            return None
+        return path
+
+    def _cache_key(self, data: bytes) -> str:
+        digest = hashlib.sha256(data)
+        digest.update(f"{self.breakpoints}|{self.format}|{self.quality}".encode())
+        return digest.hexdigest()[:16]
+
+    def process(self, path: os.PathLike) -> ResponsiveImage:
+        """Generate the variants of a local image, reusing cached results.
+
+        Args:
+            path: The source image.
+
+        Returns:
+            The intrinsic size and generated variants of the image.
+        """
+        path = Path(path)
+        stat = path.stat()
+        memo_key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        if memo_key in self._memo:
+            return self._memo[memo_key]
+
+        data = path.read_bytes()
+        key = self._cache_key(data)
+        manifest = self._output_dir / f"{key}.json"
+        if manifest.exists():
+            cached = json.loads(manifest.read_text())
+            if cached.get("placeholder_width") != self.placeholder_width:
+                # Manifest from another placeholder setting, only redo the placeholder.
+                PILImage = _require_pillow()
+                with PILImage.open(path) as source:
+                    cached["placeholder"] = self._placeholder(source)
+                cached["placeholder_width"] = self.placeholder_width
+                manifest.write_text(json.dumps(cached))
+            result = self._result(
+                cached["width"],
+                cached["height"],
+                cached["variants"],
+                cached["placeholder"],
+            )
+        else:
+            result = self._generate(path, key)
+        self._memo[memo_key] = result
+        return result
+
+    def _result(
+        self,
+        width: int,
+        height: int,
+        variants: list[tuple[int, str]],
+        placeholder: str,
+    ) -> ResponsiveImage:
+        urls = tuple((w, self._url(name)) for w, name in variants)
+        return ResponsiveImage(
+            width=width,
+            height=height,
+            src_set=", ".join(f"{url} {w}w" for w, url in urls),
+            variants=urls,
+            placeholder=placeholder,
+        )
+
+    def _placeholder(self, source) -> str:
+        from PIL import ImageFilter
+
+        PILImage = _require_pillow()
+        width, height = source.size
+        w = min(self.placeholder_width, width)
+        thumbnail = source.convert("RGB").resize(
+            (w, max(1, round(height * w / width))), PILImage.BICUBIC
+        )
+        thumbnail = thumbnail.filter(ImageFilter.GaussianBlur(1))
+        buffer = io.BytesIO()
+        thumbnail.save(buffer, format="WEBP", quality=40)
+        return "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode()
+
+    def _generate(self, path: Path, key: str) -> ResponsiveImage:
+        PILImage = _require_pillow()
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        with PILImage.open(path) as source:
+            source.load()
+            width, height = source.size
+            # Palette images keep their transparency in ``info``, not in a band.
+            if "A" in source.getbands() or "transparency" in source.info:
+                source = source.convert("RGBA")
+            elif source.mode != "RGB":
+                source = source.convert("RGB")
+            widths = sorted({w for w in self.breakpoints if w < width} | {width})
+            variants = []
+            for w in widths:
+                name = f"{key}-{w}.{self.format}"
+                h = max(1, round(height * w / width))
+                resized = (
+                    source if w == width else source.resize((w, h), PILImage.LANCZOS)
+                )
+                resized.save(self._output_dir / name, quality=self.quality)
+                variants.append((w, name))
+            placeholder = self._placeholder(source)
+        manifest = {
+            "width": width,
+            "height": height,
+            "variants": variants,
+            "placeholder": placeholder,
+            "placeholder_width": self.placeholder_width,
+        }
+        # Write the manifest last, it marks the variants as complete.
+        (self._output_dir / f"{key}.json").write_text(json.dumps(manifest))
+        return self._result(width, height, variants, placeholder)
+
+    def process_many(
+        self, paths: Iterable[os.PathLike], max_workers: Optional[int] = None
+    ) -> list[ResponsiveImage]:
+        """Process many images in parallel across CPU cores.
+
+        Args:
+            paths: The source images.
+            max_workers: The number of worker processes (defaults to the CPU count).
+
+        Returns:
+            The results, in the order of ``paths``.
+        """
+        paths = [Path(p) for p in paths]
+        if max_workers == 1:
+            return [self.process(p) for p in paths]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self.process, paths, chunksize=8))
+        for p, result in zip(paths, results):
+            stat = p.stat()
+            self._memo[(str(p.resolve()), stat.st_mtime_ns, stat.st_size)] = result
+        return results
+
+    def build(self, max_workers: Optional[int] = None) -> list[ResponsiveImage]:
+        """Pre-generate variants for every image in the assets directory.
+
+        Running this before compiling the app means pages only hit the cache.
+
+        Args:
+            max_workers: The number of worker processes (defaults to the CPU count).
+
+        Returns:
+            The results for every image found.
+        """
+        paths = [
+            p
+            for p in sorted(self.assets_dir.rglob("*"))
+            if self.resolve("/" + p.relative_to(self.assets_dir).as_posix())
+        ]
+        return self.process_many(paths, max_workers=max_workers)
+
+
+default_pipeline = ImagePipeline()
+"""The pipeline used by ``hero.image`` unless another one is passed."""
@@ -1,11 +1,108 @@
 import reflex as rx
-from typing import Any, Dict, Literal, Optional, Union
+from typing import Any, Literal, Optional
+from reflex.event import input_event
+from reflex.event import JavascriptInputEvent
+from reflex.vars import ObjectVar
+from ..cache.cache import CachedRender
+from ..npm.npm import lib_deps, versioned
+from ..props.props import LiteralProps
 
 
-lib_deps: list = ["@heroui/theme", "@heroui/system", "framer-motion"]
+def _value_event_spec(value: rx.Var[str]) -> list[rx.Var[str]]:
+    return [value]
 
 
-class Input(rx.Component):
+def _blur_value_event_spec(e: ObjectVar[JavascriptInputEvent]) -> list[rx.Var[str]]:
+    return [e.target.value]
+
+
+# The value events a text field can rate limit, and the args spec of each.
+_VALUE_EVENTS = (("on_value_change", _value_event_spec), ("on_change", input_event))
+
+
+def limit_value_events(
+    props: dict[str, Any],
+    debounce_ms: Optional[int] = None,
+    throttle_ms: Optional[int] = None,
+    emit: Literal["change", "blur"] = "change",
+) -> dict[str, Any]:
+    """Rate limit the ``on_value_change`` and ``on_change`` events of a text field.
+
+    The limiting happens in the client's event queue before anything is sent to the
+    backend. Since the server only learns about the value once the event fires, the
+    field must keep its own state: pass the initial value as ``default_value``.
+
+    Args:
+        props: The props passed to the component's ``create``.
+        debounce_ms: Only send the latest value once typing pauses for this long.
+        throttle_ms: Send at most one value per this interval; the settled value
+            is also sent when the field loses focus.
+        emit: ``"blur"`` sends the value only when the field loses focus.
+
+    Returns:
+        The props with the value events wrapped accordingly.
+
+    Raises:
+        ValueError: If more than one rate limiting mode is requested, if the field
+            is controlled by ``value``, if both value events are given to be sent
+            on blur, or if a handler cannot be rate limited.
+    """
+    modes = [debounce_ms is not None, throttle_ms is not None, emit == "blur"]
+    if sum(modes) > 1:
+        raise ValueError(
+            "Only one of `debounce_ms`, `throttle_ms` or `emit='blur'` can be used."
+        )
+    if not any(modes):
+        return props
+    if "value" in props:
+        raise ValueError(
+            "A rate limited field cannot be controlled by `value`: it would be reset "
+            "to the state's value on every keystroke. Pass `default_value` instead."
+        )
+
+    handlers, chains = [], {}
+    for trigger, args_spec in _VALUE_EVENTS:
+        handler = props.pop(trigger, None)
+        if handler is None:
+            continue
+        chain = rx.EventChain.create(handler, args_spec, key=trigger)
+        if not isinstance(chain, rx.EventChain):
+            raise ValueError(
+                f"`{trigger}` must be event handlers or lambdas to be rate limited."
+            )
+        handlers.extend(handler if isinstance(handler, list) else [handler])
+        chains[trigger] = chain
+    if not chains:
+        return props
+
+    if emit == "blur" or throttle_ms is not None:
+        if "on_blur" in props:
+            raise ValueError(
+                "`on_blur` cannot be combined with `emit='blur'` or `throttle_ms`."
+            )
+        if len(chains) > 1:
+            # Both would be sent on blur, so a handler passed to both runs twice.
+            raise ValueError(
+                "Pass only one of `on_change` or `on_value_change` with "
+                "`emit='blur'` or `throttle_ms`."
+            )
+        # The value events take the value, which the blur event also carries.
+        props["on_blur"] = rx.EventChain.create(
+            handlers, args_spec=_blur_value_event_spec, key="on_blur"
+        )
+    if emit == "blur":
+        return props
+
+    for trigger, chain in chains.items():
+        props[trigger] = (
+            chain.debounce(debounce_ms)
+            if debounce_ms is not None
+            else chain.throttle(throttle_ms)
+        )
+    return props
+
+
+class Input(LiteralProps, CachedRender, rx.Component):
     """A component that allows users to input text.
 
     Attributes:
@@ -17,6 +114,7 @@ class Input(rx.Component):
         size: The size of the input.
         radius: The border radius of the input.
         label: The label text of the input.
+        name: The name of the input's value when its form is submitted.
         placeholder: The placeholder text of the input.
         description: The description text of the input.
         error_message: The error message text of the input.
@@ -32,9 +130,12 @@ class Input(rx.Component):
         is_clearable: Whether the input can be cleared.
         auto_focus: Whether the input should automatically get focus when mounted.
         full_width: Whether the input should take the full width of its container.
+        on_value_change: Event handler called with the new value. Can be rate limited
+            in the browser with the ``debounce_ms``, ``throttle_ms`` and ``emit``
+            arguments of ``create``.
     """
 
-    library = "@heroui/input"
+    library = versioned("@heroui/input")
     lib_dependencies: list = lib_deps
     tag = "Input"
 
@@ -48,6 +149,7 @@ class Input(rx.Component):
     label: rx.Var[Optional[str]]
     value: rx.Var[Optional[str]]
     default_value: rx.Var[Optional[str]]
+    name: rx.Var[Optional[str]]
     placeholder: rx.Var[Optional[str]]
     description: rx.Var[Optional[str]]
     error_message: rx.Var[Optional[str]]
@@ -85,4 +187,28 @@ class Input(rx.Component):
 
     # Events
     on_value_change: rx.EventHandler[lambda value: [value]]
-    on_change: rx.EventHandler[lambda e: [e]]
+    on_change: rx.EventHandler[input_event]
+
+    @classmethod
+    def create(
+        cls,
+        *children,
+        debounce_ms: Optional[int] = None,
+        throttle_ms: Optional[int] = None,
+        emit: Literal["change", "blur"] = "change",
+        **props,
+    ) -> rx.Component:
+        """Create an Input, optionally rate limiting its value events.
+
+        Args:
+            *children: The children of the component.
+            debounce_ms: Send the value once typing pauses for this many milliseconds.
+            throttle_ms: Send at most one value every this many milliseconds.
+            emit: Set to ``"blur"`` to send the value only when the input loses focus.
+            **props: The props of the component.
+
+        Returns:
+            The Input component.
+        """
+        props = limit_value_events(props, debounce_ms, throttle_ms, emit)
+        return super().create(*children, **props)
@@ -0,0 +1,3 @@
+from .lazy import Lazy
+
+lazy = Lazy.create
@@ -0,0 +1,113 @@
+import reflex as rx
+from typing import Any, Optional, Union
+from reflex.components.component import StatefulComponent
+from reflex.utils import imports
+from reflex.utils.format import format_library_name
+from reflex.utils.imports import ImportVar, ParsedImportDict
+from ..spinner.spinner import Spinner
+
+
+def _lazy_targets(component: rx.Component) -> list[rx.Component]:
+    """Collect the HeroUI components in a subtree that should be loaded lazily.
+
+    Nested ``Lazy`` boundaries are skipped, they handle their own subtree.
+    Stateful children memoized at compile time are walked through, unless they
+    are rendered to the shared stateful components module, which imports their
+    components itself.
+
+    Args:
+        component: The root of the subtree.
+
+    Returns:
+        The HeroUI components found among the children of ``component``.
+    """
+    targets = []
+    for child in component.children:
+        if isinstance(child, StatefulComponent):
+            if child.rendered_as_shared:
+                continue
+            child = child.component
+        if isinstance(child, Lazy) or not isinstance(child, rx.Component):
+            continue
+        if child.library and child.library.startswith("@heroui/") and child.tag:
+            targets.append(child)
+        targets.extend(_lazy_targets(child))
+    return targets
+
+
+class Lazy(rx.Component):
+    """A Suspense boundary that code-splits the HeroUI components inside it.
+
+    Every HeroUI component in the subtree is rendered through ``React.lazy``, so its
+    ``@heroui/*`` package is fetched with a dynamic ``import()`` instead of being part
+    of the page bundle. The ``fallback`` is shown until the chunk has loaded.
+
+    Attributes:
+        library: The library the component belongs to.
+        tag: The tag name for the component.
+        fallback: The content shown while the lazy components load.
+    """
+
+    library = "react"
+    tag = "Suspense"
+
+    fallback: rx.Var[Optional[Any]]
+
+    @classmethod
+    def create(
+        cls,
+        *children,
+        fallback: Optional[rx.Component] = None,
+        width: Optional[Union[int, str]] = None,
+        height: Optional[Union[int, str]] = None,
+        **props,
+    ) -> rx.Component:
+        """Create a lazy boundary around the given children.
+
+        Args:
+            *children: The components to load lazily.
+            fallback: The content shown while loading; defaults to a spinner.
+            width: Width of a placeholder box reserved while loading.
+            height: Height of a placeholder box reserved while loading.
+            **props: The props of the component.
+
+        Returns:
+            The Lazy component.
+        """
+        if fallback is None:
+            if width is None and height is None:
+                fallback = Spinner.create()
+            else:
+                size = {"width": width, "height": height}
+                fallback = rx.el.div(
+                    style={
+                        key: value for key, value in size.items() if value is not None
+                    }
+                )
+        component = super().create(*children, fallback=fallback, **props)
+        for target in _lazy_targets(component):
+            target.alias = f"Lazy{target.tag}"
+        return component
+
+    def _get_all_imports(self, collapse: bool = False) -> ParsedImportDict:
+        _imports = super()._get_all_imports()
+        for target in _lazy_targets(self):
+            # Keep the package installed, but do not import it into the page.
+            library_imports = _imports.get(target.library, [])
+            _imports[target.library] = [
+                import_var
+                for import_var in library_imports
+                if import_var.alias != target.alias
+            ] + [ImportVar(tag=None, render=False)]
+        _imports = imports.merge_imports(_imports, {"react": [ImportVar(tag="lazy")]})
+        return imports.collapse_imports(_imports) if collapse else _imports
+
+    def _get_all_dynamic_imports(self) -> set[str]:
+        dynamic_imports = super()._get_all_dynamic_imports()
+        for target in _lazy_targets(self):
+            library = format_library_name(target.library)
+            dynamic_imports.add(
+                f"const {target.alias} = lazy(() => import('{library}')"
+                f".then((mod) => ({{ default: mod.{target.tag} }})));"
+            )
+        return dynamic_imports
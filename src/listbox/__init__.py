@@ -0,0 +1,5 @@
+from .listbox import Listbox, ListboxItem
+from .state import OptionsState
+
+listbox = Listbox.create
+listbox_item = ListboxItem.create
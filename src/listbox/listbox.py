@@ -0,0 +1,203 @@
+import reflex as rx
+from reflex.constants.compiler import MemoizationMode
+from typing import Any, Literal, Optional, Union
+from ..collection.collection import appended_windows
+from ..events.events import press_event
+from ..npm.npm import lib_deps, versioned
+from ..props.props import LiteralProps
+
+
+def selection_keys_spec(keys: rx.Var) -> list[rx.Var[list[str]]]:
+    """Send a HeroUI selection (a ``Set`` of keys, or ``"all"``) as a list of keys.
+
+    Args:
+        keys: The selection passed to ``onSelectionChange``.
+
+    Returns:
+        The selected keys as a list, ``["all"]`` when everything is selected.
+    """
+    return [
+        rx.Var(
+            _js_expr=f'({keys} === "all" ? ["all"] : Array.from({keys}))',
+            _var_type=list[str],
+        )
+    ]
+
+
+def render_items(
+    item_component: type[rx.Component],
+    items: rx.Var[list[dict[str, Any]]],
+    key_field: str = "key",
+    label_field: str = "label",
+    window_offset: Optional[rx.Var[int]] = None,
+) -> rx.Component:
+    """Render a state list of options as collection items with ``rx.foreach``.
+
+    Args:
+        item_component: The item component class (e.g. ``ListboxItem``).
+        items: A state var holding the options, one dict per option.
+        key_field: The field holding the unique key of an option.
+        label_field: The field holding the text shown for an option.
+        window_offset: A state var holding the offset of ``items`` when it only
+            holds the latest window of the options; see ``appended_windows``.
+
+    Returns:
+        The foreach component rendering one item per option.
+    """
+    if window_offset is not None:
+        items = appended_windows(items, window_offset)
+    return rx.foreach(
+        items,
+        lambda item: item_component.create(
+            item[label_field],
+            key=item[key_field],
+            text_value=item[label_field],
+        ),
+    )
+
+
+class Listbox(LiteralProps, rx.Component):
+    """A list of options that can be selected, with optional virtualization.
+
+    Attributes:
+        library: The library the component belongs to.
+        lib_dependencies: Dependencies required by the component.
+        tag: The tag name for the component.
+        variant: The visual style variant of the items.
+        color: The color scheme of the items.
+        selection_mode: Whether single or multiple items can be selected.
+        selected_keys: The keys of the selected items (controlled).
+        default_selected_keys: The keys of the initially selected items.
+        disabled_keys: The keys of the disabled items.
+        disallow_empty_selection: Whether the selection must always contain an item.
+        should_highlight_on_focus: Whether to highlight items on focus.
+        auto_focus: Whether to focus the first or last item on mount.
+        should_focus_wrap: Whether keyboard focus wraps around the list.
+        top_content: Content to display above the items.
+        bottom_content: Content to display below the items.
+        empty_content: Content to display when there are no items.
+        hide_empty_content: Whether to hide the empty content.
+        hide_selected_icon: Whether to hide the check icon of selected items.
+        is_virtualized: Whether to only mount the items in view.
+        virtualization: The ``maxListboxHeight`` and ``itemHeight`` used when virtualized.
+        disable_animation: Whether to disable animations.
+        on_selection_change: Event handler called with the list of selected keys.
+        on_action: Event handler called with the key of the pressed item.
+    """
+
+    library = versioned("@heroui/listbox")
+    lib_dependencies: list = lib_deps
+    tag = "Listbox"
+
+    # Collection children (items, header, body) must stay direct children.
+    _memoization_mode = MemoizationMode(recursive=False)
+
+    # Props
+    variant: rx.Var[
+        Literal["solid", "bordered", "light", "flat", "faded", "shadow"]
+    ] = "solid"
+    color: rx.Var[
+        Literal["default", "primary", "secondary", "success", "warning", "danger"]
+    ] = "default"
+    selection_mode: rx.Var[Literal["none", "single", "multiple"]] = "none"
+    selected_keys: rx.Var[Optional[list[str]]]
+    default_selected_keys: rx.Var[Optional[list[str]]]
+    disabled_keys: rx.Var[Optional[list[str]]]
+    disallow_empty_selection: rx.Var[bool] = False
+    should_highlight_on_focus: rx.Var[bool] = False
+    auto_focus: rx.Var[Union[bool, Literal["first", "last"]]] = False
+    should_focus_wrap: rx.Var[bool] = False
+    top_content: rx.Var[Optional[Any]]
+    bottom_content: rx.Var[Optional[Any]]
+    empty_content: rx.Var[Optional[Any]]
+    hide_empty_content: rx.Var[bool] = False
+    hide_selected_icon: rx.Var[bool] = False
+    is_virtualized: rx.Var[bool] = False
+    virtualization: rx.Var[Optional[dict[str, int]]]
+    disable_animation: rx.Var[bool] = False
+
+    # Events
+    on_selection_change: rx.EventHandler[selection_keys_spec]
+    on_action: rx.EventHandler[lambda key: [key]]
+
+    @classmethod
+    def create(
+        cls,
+        *children,
+        items: Optional[rx.Var[list[dict[str, Any]]]] = None,
+        key_field: str = "key",
+        label_field: str = "label",
+        window_offset: Optional[rx.Var[int]] = None,
+        max_listbox_height: Optional[int] = None,
+        item_height: Optional[int] = None,
+        **props,
+    ) -> rx.Component:
+        """Create a Listbox, optionally rendering its items from a state list.
+
+        Args:
+            *children: The items of the listbox.
+            items: A state var holding the options, rendered with ``rx.foreach``.
+            key_field: The field holding the unique key of an option.
+            label_field: The field holding the text shown for an option.
+            window_offset: With ``items`` holding only the latest window of the
+                options (as ``OptionsState.options`` does), the offset of that
+                window; the windows are appended in the browser.
+            max_listbox_height: The height of the list when virtualized, in pixels.
+            item_height: The height of a single item when virtualized, in pixels.
+            **props: The props of the component.
+
+        Returns:
+            The Listbox component.
+        """
+        if items is not None:
+            children = (
+                *children,
+                render_items(ListboxItem, items, key_field, label_field, window_offset),
+            )
+        virtualization = {
+            name: value
+            for name, value in (
+                ("maxListboxHeight", max_listbox_height),
+                ("itemHeight", item_height),
+            )
+            if value is not None
+        }
+        if virtualization:
+            props.setdefault("virtualization", virtualization)
+        return super().create(*children, **props)
+
+
+class ListboxItem(LiteralProps, rx.Component):
+    """A single option of a Listbox.
+
+    Attributes:
+        library: The library the component belongs to.
+        lib_dependencies: Dependencies required by the component.
+        tag: The tag name for the component.
+        text_value: The plain text of the item, used for typeahead and accessibility.
+        description: The description text of the item.
+        shortcut: The keyboard shortcut shown next to the item.
+        start_content: Content to display at the start of the item.
+        end_content: Content to display at the end of the item.
+        show_divider: Whether to show a divider below the item.
+        is_disabled: Whether the item is disabled.
+        is_read_only: Whether the item is read-only.
+        on_press: Event handler called when the item is pressed.
+    """
+
+    library = versioned("@heroui/listbox")
+    lib_dependencies: list = lib_deps
+    tag = "ListboxItem"
+
+    # Props
+    text_value: rx.Var[Optional[str]]
+    description: rx.Var[Optional[Any]]
+    shortcut: rx.Var[Optional[Any]]
+    start_content: rx.Var[Optional[Any]]
+    end_content: rx.Var[Optional[Any]]
+    show_divider: rx.Var[bool] = False
+    is_disabled: rx.Var[bool] = False
+    is_read_only: rx.Var[bool] = False
+
+    # Events
+    on_press: rx.EventHandler[press_event]
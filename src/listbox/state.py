@@ -0,0 +1,72 @@
+import reflex as rx
+from typing import Any, ClassVar
+
+
+class OptionsState(rx.State, mixin=True):
+    """Serves a large option list to a Select or Listbox one window at a time.
+
+    Only the latest window is part of the state sent to the browser, which
+    appends it to the options it already has, so each load costs one window on
+    the wire. Either call ``_set_all_options`` or override ``_fetch_options`` to
+    read from a database.
+
+    Example:
+        class SkuState(hero.OptionsState, rx.State):
+            def _fetch_options(self, offset, limit):
+                return db.skus(offset=offset, limit=limit)
+
+        hero.select(items=SkuState.options, window_offset=SkuState.options_offset,
+                    on_load_more=SkuState.load_more, has_more=SkuState.has_more,
+                    is_virtualized=True)
+
+    Attributes:
+        options: The latest window of options, one dict per option.
+        options_offset: The index of the first option of the window.
+        has_more: Whether more options can be loaded.
+        page_size: How many options are loaded per window.
+    """
+
+    options: list[dict[str, Any]] = []
+    options_offset: int = 0
+    has_more: bool = True
+
+    _all_options: list[dict[str, Any]] = []
+    _loaded: int = 0
+
+    page_size: ClassVar[int] = 200
+
+    def _fetch_options(self, offset: int, limit: int) -> list[dict[str, Any]]:
+        """Fetch a window of options; override to load them from elsewhere.
+
+        Args:
+            offset: The index of the first option to return.
+            limit: The maximum number of options to return.
+
+        Returns:
+            The options of the window.
+        """
+        return self._all_options[offset : offset + limit]
+
+    def _set_all_options(self, options: list[dict[str, Any]]):
+        """Keep the full option list on the server and send the first window.
+
+        Args:
+            options: All options, one dict per option.
+        """
+        self._all_options = list(options)
+        self.reset_options()
+
+    def reset_options(self):
+        """Start the options over from the first window, e.g. in ``on_load``."""
+        self._loaded = 0
+        self.has_more = True
+        self.load_more()
+
+    @rx.event
+    def load_more(self):
+        """Send the next window of options."""
+        window = self._fetch_options(self._loaded, self.page_size)
+        self.options = window
+        self.options_offset = self._loaded
+        self._loaded += len(window)
+        self.has_more = len(window) == self.page_size
@@ -0,0 +1,3 @@
+from .loading import BackgroundTasks, LoadingBoundary, background_event
+
+loading_boundary = LoadingBoundary.create
@@ -0,0 +1,268 @@
+import functools
+import inspect
+from typing import Any, Callable, Optional, Union
+
+import reflex as rx
+from reflex.event import EventHandler
+from reflex.utils.format import format_event_handler
+from reflex.utils.imports import ImportVar
+from ..spinner.spinner import Spinner
+
+
+# Tracks which event handlers are in flight from the events the client already
+# exchanges with the backend: Reflex sends one event at a time, and the update
+# marked ``final`` ends it. Installed once, by wrapping the socket's ``emit``.
+# Background tasks get that update right away, so they stay pending until the
+# server counts them in ``BackgroundTasks.finished``.
+PENDING_EVENTS = """
+const heroPending = (() => {
+  if (typeof window === "undefined") return null;
+  if (window.__heroPending) return window.__heroPending;
+  const counts = new Map();
+  const listeners = new Set();
+  const background = new Set();
+  const seen = new Map();
+  let current = null;
+  const notify = () => listeners.forEach((listener) => listener());
+  const settle = () => {
+    if (current === null) return;
+    if (!background.has(current)) counts.set(current, counts.get(current) - 1);
+    current = null;
+    notify();
+  };
+  const emit = Socket.prototype.emit;
+  Socket.prototype.emit = function (name, ...args) {
+    if (name === "event") {
+      if (!this.__heroPending) {
+        this.__heroPending = true;
+        this.on("event", (update) => update.final && settle());
+        this.on("disconnect", () => {
+          counts.clear();
+          current = null;
+          notify();
+        });
+      }
+      settle();
+      current = args[0]?.name ?? null;
+      counts.set(current, (counts.get(current) ?? 0) + 1);
+      notify();
+    }
+    return emit.call(this, name, ...args);
+  };
+  return (window.__heroPending = {
+    subscribe: (listener) => {
+      listeners.add(listener);
+      return () => listeners.delete(listener);
+    },
+    isPending: (names) => names.some((name) => (counts.get(name) ?? 0) > 0),
+    trackBackground: (names) => names.forEach((name) => background.add(name)),
+    finish: (totals) => {
+      let changed = false;
+      background.forEach((name) => {
+        const total = totals?.[name] ?? 0;
+        const done = total - (seen.get(name) ?? total);
+        seen.set(name, total);
+        if (done > 0 && counts.get(name)) {
+          counts.set(name, Math.max(0, counts.get(name) - done));
+          changed = true;
+        }
+      });
+      if (changed) notify();
+    },
+  });
+})();
+
+function HeroLoadingBoundary({ events, background, finished, fallback, children }) {
+  if (background) heroPending?.trackBackground(background);
+  useEffect(() => {
+    if (background) heroPending?.finish(finished);
+  }, [background, finished]);
+  const pending = useSyncExternalStore(
+    heroPending?.subscribe ?? (() => () => {}),
+    () => heroPending?.isPending(events) ?? false,
+    () => false
+  );
+  return jsx(
+    Fragment,
+    {},
+    pending ? fallback : null,
+    jsx("div", { style: { display: pending ? "none" : "contents" } }, children)
+  );
+}"""
+
+
+class BackgroundTasks(rx.State):
+    """How many times each tracked background task has finished, per client.
+
+    Attributes:
+        finished: The number of finished runs, by full event handler name.
+    """
+
+    finished: dict[str, int] = {}
+
+
+# Set on the functions wrapped by ``background_event``.
+_TRACKED_MARKER = "_heroui_tracked_background"
+
+
+async def _finish(state: Any, name: str):
+    """Count a finished run of a background task for the loading boundaries.
+
+    Args:
+        state: The state proxy the task ran against.
+        name: The name of the task's method.
+    """
+    async with state:
+        tasks = await state.get_state(BackgroundTasks)
+        key = f"{state.get_full_name()}.{name}"
+        tasks.finished = {**tasks.finished, key: tasks.finished.get(key, 0) + 1}
+
+
+def background_event(fn: Callable) -> Any:
+    """Declare a background event handler that loading boundaries can wait for.
+
+    Use it in place of ``@rx.event(background=True)``. When the task exits, by
+    returning or raising, a final state update tells the boundaries waiting on
+    it that it is done.
+
+    Example:
+        class ReportState(rx.State):
+            @hero.background_event
+            async def build(self):
+                rows = await slow_query()
+                async with self:
+                    self.rows = rows
+
+    Args:
+        fn: The async function or async generator of the task.
+
+    Returns:
+        The background event handler.
+
+    Raises:
+        TypeError: If ``fn`` is not async.
+    """
+    if inspect.isasyncgenfunction(fn):
+
+        @functools.wraps(fn)
+        async def task(self, *args, **kwargs):
+            try:
+                async for update in fn(self, *args, **kwargs):
+                    yield update
+            finally:
+                await _finish(self, fn.__name__)
+
+    elif inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def task(self, *args, **kwargs):
+            try:
+                return await fn(self, *args, **kwargs)
+            finally:
+                await _finish(self, fn.__name__)
+
+    else:
+        raise TypeError("Background tasks must be async functions or generators.")
+    setattr(task, _TRACKED_MARKER, True)
+    return rx.event(task, background=True)
+
+
+class LoadingBoundary(rx.Component):
+    """Shows a fallback in place of a region while given event handlers run.
+
+    The pending status comes from the events the client already sends and
+    receives, so no loading flag is added to state and nothing outside the
+    boundary re-renders. The children stay mounted (hidden) while pending.
+
+    Regular handlers are covered until their last update, including the ones
+    they ``yield``. Background tasks must be declared with ``background_event``,
+    whose final update marks them done.
+
+    Attributes:
+        tag: The tag name for the component.
+        events: The full names of the event handlers to wait for.
+        background: The names among ``events`` of background tasks.
+        finished: The finished runs of each background task.
+        fallback: The content shown while one of them is pending.
+    """
+
+    tag = "HeroLoadingBoundary"
+
+    events: rx.Var[list[str]]
+    background: rx.Var[Optional[list[str]]]
+    finished: rx.Var[Optional[dict[str, int]]]
+    fallback: rx.Var[Optional[Any]]
+
+    @classmethod
+    def create(
+        cls,
+        *children,
+        on: Union[EventHandler, list[EventHandler]],
+        fallback: Optional[rx.Component] = None,
+        **props,
+    ) -> rx.Component:
+        """Create a loading boundary around the given children.
+
+        Args:
+            *children: The region replaced while loading.
+            on: The event handler, or handlers, to wait for.
+            fallback: The content shown while loading; defaults to a spinner.
+            **props: The props of the component.
+
+        Returns:
+            The LoadingBoundary component.
+
+        Raises:
+            TypeError: If ``on`` is not an event handler.
+            ValueError: If a background task is not declared with
+                ``background_event``.
+        """
+        handlers = on if isinstance(on, (list, tuple)) else [on]
+        if not all(isinstance(handler, EventHandler) for handler in handlers):
+            raise TypeError(
+                "hero.loading_boundary(on=...) takes state event handlers, "
+                "e.g. on=State.load."
+            )
+        background = []
+        for handler in handlers:
+            if not handler.is_background:
+                continue
+            if not getattr(handler.fn, _TRACKED_MARKER, False):
+                raise ValueError(
+                    f"{handler.fn.__qualname__} is a background task: declare it "
+                    "with @hero.background_event for loading boundaries to see "
+                    "it finish."
+                )
+            background.append(format_event_handler(handler))
+        if background:
+            props.update(background=background, finished=BackgroundTasks.finished)
+        return super().create(
+            *children,
+            events=[format_event_handler(handler) for handler in handlers],
+            fallback=fallback if fallback is not None else Spinner.create(),
+            **props,
+        )
+
+    def add_imports(self) -> dict[str, list[ImportVar]]:
+        """Add the imports for the component.
+
+        Returns:
+            The socket class wrapped to track events, and the React hooks.
+        """
+        return {
+            "react": [
+                ImportVar(tag="Fragment"),
+                ImportVar(tag="useEffect"),
+                ImportVar(tag="useSyncExternalStore"),
+            ],
+            # Already a dependency of Reflex, never installed separately.
+            "socket.io-client": [ImportVar(tag="Socket", install=False)],
+        }
+
+    def add_custom_code(self) -> list[str]:
+        """Define the component and the event tracker next to the page.
+
+        Returns:
+            The code of the component.
+        """
+        return [PENDING_EVENTS]
@@ -0,0 +1 @@
+from .npm import PACKAGE_VERSIONS, lib_deps, versioned, used_packages
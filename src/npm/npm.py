@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import Iterable, Union
+
+import reflex as rx
+from reflex.utils.format import format_library_name
+
+
+# The npm packages the components use, as caret ranges on the release lines of
+# HeroUI 2.7: patches and minor releases are picked up, majors are not. Bump these
+# together when moving to a new HeroUI version.
+PACKAGE_VERSIONS: dict[str, str] = {
+    "@heroui/theme": "^2.4.0",
+    "@heroui/system": "^2.4.0",
+    "framer-motion": "^11.18.0",
+    "@heroui/alert": "^2.2.0",
+    "@heroui/autocomplete": "^2.3.0",
+    "@heroui/avatar": "^2.2.0",
+    "@heroui/badge": "^2.2.0",
+    "@heroui/button": "^2.2.0",
+    "@heroui/card": "^2.2.0",
+    "@heroui/checkbox": "^2.3.0",
+    "@heroui/chip": "^2.2.0",
+    "@heroui/code": "^2.2.0",
+    "@heroui/form": "^2.1.0",
+    "@heroui/image": "^2.2.0",
+    "@heroui/input": "^2.4.0",
+    "@heroui/listbox": "^2.3.0",
+    "@heroui/radio": "^2.3.0",
+    "@heroui/select": "^2.4.0",
+    "@heroui/snippet": "^2.2.0",
+    "@heroui/spacer": "^2.2.0",
+    "@heroui/spinner": "^2.2.0",
+    "@heroui/switch": "^2.2.0",
+    "@heroui/table": "^2.2.0",
+    "@heroui/use-infinite-scroll": "^2.2.0",
+}
+
+
+def versioned(package: str) -> str:
+    """Get the install spec of an npm package, including its version range.
+
+    Args:
+        package: The package name, e.g. ``"@heroui/button"``.
+
+    Returns:
+        The package with its version, e.g. ``"@heroui/button@^2.2.0"``.
+
+    Raises:
+        KeyError: If the package is not in the manifest.
+    """
+    return f"{package}@{PACKAGE_VERSIONS[package]}"
+
+
+# The packages every HeroUI component needs next to its own.
+lib_deps: list[str] = [
+    versioned("@heroui/theme"),
+    versioned("@heroui/system"),
+    versioned("framer-motion"),
+]
+
+
+def used_packages(
+    app_or_pages: Union[rx.App, Iterable[rx.Component]],
+) -> list[str]:
+    """Find the minimal set of HeroUI npm packages an app renders.
+
+    Every page is evaluated and the packages its components import or declare as
+    dependencies are collected, so packages of components that are never
+    rendered are left out. Pass the result to ``frontend_packages`` (after
+    removing any blanket ``@heroui/react``) to keep ``.web`` installs minimal.
+
+    Args:
+        app_or_pages: The app, or the page components to analyze.
+
+    Returns:
+        The sorted install specs of the ``@heroui/*`` and ``framer-motion``
+        packages used, with their version ranges.
+    """
+    from reflex.compiler.compiler import into_component
+
+    if isinstance(app_or_pages, rx.App):
+        pages = [
+            into_component(page.component)
+            for page in app_or_pages._unevaluated_pages.values()
+        ]
+    else:
+        pages = list(app_or_pages)
+
+    packages = set()
+    for page in pages:
+        for library, import_vars in page._get_all_imports().items():
+            name = format_library_name(library)
+            if not (name.startswith("@heroui/") or name == "framer-motion"):
+                continue
+            if any(import_var.install for import_var in import_vars):
+                packages.add(versioned(name) if name in PACKAGE_VERSIONS else library)
+    return sorted(packages)
@@ -0,0 +1 @@
+from .props import LiteralProps, literal_table, literal_var
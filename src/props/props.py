@@ -0,0 +1,155 @@
+import functools
+import os
+from typing import Any, NamedTuple, get_args
+
+import reflex as rx
+from reflex.constants import Env
+from reflex.environment import environment
+from reflex.utils import types
+from reflex.vars import LiteralVar
+
+
+def _default_validation() -> bool:
+    """Validate props unless disabled, or running a production build."""
+    default = "0" if environment.REFLEX_ENV_MODE.get() == Env.PROD else "1"
+    return os.environ.get("HEROUI_VALIDATE_PROPS", default) != "0"
+
+
+# Whether values of Literal props are checked; set ``HEROUI_VALIDATE_PROPS``.
+VALIDATE_PROPS = _default_validation()
+
+# Plain values looked up in the tables; bools are left out as ``True == 1``.
+_PLAIN_TYPES = (str, int, float)
+
+
+def _literal_values(hint: Any) -> tuple[tuple, bool]:
+    """Get the values of the Literals in a type hint.
+
+    Args:
+        hint: The type hint of a prop.
+
+    Returns:
+        The Literal values, and whether they are the only values allowed besides
+        None (``False`` for e.g. ``Union[Literal["px"], str]``).
+    """
+    if types.is_literal(hint):
+        return get_args(hint), True
+    if not types.is_union(hint):
+        return (), False
+    values, closed = [], True
+    for arg in get_args(hint):
+        if arg is type(None):
+            continue
+        nested, nested_closed = _literal_values(arg)
+        values.extend(nested)
+        closed = closed and nested_closed
+    return tuple(values), closed
+
+
+class LiteralTable(NamedTuple):
+    """The allowed values of a Literal prop.
+
+    Attributes:
+        vars: The var of each Literal value, built once.
+        closed: Whether other values are invalid, rather than left to Reflex.
+    """
+
+    vars: dict[Any, rx.Var]
+    closed: bool
+
+
+@functools.cache
+def literal_table(component: type[rx.Component]) -> dict[str, LiteralTable]:
+    """Build the tables of a component's Literal props, once per class.
+
+    Args:
+        component: The component class.
+
+    Returns:
+        The table of each prop whose type includes a Literal, by prop name.
+    """
+    tables = {}
+    for name, field in component.get_fields().items():
+        if field.type_origin is not rx.Var:
+            continue
+        hint = get_args(types.get_field_type(component, name))[0]
+        values, closed = _literal_values(hint)
+        if values:
+            tables[name] = LiteralTable(
+                {value: LiteralVar.create(value) for value in values}, closed
+            )
+    return tables
+
+
+def literal_var(component: type[rx.Component], prop: str, value: Any) -> Any:
+    """Get the var of a plain value of a Literal prop from the tables.
+
+    Args:
+        component: The component class.
+        prop: The name of the prop.
+        value: The value given to the prop.
+
+    Returns:
+        The var of the value, or None if the prop is not a Literal one or the
+        value is left to Reflex.
+
+    Raises:
+        TypeError: If the prop is given a value it does not allow.
+    """
+    table = literal_table(component).get(prop)
+    if table is None or type(value) not in _PLAIN_TYPES:
+        return None
+    var = table.vars.get(value)
+    if var is not None:
+        return var
+    if not table.closed:
+        return None
+    if VALIDATE_PROPS:
+        allowed = ", ".join(repr(v) for v in table.vars)
+        raise TypeError(
+            f"Invalid value {value!r} for prop {component.__name__}.{prop},"
+            f" expected one of {allowed}."
+        )
+    return LiteralVar.create(value)
+
+
+class LiteralProps:
+    """Mixin checking Literal props against precomputed tables.
+
+    Reflex checks every prop value against its type hint and wraps it in a new
+    var on each ``create``. For Literal props (``variant``, ``color``, ``size``,
+    ...) given plain values, this looks the value up in ``literal_table`` instead
+    and reuses the var built for it, skipping Reflex's check. Other values, such
+    as state vars or values of props that also take free-form strings, go through
+    Reflex as usual.
+
+    Validation is on unless ``HEROUI_VALIDATE_PROPS=0`` is set or Reflex runs in
+    production mode; values are still passed through when it is off.
+
+    The names of the props passed to ``create`` are kept in ``_explicit_props``,
+    so Provider defaults only fill the props a call site left out.
+    """
+
+    _explicit_props: frozenset[str] = frozenset()
+
+    def _post_init(self, *args, **kwargs):
+        """Set the Literal props from the tables, then initialize the rest.
+
+        Args:
+            *args: Args to initialize the component.
+            **kwargs: Kwargs to initialize the component.
+
+        Raises:
+            TypeError: If a Literal prop is given a value it does not allow.
+        """
+        self._explicit_props = frozenset(kwargs.keys() - {"children"})
+        known = {}
+        for key in literal_table(type(self)).keys() & kwargs.keys():
+            var = literal_var(type(self), key, kwargs[key])
+            if var is not None:
+                known[key] = var
+        for key in known:
+            del kwargs[key]
+        super()._post_init(*args, **kwargs)
+        for key, var in known.items():
+            setattr(self, key, var)
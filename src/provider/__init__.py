@@ -1,7 +1,15 @@
-from .provider import Provider
+from .critical import inline_critical_css
+from .provider import LazyMotion, Provider
 
 # Export the Provider creator function
 provider = Provider.create
+lazy_motion = LazyMotion.create
 
 # Export these explicitly for usage in rxconfig.py
-__all__ = ["Provider", "provider"]
+__all__ = [
+    "LazyMotion",
+    "Provider",
+    "inline_critical_css",
+    "lazy_motion",
+    "provider",
+]
@@ -0,0 +1,227 @@
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from reflex import constants
+from reflex.utils.prerequisites import get_web_dir
+
+
+# Name of the <meta> a Provider adds to the page head to opt into critical CSS.
+CRITICAL_CSS_MARKER = "heroui-critical-css"
+
+# Toggled on <html> by the color mode script, so never in the prerendered markup.
+_COLOR_MODE_CLASSES = frozenset({"dark", "light"})
+
+# At-rules whose body is a list of rules to filter like the top level.
+_GROUPING_RULES = frozenset({"media", "supports", "layer", "container", "document"})
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_STRING_RE = re.compile(r"\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*'")
+_NOT_RE = re.compile(r":not\([^()]*\)")
+_CLASS_RE = re.compile(r"\.((?:[\w-]|\\[0-9a-fA-F]{1,6} ?|\\[^\n0-9a-fA-F])+)")
+_ESCAPE_RE = re.compile(r"\\([0-9a-fA-F]{1,6}) ?|\\(.)")
+_AT_RULE_RE = re.compile(r"@(-?[\w-]+)")
+_KEYFRAMES_RE = re.compile(r"@(?:-\w+-)?keyframes\s+([\w-]+)")
+_LINK_RE = re.compile(r"<link\b[^>]*>", re.IGNORECASE)
+_ATTR_RE = re.compile(r"""([\w-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""")
+
+
+class _PageScanner(HTMLParser):
+    """Collects the class names and the opt-in marker of a prerendered page."""
+
+    def __init__(self):
+        super().__init__()
+        self.classes: set[str] = set(_COLOR_MODE_CLASSES)
+        self.opted_in = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]):
+        attributes = dict(attrs)
+        self.classes.update((attributes.get("class") or "").split())
+        if tag == "meta" and attributes.get("name") == CRITICAL_CSS_MARKER:
+            self.opted_in = True
+
+
+def _blocks(css: str) -> Iterator[tuple[str, Optional[str]]]:
+    """Split a stylesheet into its top-level rules.
+
+    Args:
+        css: The stylesheet, without comments.
+
+    Yields:
+        The prelude and body of each rule; the body is None for statements such
+        as ``@charset``.
+    """
+    depth = start = open_at = 0
+    quote = None
+    for i, char in enumerate(css):
+        if quote:
+            if char == quote and css[i - 1] != "\\":
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "{":
+            if depth == 0:
+                open_at = i
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                yield css[start:open_at].strip(), css[open_at + 1 : i]
+                start = i + 1
+        elif char == ";" and depth == 0:
+            yield css[start:i].strip(), None
+            start = i + 1
+
+
+def _selectors(prelude: str) -> list[str]:
+    """Split a selector list on the commas outside parentheses and brackets."""
+    selectors, depth, start = [], 0, 0
+    for i, char in enumerate(prelude):
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            selectors.append(prelude[start:i].strip())
+            start = i + 1
+    selectors.append(prelude[start:].strip())
+    return selectors
+
+
+def _class_names(selector: str) -> set[str]:
+    """Get the class names a selector requires, unescaped."""
+    selector = _NOT_RE.sub("", _STRING_RE.sub('""', selector))
+    return {
+        _ESCAPE_RE.sub(lambda m: chr(int(m[1], 16)) if m[1] else m[2], name)
+        for name in _CLASS_RE.findall(selector)
+    }
+
+
+def _filter(css: str, classes: set[str], keyframes: dict[str, str]) -> str:
+    """Keep the rules of a stylesheet that apply to a page's markup.
+
+    Rules without class selectors (resets, ``:root`` variables, font faces) are
+    always kept. Keyframes are set aside in ``keyframes`` by name.
+
+    Args:
+        css: The stylesheet, without comments.
+        classes: The class names used by the page.
+        keyframes: Collects the keyframes rules, by animation name.
+
+    Returns:
+        The critical subset of the stylesheet.
+    """
+    kept = []
+    for prelude, body in _blocks(css):
+        if body is None:
+            kept.append(f"{prelude};")
+        elif prelude.startswith("@"):
+            match = _KEYFRAMES_RE.match(prelude)
+            if match:
+                keyframes[match[1]] = f"{prelude}{{{body}}}"
+                continue
+            name = _AT_RULE_RE.match(prelude)
+            if name and name[1].lower() in _GROUPING_RULES:
+                inner = _filter(body, classes, keyframes)
+                if inner:
+                    kept.append(f"{prelude}{{{inner}}}")
+            else:
+                kept.append(f"{prelude}{{{body}}}")
+        else:
+            selectors = [s for s in _selectors(prelude) if _class_names(s) <= classes]
+            if selectors:
+                kept.append(f"{','.join(selectors)}{{{body}}}")
+    return "".join(kept)
+
+
+def critical_css(css: str, classes: set[str]) -> str:
+    """Extract the rules of a stylesheet needed to render a page's markup.
+
+    Args:
+        css: The full stylesheet.
+        classes: The class names used by the page.
+
+    Returns:
+        The critical CSS, including the keyframes its animations use.
+    """
+    keyframes: dict[str, str] = {}
+    critical = _filter(_COMMENT_RE.sub("", css), classes, keyframes)
+    used = [rule for name, rule in keyframes.items() if name in critical]
+    return critical + "".join(used)
+
+
+def _stylesheet_path(root: Path, href: str) -> Optional[Path]:
+    """Find the file behind a stylesheet URL, with or without a base path."""
+    href = href.split("?", 1)[0].split("#", 1)[0]
+    if "://" in href:
+        return None
+    parts = Path(href.lstrip("/")).parts
+    for i in range(len(parts)):
+        path = root.joinpath(*parts[i:])
+        if path.is_file():
+            return path
+    return None
+
+
+def inline_critical_css(
+    export_dir: Union[str, Path, None] = None,
+) -> dict[str, tuple[int, int]]:
+    """Inline the critical CSS of exported pages and defer their stylesheets.
+
+    Run it after ``reflex export --frontend-only --no-zip``. Only the pages whose
+    ``hero.provider`` was created with ``critical_css=True`` are changed: the
+    rules their prerendered markup needs go in a ``<style>`` in the head, and the
+    full stylesheets load without blocking the first paint.
+
+    Args:
+        export_dir: The static export to process, ``.web/_static`` by default.
+
+    Returns:
+        The size of the inlined CSS and of the full stylesheets, in bytes, by
+        HTML file relative to ``export_dir``.
+    """
+    root = Path(export_dir or get_web_dir() / constants.Dirs.STATIC)
+    stylesheets: dict[Path, str] = {}
+    sizes = {}
+    for page in sorted(root.rglob("*.html")):
+        html = page.read_text(encoding="utf-8")
+        scanner = _PageScanner()
+        scanner.feed(html)
+        if not scanner.opted_in or "data-heroui-critical" in html:
+            continue
+
+        links = []
+        for tag in _LINK_RE.findall(html):
+            attrs = {m[1].lower(): m[2] or m[3] or m[4] for m in _ATTR_RE.finditer(tag)}
+            if attrs.get("rel", "").lower() != "stylesheet" or "media" in attrs:
+                continue
+            path = _stylesheet_path(root, attrs.get("href", ""))
+            if path is not None:
+                links.append((tag, path))
+        if not links:
+            continue
+
+        css = ""
+        for _, path in links:
+            if path not in stylesheets:
+                stylesheets[path] = path.read_text(encoding="utf-8")
+            css += stylesheets[path]
+        critical = critical_css(css, scanner.classes)
+
+        for tag, _ in links:
+            deferred = tag.replace(
+                "<link", '<link media="print" onload="this.media=\'all\'"', 1
+            )
+            html = html.replace(tag, f"{deferred}<noscript>{tag}</noscript>", 1)
+        html = html.replace(
+            '<link media="print"',
+            f'<style data-heroui-critical>{critical}</style><link media="print"',
+            1,
+        )
+        page.write_text(html, encoding="utf-8")
+        sizes[str(page.relative_to(root))] = (
+            len(critical.encode()),
+            len(css.encode()),
+        )
+    return sizes
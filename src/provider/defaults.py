@@ -0,0 +1,379 @@
+import importlib
+from typing import Any, Optional
+
+import reflex as rx
+from reflex.components.component import LiteralComponentVar
+from reflex.utils.format import to_snake_case
+from reflex.vars.base import LiteralVar, Var
+
+from ..props.props import literal_var
+
+
+# The defaults HeroUI itself applies, keyed by the ``hero`` factory name. Props
+# equal to these are not emitted, which also lets Provider-wide settings such as
+# ``disable_animation`` and ``validation_behavior`` reach every component.
+# Only props whose library default is fixed (not derived from the theme) belong here;
+# ``is_virtualized`` is left out as unset means "when the list is long", and
+# ``has_more`` as the collection components read it themselves.
+LIBRARY_DEFAULTS: dict[str, dict[str, Any]] = {
+    "alert": {
+        "color": "default",
+        "variant": "flat",
+        "radius": "md",
+        "is_closable": False,
+        "hide_icon": False,
+        "hide_icon_wrapper": False,
+    },
+    "avatar": {
+        "color": "default",
+        "size": "md",
+        "radius": "full",
+        "variant": "solid",
+        "img_component": "img",
+        "is_bordered": False,
+        "is_disabled": False,
+        "is_focusable": False,
+        "show_fallback": False,
+        "disable_animation": False,
+    },
+    "avatar_group": {
+        "max": 5,
+        "is_grid": False,
+        "is_bordered": False,
+        "is_disabled": False,
+        "disable_animation": False,
+    },
+    "autocomplete": {
+        "color": "default",
+        "variant": "flat",
+        "size": "md",
+        "label_placement": "inside",
+        "menu_trigger": "focus",
+        "full_width": True,
+        "allows_custom_value": False,
+        "allows_empty_collection": True,
+        "is_clearable": True,
+        "is_loading": False,
+        "is_disabled": False,
+        "is_required": False,
+        "is_invalid": False,
+        "is_read_only": False,
+        "disable_animation": False,
+    },
+    "badge": {
+        "color": "default",
+        "variant": "solid",
+        "size": "md",
+        "shape": "rectangle",
+        "placement": "top-right",
+        "show_outline": True,
+        "disable_outline": False,
+        "disable_animation": False,
+        "is_invisible": False,
+        "is_one_char": False,
+        "is_dot": False,
+    },
+    "button": {
+        "color": "default",
+        "variant": "solid",
+        "size": "md",
+        "spinner_placement": "start",
+        "full_width": False,
+        "is_icon_only": False,
+        "is_disabled": False,
+        "is_loading": False,
+        "disable_ripple": False,
+        "disable_animation": False,
+    },
+    "button_group": {
+        "full_width": False,
+        "is_disabled": False,
+    },
+    "card": {
+        "shadow": "md",
+        "radius": "lg",
+        "full_width": False,
+        "is_hoverable": False,
+        "is_pressable": False,
+        "is_blurred": False,
+        "is_footer_blurred": False,
+        "is_disabled": False,
+        "disable_animation": False,
+        "disable_ripple": False,
+    },
+    "checkbox": {
+        "color": "primary",
+        "size": "md",
+        "line_through": False,
+        "is_disabled": False,
+        "is_invalid": False,
+        "is_required": False,
+        "disable_animation": False,
+    },
+    "checkbox_group": {
+        "color": "primary",
+        "size": "md",
+        "orientation": "vertical",
+        "line_through": False,
+        "is_disabled": False,
+        "is_invalid": False,
+        "is_required": False,
+        "validation_behavior": "native",
+        "disable_animation": False,
+    },
+    "chip": {
+        "color": "default",
+        "variant": "solid",
+        "size": "md",
+        "radius": "full",
+        "is_disabled": False,
+    },
+    "code": {
+        "color": "default",
+        "size": "sm",
+        "radius": "sm",
+        "is_disabled": False,
+    },
+    "image": {
+        "shadow": "none",
+        "is_blurred": False,
+        "is_zoomed": False,
+        "remove_wrapper": False,
+        "disable_skeleton": False,
+    },
+    "input": {
+        "color": "default",
+        "variant": "flat",
+        "size": "md",
+        "type": "text",
+        "label_placement": "inside",
+        "full_width": True,
+        "is_disabled": False,
+        "is_read_only": False,
+        "is_invalid": False,
+        "is_required": False,
+        "is_clearable": False,
+        "auto_focus": False,
+        "disable_animation": False,
+    },
+    "listbox": {
+        "color": "default",
+        "variant": "solid",
+        "selection_mode": "none",
+        "auto_focus": False,
+        "disallow_empty_selection": False,
+        "should_highlight_on_focus": False,
+        "should_focus_wrap": False,
+        "hide_empty_content": False,
+        "hide_selected_icon": False,
+        "disable_animation": False,
+    },
+    "radio": {
+        "color": "primary",
+        "size": "md",
+        "is_disabled": False,
+        "is_invalid": False,
+        "is_required": False,
+    },
+    "radio_group": {
+        "color": "primary",
+        "size": "md",
+        "orientation": "vertical",
+        "is_disabled": False,
+        "is_invalid": False,
+        "is_required": False,
+    },
+    "select": {
+        "color": "default",
+        "variant": "flat",
+        "size": "md",
+        "selection_mode": "single",
+        "label_placement": "inside",
+        "full_width": True,
+        "is_disabled": False,
+        "is_required": False,
+        "is_invalid": False,
+        "is_loading": False,
+        "disable_animation": False,
+    },
+    "snippet": {
+        "color": "default",
+        "variant": "flat",
+        "size": "md",
+        "radius": "lg",
+        "symbol": "$",
+        "timeout": 2000,
+        "disable_tooltip": False,
+        "disable_copy": False,
+        "hide_copy_button": False,
+        "hide_symbol": False,
+        "disable_animation": False,
+    },
+    "spacer": {
+        "x": "1",
+        "y": "1",
+    },
+    "spinner": {
+        "color": "primary",
+        "size": "md",
+    },
+    "switch": {
+        "color": "primary",
+        "size": "md",
+        "is_disabled": False,
+        "disable_animation": False,
+    },
+    "table": {
+        "color": "default",
+        "layout": "auto",
+        "radius": "lg",
+        "shadow": "sm",
+        "selection_mode": "none",
+        "selection_behavior": "toggle",
+        "full_width": True,
+        "hide_header": False,
+        "is_striped": False,
+        "is_compact": False,
+        "is_header_sticky": False,
+        "remove_wrapper": False,
+        "disable_animation": False,
+    },
+    "textarea": {
+        "color": "default",
+        "variant": "flat",
+        "size": "md",
+        "label_placement": "inside",
+        "full_width": True,
+        "cache_measurements": False,
+        "is_required": False,
+        "is_disabled": False,
+        "is_invalid": False,
+        "validation_behavior": "native",
+        "disable_animation": False,
+    },
+}
+
+
+def _static_js(value: Any) -> Optional[str]:
+    """Get the JS expression of a static prop value.
+
+    Args:
+        value: The prop value, either a Var or a plain Python value.
+
+    Returns:
+        The JS expression, or None if the value depends on state or hooks.
+    """
+    var = value if isinstance(value, Var) else LiteralVar.create(value)
+    if var._get_all_var_data() is not None:
+        return None
+    return str(var)
+
+
+def _component_class(name: str) -> Optional[type[rx.Component]]:
+    """Find the HeroUI component class behind a ``hero`` factory name.
+
+    Args:
+        name: The factory name, e.g. ``"card_body"``.
+
+    Returns:
+        The component class, or None if ``name`` is not a component factory.
+    """
+    factory = getattr(importlib.import_module("heroui"), name, None)
+    component = getattr(factory, "__self__", None)
+    if not isinstance(component, type) or not issubclass(component, rx.Component):
+        return None
+    if to_snake_case(component.__name__) != name:
+        return None
+    return component
+
+
+def _resolve_defaults(
+    defaults: dict[str, dict[str, Any]],
+) -> dict[str, dict[str, Var]]:
+    """Check the defaults against the components and turn the values into vars.
+
+    Args:
+        defaults: Default props per component, keyed by ``hero`` factory name.
+
+    Returns:
+        The var of each default value, per component.
+
+    Raises:
+        ValueError: If a name is not a HeroUI component, or a prop is unknown.
+    """
+    resolved = {}
+    for name, props in defaults.items():
+        component = _component_class(name)
+        if component is None:
+            raise ValueError(f"Unknown component {name!r} in defaults.")
+        unknown = set(props) - set(component.get_props())
+        if unknown:
+            raise ValueError(
+                f"Unknown props for {name!r} in defaults: {', '.join(sorted(unknown))}."
+            )
+        resolved[name] = {}
+        for prop, value in props.items():
+            var = literal_var(component, prop, value)
+            resolved[name][prop] = LiteralVar.create(value) if var is None else var
+    return resolved
+
+
+def _heroui_components(component: rx.Component) -> list[rx.Component]:
+    """Collect the HeroUI components below ``component``, including the item
+    templates of ``rx.foreach`` and the components passed as props.
+
+    Args:
+        component: The root of the subtree.
+
+    Returns:
+        The HeroUI components among the descendants of ``component``.
+    """
+    found = []
+    # Item templates of ``rx.foreach`` are children too, but components passed
+    # as props (e.g. ``start_content``) are wrapped in a var.
+    in_props = [
+        value._var_value
+        for prop in component.get_props()
+        if isinstance(value := getattr(component, prop, None), LiteralComponentVar)
+    ]
+    for child in (*component.children, *in_props):
+        if not isinstance(child, rx.Component):
+            continue
+        if child.library and child.library.startswith("@heroui/"):
+            found.append(child)
+        found.extend(_heroui_components(child))
+    return found
+
+
+def apply_defaults(
+    component: rx.Component, defaults: Optional[dict[str, dict[str, Any]]] = None
+) -> rx.Component:
+    """Resolve default props of the HeroUI components below ``component`` at compile time.
+
+    Props the call site did not pass take the value from ``defaults``, then any
+    prop equal to the HeroUI library default is dropped from the output.
+
+    Args:
+        component: The root of the subtree, usually the Provider.
+        defaults: Default props per component, keyed by ``hero`` factory name,
+            e.g. ``{"button": {"radius": "full", "size": "sm"}}``.
+
+    Returns:
+        The same component, updated in place.
+
+    Raises:
+        ValueError: If ``defaults`` names a component or a prop that does not exist.
+        TypeError: If a default is not one of the values a Literal prop allows.
+    """
+    defaults = _resolve_defaults(defaults or {})
+    for target in _heroui_components(component):
+        name = to_snake_case(type(target).__name__)
+        explicit = getattr(target, "_explicit_props", frozenset())
+        for prop, var in defaults.get(name, {}).items():
+            if prop not in explicit:
+                setattr(target, prop, var)
+        for prop, library_default in LIBRARY_DEFAULTS.get(name, {}).items():
+            value = getattr(target, prop, None)
+            if value is not None and _static_js(value) == _static_js(library_default):
+                setattr(target, prop, None)
+    return component
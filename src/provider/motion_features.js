@@ -0,0 +1,5 @@
+// Imported dynamically by LazyMotion, so the bundler puts Framer Motion's DOM
+// animation features in a chunk of their own instead of the page bundle.
+import { domAnimation } from "framer-motion";
+
+export default domAnimation;
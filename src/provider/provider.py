@@ -1,8 +1,61 @@
+import functools
+
 import reflex as rx
-from typing import Literal, Optional
+from reflex.components.base.head import Head
+from typing import Any, Literal, Optional
+from ..npm.npm import versioned
+from .critical import CRITICAL_CSS_MARKER
+from .defaults import apply_defaults
 from .types import SupportedLocales
 
 
+@functools.cache
+def dom_animation_features() -> rx.Var:
+    """Get a loader of framer-motion's DOM animation features.
+
+    The features are re-exported by a module of this package, so the dynamic
+    import gets a chunk of its own: importing ``framer-motion`` itself would
+    resolve to the module the page already loads for ``LazyMotion``. The module
+    is linked into the app's assets on the first call only.
+
+    Returns:
+        A function returning a promise of the features.
+    """
+    module = "$/public" + rx.asset("motion_features.js", shared=True)
+    return rx.Var(_js_expr=f'() => import("{module}").then((mod) => mod.default)')
+
+
+class LazyMotion(rx.Component):
+    """Framer Motion's LazyMotion, which loads animation features asynchronously.
+
+    Attributes:
+        library: The library the component belongs to.
+        tag: The tag name for the component.
+        features: The feature bundle, or a function returning a promise of it.
+        strict: Whether to throw when the full ``motion`` component is rendered inside.
+    """
+
+    library = versioned("framer-motion")
+    tag = "LazyMotion"
+
+    features: rx.Var[Any]
+    strict: rx.Var[bool] = False
+
+    @classmethod
+    def create(cls, *children, **props) -> rx.Component:
+        """Create a LazyMotion, loading the DOM animation features by default.
+
+        Args:
+            *children: The children of the component.
+            **props: The props of the component.
+
+        Returns:
+            The LazyMotion component.
+        """
+        props.setdefault("features", dom_animation_features())
+        return super().create(*children, **props)
+
+
 class Provider(rx.Component):
     """A provider component that manages global HeroUI settings and theme.
 
@@ -17,9 +70,13 @@ class Provider(rx.Component):
         skip_framer_motion_animations: Whether to skip Framer Motion animations.
         validation_behavior: The validation behavior to use (native, aria).
         reduced_motion: How to handle motion reduction for accessibility.
+        lazy_motion: Whether to load framer-motion's animation features lazily
+            (passed to ``create``).
+        critical_css: Whether to inline the page's critical CSS at export
+            (passed to ``create``).
     """
 
-    library = "@heroui/system"
+    library = versioned("@heroui/system")
     tag = "HeroUIProvider"
 
     # Localization
@@ -39,3 +96,50 @@ class Provider(rx.Component):
     # Accessibility
     validation_behavior: Literal["native", "aria"] = "native"
     reduced_motion: Literal["user", "always", "never"] = "user"
+
+    @classmethod
+    def create(
+        cls,
+        *children,
+        lazy_motion: bool = False,
+        critical_css: bool = False,
+        defaults: Optional[dict[str, dict[str, Any]]] = None,
+        **props,
+    ) -> rx.Component:
+        """Create a Provider, optionally loading framer-motion lazily.
+
+        With ``lazy_motion`` the tree is wrapped in a ``LazyMotion`` that fetches the
+        ``domAnimation`` features in a separate chunk after the first render. If
+        animations are disabled globally, the wrapper is left out. framer-motion
+        itself is still bundled either way, as the HeroUI packages import it.
+
+        Default props of the HeroUI components inside are resolved at compile
+        time: ``defaults`` fills props left unset, and props equal to the HeroUI
+        library default are not emitted.
+
+        With ``critical_css`` the page is marked for ``hero.inline_critical_css``,
+        which inlines the CSS its prerendered markup needs after export and defers
+        the full stylesheet.
+
+        Args:
+            *children: The children of the component.
+            lazy_motion: Whether to load the animation features asynchronously.
+            critical_css: Whether to inline the critical CSS of the page at export.
+            defaults: Default props per component, keyed by ``hero`` factory name,
+                e.g. ``{"button": {"radius": "full", "size": "sm"}}``.
+            **props: The props of the component.
+
+        Returns:
+            The Provider component.
+        """
+        animations_off = (
+            props.get("disable_animation") is True
+            or props.get("skip_framer_motion_animations") is True
+        )
+        if lazy_motion and not animations_off:
+            children = (LazyMotion.create(*children),)
+        if critical_css:
+            # next/head moves the marker into the <head> of the prerendered page.
+            marker = Head.create(rx.el.meta(name=CRITICAL_CSS_MARKER))
+            children = (marker, *children)
+        return apply_defaults(super().create(*children, **props), defaults)
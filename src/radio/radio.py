@@ -1,11 +1,11 @@
 import reflex as rx
 from typing import Any, Literal, Optional
+from ..cache.cache import CachedRender
+from ..npm.npm import lib_deps, versioned
+from ..props.props import LiteralProps
 
 
-lib_deps: list = ["@heroui/theme", "@heroui/system", "framer-motion"]
-
-
-class Radio(rx.Component):
+class Radio(LiteralProps, CachedRender, rx.Component):
     """A radio button component that allows users to select a single option from a set.
 
     Attributes:
@@ -24,7 +24,7 @@ class Radio(rx.Component):
         line_through: Whether to apply a line-through style to the label when selected.
     """
 
-    library = "@heroui/radio"
+    library = versioned("@heroui/radio")
     lib_dependencies: list = lib_deps
     tag = "Radio"
 
@@ -43,7 +43,7 @@ class Radio(rx.Component):
     line_through: rx.Var[bool] = False
 
 
-class RadioGroup(rx.Component):
+class RadioGroup(LiteralProps, CachedRender, rx.Component):
     """A group of radio buttons that allows users to select a single option from a set.
 
     Attributes:
@@ -63,7 +63,7 @@ class RadioGroup(rx.Component):
         is_required: Whether the radio group is required.
     """
 
-    library = "@heroui/radio"
+    library = versioned("@heroui/radio")
     lib_dependencies: list = lib_deps
     tag = "RadioGroup"
 
@@ -0,0 +1,4 @@
+from .select import Select, SelectItem
+
+select = Select.create
+select_item = SelectItem.create
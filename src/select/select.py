@@ -0,0 +1,203 @@
+import reflex as rx
+from typing import Any, Literal, Optional
+from reflex.components.tags.tag import Tag
+from reflex.constants.compiler import Hooks, MemoizationMode
+from reflex.event import EventChain, no_args_event_spec
+from reflex.utils.format import format_prop, wrap
+from reflex.utils.imports import ImportVar
+from reflex.vars import get_unique_variable_name
+from reflex.vars.base import VarData
+from ..listbox.listbox import render_items, selection_keys_spec
+from ..npm.npm import lib_deps, versioned
+from ..props.props import LiteralProps
+
+
+class Select(LiteralProps, rx.Component):
+    """A dropdown that lets users pick one or more options from a list.
+
+    Attributes:
+        library: The library the component belongs to.
+        lib_dependencies: Dependencies required by the component.
+        tag: The tag name for the component.
+        variant: The visual style variant of the select.
+        color: The color scheme of the select.
+        size: The size of the select.
+        radius: The border radius of the select.
+        label: The label text of the select.
+        placeholder: The placeholder text shown when nothing is selected.
+        description: The description text of the select.
+        error_message: The error message text of the select.
+        name: The name attribute of the hidden native select element.
+        selection_mode: Whether single or multiple options can be selected.
+        selected_keys: The keys of the selected options (controlled).
+        default_selected_keys: The keys of the initially selected options.
+        disabled_keys: The keys of the disabled options.
+        label_placement: The placement of the label relative to the select.
+        is_disabled: Whether the select is disabled.
+        is_required: Whether the select is required.
+        is_invalid: Whether the select is in an invalid state.
+        is_loading: Whether to show a loading spinner in the listbox.
+        is_virtualized: Whether to only mount the options in view.
+        max_listbox_height: The height of the listbox when virtualized, in pixels.
+        item_height: The height of a single option when virtualized, in pixels.
+        has_more: Whether ``on_load_more`` can provide more options.
+        full_width: Whether the select should take the full width of its container.
+        disable_animation: Whether to disable animations.
+        on_selection_change: Event handler called with the list of selected keys.
+        on_open_change: Event handler called when the listbox opens or closes.
+        on_load_more: Event handler called when the listbox is scrolled near its end.
+    """
+
+    library = versioned("@heroui/select")
+    lib_dependencies: list = [*lib_deps, versioned("@heroui/use-infinite-scroll")]
+    tag = "Select"
+
+    # Collection children (items, header, body) must stay direct children.
+    _memoization_mode = MemoizationMode(recursive=False)
+
+    # Props
+    variant: rx.Var[Literal["flat", "bordered", "faded", "underlined"]] = "flat"
+    color: rx.Var[
+        Literal["default", "primary", "secondary", "success", "warning", "danger"]
+    ] = "default"
+    size: rx.Var[Literal["sm", "md", "lg"]] = "md"
+    radius: rx.Var[Literal["none", "sm", "md", "lg", "full"]]
+    label: rx.Var[Optional[Any]]
+    placeholder: rx.Var[Optional[str]]
+    description: rx.Var[Optional[Any]]
+    error_message: rx.Var[Optional[Any]]
+    name: rx.Var[Optional[str]]
+    selection_mode: rx.Var[Literal["single", "multiple"]] = "single"
+    selected_keys: rx.Var[Optional[list[str]]]
+    default_selected_keys: rx.Var[Optional[list[str]]]
+    disabled_keys: rx.Var[Optional[list[str]]]
+    label_placement: rx.Var[Literal["inside", "outside", "outside-left"]] = "inside"
+    is_disabled: rx.Var[bool] = False
+    is_required: rx.Var[bool] = False
+    is_invalid: rx.Var[bool] = False
+    is_loading: rx.Var[bool] = False
+    is_virtualized: rx.Var[bool] = False
+    max_listbox_height: rx.Var[Optional[int]]
+    item_height: rx.Var[Optional[int]]
+    has_more: rx.Var[bool] = True
+    full_width: rx.Var[bool] = True
+    disable_animation: rx.Var[bool] = False
+
+    # Events
+    on_selection_change: rx.EventHandler[selection_keys_spec]
+    on_open_change: rx.EventHandler[lambda is_open: [is_open]]
+    on_close: rx.EventHandler[no_args_event_spec]
+    on_load_more: rx.EventHandler[no_args_event_spec]
+
+    @classmethod
+    def create(
+        cls,
+        *children,
+        items: Optional[rx.Var[list[dict[str, Any]]]] = None,
+        key_field: str = "key",
+        label_field: str = "label",
+        window_offset: Optional[rx.Var[int]] = None,
+        **props,
+    ) -> rx.Component:
+        """Create a Select, optionally rendering its options from a state list.
+
+        Args:
+            *children: The options of the select.
+            items: A state var holding the options, rendered with ``rx.foreach``.
+            key_field: The field holding the unique key of an option.
+            label_field: The field holding the text shown for an option.
+            window_offset: With ``items`` holding only the latest window of the
+                options (as ``OptionsState.options`` does), the offset of that
+                window; the windows are appended in the browser.
+            **props: The props of the component.
+
+        Returns:
+            The Select component.
+        """
+        if items is not None:
+            children = (
+                *children,
+                render_items(SelectItem, items, key_field, label_field, window_offset),
+            )
+        if "on_load_more" in props and props.get("id") is None:
+            props["id"] = f"select_{get_unique_variable_name()}"
+        return super().create(*children, **props)
+
+    def _exclude_props(self) -> list[str]:
+        return [*super()._exclude_props(), "on_load_more", "has_more"]
+
+    def _render(self) -> Tag:
+        tag = super()._render()
+        if self.event_triggers.get("on_load_more") is not None:
+            tag.add_props(scroll_ref=rx.Var(_js_expr=self._scroll_ref_name))
+        return tag
+
+    @property
+    def _scroll_ref_name(self) -> str:
+        return f"scroll_{self.get_ref()}"
+
+    def add_imports(self) -> dict[str, ImportVar]:
+        """Add the infinite scroll hook used by ``on_load_more``.
+
+        Returns:
+            The import dict for the component.
+        """
+        if self.event_triggers.get("on_load_more") is None:
+            return {}
+        return {
+            versioned("@heroui/use-infinite-scroll"): ImportVar(tag="useInfiniteScroll")
+        }
+
+    def add_hooks(self) -> list[str | rx.Var]:
+        """Load more options from the server when the listbox nears its end.
+
+        Returns:
+            The hooks to add to the component.
+        """
+        on_load_more = self.event_triggers.get("on_load_more")
+        if on_load_more is None:
+            return []
+        if isinstance(on_load_more, EventChain):
+            on_load_more = wrap(str(format_prop(on_load_more)).strip("{}"), "(")
+        hook_expr = (
+            f"const [, {self._scroll_ref_name}] = useInfiniteScroll({{"
+            f"hasMore: {self.has_more!s}, shouldUseLoader: false, "
+            f"onLoadMore: {on_load_more!s}}})"
+        )
+        return [
+            rx.Var(
+                hook_expr,
+                _var_type="str",
+                _var_data=VarData(position=Hooks.HookPosition.POST_TRIGGER),
+            )
+        ]
+
+
+class SelectItem(LiteralProps, rx.Component):
+    """A single option of a Select.
+
+    Attributes:
+        library: The library the component belongs to.
+        lib_dependencies: Dependencies required by the component.
+        tag: The tag name for the component.
+        text_value: The plain text of the option, shown in the trigger when selected.
+        description: The description text of the option.
+        start_content: Content to display at the start of the option.
+        end_content: Content to display at the end of the option.
+        show_divider: Whether to show a divider below the option.
+        is_disabled: Whether the option is disabled.
+        is_read_only: Whether the option is read-only.
+    """
+
+    library = versioned("@heroui/select")
+    lib_dependencies: list = lib_deps
+    tag = "SelectItem"
+
+    # Props
+    text_value: rx.Var[Optional[str]]
+    description: rx.Var[Optional[Any]]
+    start_content: rx.Var[Optional[Any]]
+    end_content: rx.Var[Optional[Any]]
+    show_divider: rx.Var[bool] = False
+    is_disabled: rx.Var[bool] = False
+    is_read_only: rx.Var[bool] = False
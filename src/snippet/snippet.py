@@ -1,8 +1,9 @@
 import reflex as rx
 from typing import Any, Literal, Optional, Union
-
-
-lib_deps: list = ["@heroui/theme", "@heroui/system", "framer-motion"]
+from ..cache.cache import CachedRender
+from ..npm.npm import lib_deps, versioned
+from ..code.highlight import highlighted_children
+from ..props.props import LiteralProps
 
 
 # Type aliases for component props
@@ -13,7 +14,7 @@ ButtonProps = dict[str, Any]
 """Type for button component properties."""
 
 
-class Snippet(rx.Component):
+class Snippet(LiteralProps, CachedRender, rx.Component):
     """A code snippet component with copy functionality and customizable appearance.
 
     Attributes:
@@ -36,7 +37,7 @@ class Snippet(rx.Component):
         disable_animation: Whether to disable animations.
     """
 
-    library = "@heroui/snippet"
+    library = versioned("@heroui/snippet")
     lib_dependencies: list = lib_deps
     tag = "Snippet"
 
@@ -57,4 +58,33 @@ class Snippet(rx.Component):
     disable_animation: rx.Var[bool] = False
 
     # Events
-    on_copy: rx.EventHandler[lambda e: [e]]
+    on_copy: rx.EventHandler[lambda value: [value]]
+
+    @classmethod
+    def create(
+        cls,
+        *children,
+        language: Optional[str] = None,
+        theme: str = "heroui",
+        chunk_lines: int = 200,
+        **props,
+    ) -> rx.Component:
+        """Create a Snippet, optionally highlighted on the server.
+
+        Args:
+            *children: The lines of code to display.
+            language: The Pygments name of the language to highlight, e.g.
+                ``"bash"``; the code is shown as plain text when left out.
+            theme: The highlight theme, a key of ``HIGHLIGHT_THEMES``.
+            chunk_lines: The number of lines rendered per animation frame.
+            **props: The props of the component.
+
+        Returns:
+            The Snippet component.
+        """
+        if language is not None:
+            children, code = highlighted_children(
+                children, language, theme, chunk_lines
+            )
+            props.setdefault("code_string", code)
+        return super().create(*children, **props)
@@ -1,7 +1,10 @@
 import reflex as rx
 from typing import Any, Literal, Optional, Union
+from ..cache.cache import CachedRender
+from ..npm.npm import lib_deps, versioned
+from ..props.props import LiteralProps
 
-# Space type definition
+# The keys of HeroUI's spacing scale, as numbers or as the strings HeroUI uses.
 SpaceType = Union[
     Literal[
         0,
@@ -40,12 +43,46 @@ SpaceType = Union[
         96,
         "px",
     ],
-    str,  # For string values not covered by the literals
+    Literal[
+        "0",
+        "0.5",
+        "1",
+        "1.5",
+        "2",
+        "2.5",
+        "3",
+        "3.5",
+        "4",
+        "5",
+        "6",
+        "7",
+        "8",
+        "9",
+        "10",
+        "11",
+        "12",
+        "14",
+        "16",
+        "20",
+        "24",
+        "28",
+        "32",
+        "36",
+        "40",
+        "44",
+        "48",
+        "52",
+        "56",
+        "60",
+        "64",
+        "72",
+        "80",
+        "96",
+    ],
 ]
 
-lib_deps: list = ["@heroui/theme", "@heroui/system", "framer-motion"]
 
-class Spacer(rx.Component):
+class Spacer(LiteralProps, CachedRender, rx.Component):
     """A component that creates empty space between elements.
 
     Attributes:
@@ -56,7 +93,7 @@ class Spacer(rx.Component):
         y: The amount of vertical space to create.
     """
 
-    library = "@heroui/spacer"
+    library = versioned("@heroui/spacer")
     lib_dependencies: list = lib_deps
     tag = "Spacer"
     # Props
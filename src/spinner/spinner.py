@@ -1,9 +1,11 @@
 import reflex as rx
 from typing import Any, Literal, Optional
+from ..cache.cache import CachedRender
+from ..npm.npm import lib_deps, versioned
+from ..props.props import LiteralProps
 
-lib_deps:list = ["@heroui/theme", "@heroui/system", "framer-motion"]
 
-class Spinner(rx.Component):
+class Spinner(LiteralProps, CachedRender, rx.Component):
     """A component that displays a loading spinner with various styling options.
 
     Attributes:
@@ -16,7 +18,7 @@ class Spinner(rx.Component):
         label_color: The color of the spinner label (default, primary, secondary, success, warning, danger).
     """
 
-    library = "@heroui/spinner"
+    library = versioned("@heroui/spinner")
     lib_dependencies: list = lib_deps
     tag = "Spinner"
     size: rx.Var[Literal["sm", "md", "lg"]] = "md"
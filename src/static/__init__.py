@@ -0,0 +1,3 @@
+from .static import Static
+
+static = Static.create
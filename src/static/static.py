@@ -0,0 +1,190 @@
+from hashlib import md5
+from typing import Literal, get_args
+
+import reflex as rx
+from reflex.compiler.templates import STATEFUL_COMPONENT
+from reflex.components.tags import Tag
+from reflex.constants.compiler import MemoizationDisposition, MemoizationMode
+from reflex.utils.imports import ImportVar
+from reflex.vars.base import VarData
+
+
+HydrationMode = Literal["eager", "visible", "idle", "never"]
+
+# Keeps the server-rendered markup of its children until they are hydrated. During
+# the first hydration, the client renders an empty ``innerHTML`` that React leaves
+# alone, then swaps in the children when they scroll into view or the browser is
+# idle. Client-side navigations render the children right away.
+# React does not hydrate the children of an element with ``dangerouslySetInnerHTML``:
+# it adopts whatever DOM is already there instead of matching it against the empty
+# string, and ``suppressHydrationWarning`` silences the mismatch warning in
+# development. The server markup stays until ``hydrated`` flips, then the element
+# re-renders with real children and React builds them on the client.
+LAZY_HYDRATE = """
+function HeroLazyHydrate({ when, children }) {
+  const ref = useRef(null);
+  const [hydrated, setHydrated] = useState(
+    () => typeof window === "undefined" || window.__heroHydrated === true
+  );
+  useEffect(() => {
+    window.__heroHydrated = true;
+    if (hydrated || when === "never") return;
+    if (when === "idle") {
+      const idle = window.requestIdleCallback ?? ((fn) => setTimeout(fn, 1));
+      const cancel = window.cancelIdleCallback ?? clearTimeout;
+      const id = idle(() => setHydrated(true));
+      return () => cancel(id);
+    }
+    const observer = new IntersectionObserver(
+      (entries) => entries.some((entry) => entry.isIntersecting) && setHydrated(true),
+      { rootMargin: "200px" }
+    );
+    for (const child of ref.current.children) observer.observe(child);
+    return () => observer.disconnect();
+  }, [hydrated, when]);
+  const style = { display: "contents" };
+  return hydrated
+    ? jsx("div", { ref, style }, children)
+    : jsx("div", {
+        ref,
+        style,
+        suppressHydrationWarning: true,
+        dangerouslySetInnerHTML: { __html: "" },
+      });
+}"""
+
+
+def _state_bindings(component: rx.Component) -> list[str]:
+    """Find the state vars a subtree renders.
+
+    Args:
+        component: The root of the subtree.
+
+    Returns:
+        The names of the states the subtree depends on.
+    """
+    states = set()
+    for var in component._get_vars(include_children=True):
+        var_data = var._get_all_var_data()
+        if var_data is not None and var_data.state:
+            states.add(var_data.state)
+    return sorted(states)
+
+
+class Static(rx.Fragment):
+    """Hoists a state-free subtree into a ``React.memo`` component.
+
+    The children are compiled once into a memoized component defined next to the
+    page, so re-renders of a stateful parent (for example a card whose class name
+    depends on state) skip the static subtree entirely. Event handlers are
+    allowed, but the children may not render any state var.
+
+    Pages are pre-rendered to HTML at export, so the subtree shows before any
+    JavaScript runs. With ``hydrate`` other than ``"eager"`` it also skips the
+    initial hydration: the pre-rendered markup stays as is until the subtree
+    scrolls into view (``"visible"``), the browser is idle (``"idle"``), or for
+    good (``"never"``, for subtrees without event handlers).
+
+    Attributes:
+        hydrate: When to hydrate the pre-rendered markup.
+
+    Example:
+        hero.static(
+            hero.alert(title="Heads up", color="warning"),
+            hero.snippet("pip install heroui-provider"),
+        )
+    """
+
+    # The children are rendered inside the hoisted component, never memoized on their own.
+    _memoization_mode = MemoizationMode(
+        disposition=MemoizationDisposition.NEVER, recursive=False
+    )
+
+    hydrate: HydrationMode = "eager"
+
+    @classmethod
+    def create(cls, *children, **props) -> rx.Component:
+        """Create a static boundary around the given children.
+
+        Args:
+            *children: The state-free components to hoist.
+            **props: The props of the component.
+
+        Returns:
+            The Static component.
+
+        Raises:
+            ValueError: If a child renders a state var, or ``hydrate`` is unknown.
+        """
+        hydrate = props.get("hydrate", "eager")
+        if hydrate not in get_args(HydrationMode):
+            raise ValueError(
+                f"Invalid hydrate mode {hydrate!r}, expected one of "
+                f"{', '.join(map(repr, get_args(HydrationMode)))}."
+            )
+        component = super().create(*children, **props)
+        states = _state_bindings(component)
+        if states:
+            raise ValueError(
+                "hero.static children must not render state vars, found "
+                f"vars of {', '.join(states)}."
+            )
+        return component
+
+    def _body(self) -> rx.Component:
+        return rx.Fragment.create(*self.children)
+
+    def _hoisted_tag(self) -> str:
+        code_hash = md5(str(self._body().render()).encode("utf-8")).hexdigest()
+        return f"Static_{code_hash}"
+
+    def add_imports(self) -> dict[str, ImportVar]:
+        """Add the imports for the component.
+
+        Returns:
+            The import for ``memo``, and the hooks of the lazy hydration.
+        """
+        if self.hydrate == "eager":
+            return {"react": ImportVar(tag="memo")}
+        return {
+            "react": [
+                ImportVar(tag="memo"),
+                ImportVar(tag="useEffect"),
+                ImportVar(tag="useRef"),
+                ImportVar(tag="useState"),
+            ]
+        }
+
+    def add_custom_code(self) -> list[str]:
+        """Define the hoisted component next to the page.
+
+        Returns:
+            The code of the memoized component.
+        """
+        tag = self._hoisted_tag()
+        body = STATEFUL_COMPONENT.render(
+            tag_name=f"{tag}_body", memo_trigger_hooks=[], component=self._body()
+        )
+        code = [f"{body}\nconst {tag} = memo({tag}_body);"]
+        if self.hydrate != "eager":
+            code.insert(0, LAZY_HYDRATE)
+        return code
+
+    def _get_all_hooks_internal(self) -> dict[str, VarData | None]:
+        # Hooks of the children are emitted inside the hoisted component.
+        return {}
+
+    def _get_all_hooks(self) -> dict[str, VarData | None]:
+        return {}
+
+    def render(self) -> dict:
+        """Render a reference to the hoisted component.
+
+        Returns:
+            The dictionary for template of component.
+        """
+        tag = Tag(name=self._hoisted_tag())
+        if self.hydrate == "eager":
+            return dict(tag)
+        wrapper = Tag(name="HeroLazyHydrate").add_props(when=self.hydrate)
+        return dict(wrapper.set(children=[dict(tag)], props=wrapper.format_props()))
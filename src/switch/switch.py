@@ -1,11 +1,13 @@
 import reflex as rx
 from typing import Any, Literal, Optional
+from reflex.event import checked_input_event
+from ..cache.cache import CachedRender
+from ..npm.npm import lib_deps, versioned
+from ..props.props import LiteralProps
 
-lib_deps: list = ["@heroui/theme", "@heroui/system", "framer-motion"]
 
-
-class Switch(rx.Component):
-    library = "@heroui/switch"
+class Switch(LiteralProps, CachedRender, rx.Component):
+    library = versioned("@heroui/switch")
     lib_dependencies: list = lib_deps
     tag = "Switch"
     value: rx.Var[str]
@@ -22,5 +24,5 @@ class Switch(rx.Component):
     is_read_only: rx.Var[Optional[bool]]
     is_disabled: rx.Var[Optional[bool]] = False
     disable_animation: rx.Var[Optional[bool]] = False
-    on_change: rx.EventHandler[lambda e: [e]]
+    on_change: rx.EventHandler[checked_input_event]
     on_value_change: rx.EventHandler[lambda is_selected: [is_selected]]
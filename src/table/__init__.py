@@ -0,0 +1,9 @@
+from .table import Table, TableHeader, TableColumn, TableBody, TableRow, TableCell
+from .state import TableState
+
+table = Table.create
+table_header = TableHeader.create
+table_column = TableColumn.create
+table_body = TableBody.create
+table_row = TableRow.create
+table_cell = TableCell.create
@@ -0,0 +1,183 @@
+import inspect
+import reflex as rx
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    ClassVar,
+    Iterable,
+    Literal,
+    Optional,
+    Union,
+)
+
+
+RowsResult = Union[
+    Iterable[dict[str, Any]],
+    Awaitable[Iterable[dict[str, Any]]],
+    AsyncIterator[dict[str, Any]],
+]
+
+
+def _sort_key(value: Any) -> tuple[bool, Any]:
+    """Sort rows by a column's value, with missing values last."""
+    return (value is None, "" if value is None else value)
+
+
+class TableState(rx.State, mixin=True):
+    """Feeds a Table from a server-side data source, one chunk of rows at a time.
+
+    Sorting and filtering are delegated to the data source. The server only keeps
+    the latest chunk and a count of the rows sent, and the browser only receives
+    each chunk once, appending it to the rows it already has. Override
+    ``_fetch_rows`` with a paging callback (plain or ``async``) or an async
+    generator, or call ``_set_all_rows`` to serve a list held in memory.
+
+    Example:
+        class OrdersState(hero.TableState, rx.State):
+            async def _fetch_rows(self, offset, limit, sort_column, descending, query):
+                async for row in db.orders(offset, limit, sort_column, descending, query):
+                    yield row
+
+        hero.table_body(items=OrdersState.rows, window_offset=OrdersState.rows_offset,
+                        columns=["name"])
+
+    Attributes:
+        rows: The latest chunk of rows, one dict per row.
+        rows_offset: The index of the first row of the chunk.
+        has_more: Whether more rows can be loaded.
+        sort_column: The column the rows are sorted by.
+        sort_direction: The direction of the sort.
+        query: The current filter text.
+        page_size: How many rows are loaded per chunk.
+    """
+
+    rows: list[dict[str, Any]] = []
+    rows_offset: int = 0
+    has_more: bool = True
+    sort_column: str = ""
+    sort_direction: Literal["ascending", "descending"] = "ascending"
+    query: str = ""
+
+    # Shared by every session of the state; each session only keeps the indices
+    # of its sorted and filtered rows, or None for the natural order.
+    _all_rows: ClassVar[tuple[dict[str, Any], ...]] = ()
+    _view: Optional[list[int]] = None
+    _view_key: tuple = ()
+    _loaded: int = 0
+
+    page_size: ClassVar[int] = 100
+
+    def _fetch_rows(
+        self,
+        offset: int,
+        limit: int,
+        sort_column: str,
+        descending: bool,
+        query: str,
+    ) -> RowsResult:
+        """Return a chunk of rows from the data source.
+
+        By default the rows given to ``_set_all_rows`` are filtered (rows with a
+        value containing the query, ignoring case) and sorted in memory; override
+        it to page through a database instead.
+
+        Args:
+            offset: The index of the first row to return.
+            limit: The maximum number of rows to return.
+            sort_column: The column to sort by, empty for the natural order.
+            descending: Whether to sort in descending order.
+            query: The filter text, empty for no filtering.
+
+        Returns:
+            The rows of the chunk.
+        """
+        rows = self._all_rows
+        key = (id(rows), sort_column, descending, query)
+        if key != self._view_key:
+            view = None
+            if query:
+                needle = query.casefold()
+                view = [
+                    i
+                    for i, row in enumerate(rows)
+                    if any(needle in str(value).casefold() for value in row.values())
+                ]
+            if sort_column:
+                view = sorted(
+                    range(len(rows)) if view is None else view,
+                    key=lambda i: _sort_key(rows[i].get(sort_column)),
+                    reverse=descending,
+                )
+            self._view, self._view_key = view, key
+        if self._view is None:
+            return rows[offset : offset + limit]
+        return [rows[i] for i in self._view[offset : offset + limit]]
+
+    async def _set_all_rows(self, rows: Iterable[dict[str, Any]]):
+        """Serve rows held in memory and send the first chunk.
+
+        The rows are kept once for every session of the state, so call it with
+        the same rows from each session, e.g. in ``on_load``.
+
+        Args:
+            rows: All rows, one dict per row.
+        """
+        type(self)._all_rows = tuple(rows)
+        await self.reload()
+
+    async def _next_chunk(self) -> list[dict[str, Any]]:
+        result = self._fetch_rows(
+            self._loaded,
+            self.page_size,
+            self.sort_column,
+            self.sort_direction == "descending",
+            self.query,
+        )
+        if inspect.isasyncgen(result):
+            chunk = []
+            async for row in result:
+                chunk.append(row)
+                if len(chunk) == self.page_size:
+                    break
+            await result.aclose()
+            return chunk
+        if inspect.isawaitable(result):
+            result = await result
+        return list(result)
+
+    @rx.event
+    async def load_more(self):
+        """Send the next chunk of rows."""
+        chunk = await self._next_chunk()
+        self.rows = chunk
+        self.rows_offset = self._loaded
+        self._loaded += len(chunk)
+        self.has_more = len(chunk) == self.page_size
+
+    @rx.event
+    async def reload(self):
+        """Drop the loaded rows and load the first chunk again."""
+        self._loaded = 0
+        await self.load_more()
+
+    @rx.event
+    async def sort(self, descriptor: dict[str, str]):
+        """Sort on the server, e.g. from ``Table.on_sort_change``.
+
+        Args:
+            descriptor: A dict with the ``column`` key and sort ``direction``.
+        """
+        self.sort_column = descriptor.get("column", "")
+        self.sort_direction = descriptor.get("direction", "ascending")
+        await self.reload()
+
+    @rx.event
+    async def filter(self, query: str):
+        """Filter on the server, e.g. from a debounced ``Input.on_value_change``.
+
+        Args:
+            query: The filter text.
+        """
+        self.query = query
+        await self.reload()
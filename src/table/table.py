@@ -0,0 +1,324 @@
+import reflex as rx
+from typing import Any, Literal, Optional
+from reflex.components.tags.tag import Tag
+from reflex.constants.compiler import Hooks, MemoizationMode
+from reflex.event import EventChain, no_args_event_spec
+from reflex.utils.format import format_prop, format_ref, wrap
+from reflex.utils.imports import ImportVar
+from reflex.vars import get_unique_variable_name
+from reflex.vars.base import VarData
+from ..collection.collection import appended_windows
+from ..listbox.listbox import selection_keys_spec
+from ..npm.npm import lib_deps, versioned
+from ..props.props import LiteralProps
+from ..spinner.spinner import Spinner
+
+
+class Table(LiteralProps, rx.Component):
+    """A table that displays rows of data, with sorting, selection and virtualization.
+
+    Attributes:
+        library: The library the component belongs to.
+        lib_dependencies: Dependencies required by the component.
+        tag: The tag name for the component.
+        color: The color of the selected rows.
+        layout: The table layout algorithm (auto, fixed).
+        radius: The border radius of the table wrapper.
+        shadow: The shadow depth of the table wrapper.
+        selection_mode: Whether no, one or several rows can be selected.
+        selection_behavior: How selection behaves on press (toggle, replace).
+        selected_keys: The keys of the selected rows (controlled).
+        default_selected_keys: The keys of the initially selected rows.
+        disabled_keys: The keys of the disabled rows.
+        sort_descriptor: The current sort, a dict with ``column`` and ``direction``.
+        top_content: Content to display above the table.
+        bottom_content: Content to display below the table.
+        is_virtualized: Whether to only mount the rows in view.
+        max_table_height: The height of the table when virtualized, in pixels.
+        row_height: The height of a single row when virtualized, in pixels.
+        has_more: Whether ``on_load_more`` can provide more rows.
+        hide_header: Whether to hide the table header.
+        is_striped: Whether to stripe alternate rows.
+        is_compact: Whether to reduce the cell padding.
+        is_header_sticky: Whether the header sticks to the top when scrolling.
+        full_width: Whether the table should take the full width of its container.
+        remove_wrapper: Whether to remove the wrapper element around the table.
+        disable_animation: Whether to disable animations.
+        on_sort_change: Event handler called with the new sort descriptor.
+        on_selection_change: Event handler called with the list of selected keys.
+        on_row_action: Event handler called with the key of the activated row.
+        on_load_more: Event handler called when the table is scrolled near its end.
+    """
+
+    library = versioned("@heroui/table")
+    lib_dependencies: list = [*lib_deps, versioned("@heroui/use-infinite-scroll")]
+    tag = "Table"
+
+    # Collection children (items, header, body) must stay direct children.
+    _memoization_mode = MemoizationMode(recursive=False)
+
+    # Props
+    color: rx.Var[
+        Literal["default", "primary", "secondary", "success", "warning", "danger"]
+    ] = "default"
+    layout: rx.Var[Literal["auto", "fixed"]] = "auto"
+    radius: rx.Var[Literal["none", "sm", "md", "lg"]] = "lg"
+    shadow: rx.Var[Literal["none", "sm", "md", "lg"]] = "sm"
+    selection_mode: rx.Var[Literal["none", "single", "multiple"]] = "none"
+    selection_behavior: rx.Var[Literal["toggle", "replace"]] = "toggle"
+    selected_keys: rx.Var[Optional[list[str]]]
+    default_selected_keys: rx.Var[Optional[list[str]]]
+    disabled_keys: rx.Var[Optional[list[str]]]
+    sort_descriptor: rx.Var[Optional[dict[str, str]]]
+    top_content: rx.Var[Optional[Any]]
+    bottom_content: rx.Var[Optional[Any]]
+    is_virtualized: rx.Var[bool] = False
+    max_table_height: rx.Var[Optional[int]]
+    row_height: rx.Var[Optional[int]]
+    has_more: rx.Var[bool] = True
+    hide_header: rx.Var[bool] = False
+    is_striped: rx.Var[bool] = False
+    is_compact: rx.Var[bool] = False
+    is_header_sticky: rx.Var[bool] = False
+    full_width: rx.Var[bool] = True
+    remove_wrapper: rx.Var[bool] = False
+    disable_animation: rx.Var[bool] = False
+
+    # Events
+    on_sort_change: rx.EventHandler[lambda descriptor: [descriptor]]
+    on_selection_change: rx.EventHandler[selection_keys_spec]
+    on_row_action: rx.EventHandler[lambda key: [key]]
+    on_load_more: rx.EventHandler[no_args_event_spec]
+
+    @classmethod
+    def create(
+        cls, *children, aria_label: Optional[str] = None, **props
+    ) -> rx.Component:
+        """Create a Table.
+
+        With ``on_load_more``, a spinner is placed below the rows (unless
+        ``bottom_content`` is given) and more rows are requested as soon as it
+        scrolls into view.
+
+        Args:
+            *children: The header and body of the table.
+            aria_label: The accessible label of the table.
+            **props: The props of the component.
+
+        Returns:
+            The Table component.
+        """
+        if aria_label is not None:
+            props.setdefault("custom_attrs", {})["aria-label"] = aria_label
+        if "on_load_more" in props:
+            if props.get("id") is None:
+                props["id"] = f"table_{get_unique_variable_name()}"
+            loader_ref = rx.Var(_js_expr=f"loader_{format_ref(props['id'])}")
+            has_more = props.get("has_more", True)
+            props.setdefault(
+                "bottom_content",
+                rx.cond(
+                    has_more,
+                    rx.el.div(
+                        Spinner.create(custom_attrs={"ref": loader_ref}),
+                        style={"display": "flex", "justify_content": "center"},
+                    ),
+                ),
+            )
+        return super().create(*children, **props)
+
+    def _exclude_props(self) -> list[str]:
+        return [*super()._exclude_props(), "on_load_more", "has_more"]
+
+    def _render(self) -> Tag:
+        tag = super()._render()
+        if self.event_triggers.get("on_load_more") is not None:
+            tag.add_props(base_ref=rx.Var(_js_expr=f"scroll_{self.get_ref()}"))
+        return tag
+
+    def add_imports(self) -> dict[str, ImportVar]:
+        """Add the infinite scroll hook used by ``on_load_more``.
+
+        Returns:
+            The import dict for the component.
+        """
+        if self.event_triggers.get("on_load_more") is None:
+            return {}
+        return {
+            versioned("@heroui/use-infinite-scroll"): ImportVar(tag="useInfiniteScroll")
+        }
+
+    def add_hooks(self) -> list[str | rx.Var]:
+        """Load more rows from the server when the loader scrolls into view.
+
+        Returns:
+            The hooks to add to the component.
+        """
+        on_load_more = self.event_triggers.get("on_load_more")
+        if on_load_more is None:
+            return []
+        if isinstance(on_load_more, EventChain):
+            on_load_more = wrap(str(format_prop(on_load_more)).strip("{}"), "(")
+        ref = self.get_ref()
+        hook_expr = (
+            f"const [loader_{ref}, scroll_{ref}] = useInfiniteScroll({{"
+            f"hasMore: {self.has_more!s}, onLoadMore: {on_load_more!s}}})"
+        )
+        return [
+            rx.Var(
+                hook_expr,
+                _var_type="str",
+                _var_data=VarData(position=Hooks.HookPosition.POST_TRIGGER),
+            )
+        ]
+
+
+class TableHeader(LiteralProps, rx.Component):
+    """The header of a table, holding its columns.
+
+    Attributes:
+        library: The library the component belongs to.
+        lib_dependencies: Dependencies required by the component.
+        tag: The tag name for the component.
+    """
+
+    library = versioned("@heroui/table")
+    lib_dependencies: list = lib_deps
+    tag = "TableHeader"
+
+
+class TableColumn(LiteralProps, rx.Component):
+    """A column of a table header.
+
+    Attributes:
+        library: The library the component belongs to.
+        lib_dependencies: Dependencies required by the component.
+        tag: The tag name for the component.
+        allows_sorting: Whether the table can be sorted by this column.
+        align: The horizontal alignment of the column content.
+        width: The width of the column.
+        min_width: The minimum width of the column.
+        max_width: The maximum width of the column.
+        hide_header: Whether to visually hide the column title.
+        text_value: The plain text of the column, for accessibility.
+    """
+
+    library = versioned("@heroui/table")
+    lib_dependencies: list = lib_deps
+    tag = "TableColumn"
+
+    # Props
+    allows_sorting: rx.Var[bool] = False
+    align: rx.Var[Literal["start", "center", "end"]] = "start"
+    width: rx.Var[Optional[Any]]
+    min_width: rx.Var[Optional[Any]]
+    max_width: rx.Var[Optional[Any]]
+    hide_header: rx.Var[bool] = False
+    text_value: rx.Var[Optional[str]]
+
+
+class TableBody(LiteralProps, rx.Component):
+    """The body of a table, holding its rows.
+
+    Attributes:
+        library: The library the component belongs to.
+        lib_dependencies: Dependencies required by the component.
+        tag: The tag name for the component.
+        empty_content: Content to display when there are no rows.
+        is_loading: Whether the rows are being loaded.
+        loading_content: Content to display while loading.
+    """
+
+    library = versioned("@heroui/table")
+    lib_dependencies: list = lib_deps
+    tag = "TableBody"
+
+    # Props
+    empty_content: rx.Var[Optional[Any]]
+    is_loading: rx.Var[bool] = False
+    loading_content: rx.Var[Optional[Any]]
+
+    @classmethod
+    def create(
+        cls,
+        *children,
+        items: Optional[rx.Var[list[dict[str, Any]]]] = None,
+        columns: Optional[list[str]] = None,
+        key_field: str = "key",
+        window_offset: Optional[rx.Var[int]] = None,
+        **props,
+    ) -> rx.Component:
+        """Create a TableBody, optionally rendering its rows from a state list.
+
+        Args:
+            *children: The rows of the table.
+            items: A state var holding the rows, rendered with ``rx.foreach``.
+            columns: The fields of a row to render as cells, in order; required
+                with ``items``.
+            key_field: The field holding the unique key of a row.
+            window_offset: With ``items`` holding only the latest chunk of the
+                rows (as ``TableState.rows`` does), the offset of that chunk; the
+                chunks are appended in the browser.
+            **props: The props of the component.
+
+        Returns:
+            The TableBody component.
+
+        Raises:
+            ValueError: If ``items`` is given without ``columns``.
+        """
+        if items is not None:
+            if not columns:
+                raise ValueError(
+                    "table_body(items=...) needs `columns`, the row fields to "
+                    "render as cells, e.g. columns=['name', 'price']."
+                )
+            if window_offset is not None:
+                items = appended_windows(items, window_offset)
+            children = (
+                *children,
+                rx.foreach(
+                    items,
+                    lambda row: TableRow.create(
+                        *[TableCell.create(row[column]) for column in columns],
+                        key=row[key_field],
+                    ),
+                ),
+            )
+        return super().create(*children, **props)
+
+
+class TableRow(LiteralProps, rx.Component):
+    """A row of a table body.
+
+    Attributes:
+        library: The library the component belongs to.
+        lib_dependencies: Dependencies required by the component.
+        tag: The tag name for the component.
+        text_value: The plain text of the row, for accessibility.
+    """
+
+    library = versioned("@heroui/table")
+    lib_dependencies: list = lib_deps
+    tag = "TableRow"
+
+    # Props
+    text_value: rx.Var[Optional[str]]
+
+
+class TableCell(LiteralProps, rx.Component):
+    """A cell of a table row.
+
+    Attributes:
+        library: The library the component belongs to.
+        lib_dependencies: Dependencies required by the component.
+        tag: The tag name for the component.
+        text_value: The plain text of the cell, for accessibility.
+    """
+
+    library = versioned("@heroui/table")
+    lib_dependencies: list = lib_deps
+    tag = "TableCell"
+
+    # Props
+    text_value: rx.Var[Optional[str]]
@@ -0,0 +1 @@
+from .tailwind import HEROUI_PLUGIN, tailwind_config, theme_components
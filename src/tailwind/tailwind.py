@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Optional, Union
+
+import reflex as rx
+from reflex.utils.format import format_library_name
+
+from ..npm.npm import used_packages
+
+
+# Where Tailwind finds the class names of the HeroUI theme.
+THEME_DIST = "./node_modules/@heroui/theme/dist"
+
+# Tailwind's default content paths inside ``.web`` (the compiled pages).
+PAGES_CONTENT = ["./pages/**/*.{js,ts,jsx,tsx}", "./utils/**/*.{js,ts,jsx,tsx}"]
+
+# The theme modules (``dist/components/<name>.js``) styling each npm package,
+# including the internal parts it renders (e.g. the tooltip of a snippet).
+THEME_COMPONENTS: dict[str, tuple[str, ...]] = {
+    "@heroui/alert": ("alert", "button"),
+    "@heroui/autocomplete": (
+        "autocomplete",
+        "input",
+        "listbox",
+        "popover",
+        "scroll-shadow",
+        "button",
+        "spinner",
+    ),
+    "@heroui/avatar": ("avatar",),
+    "@heroui/badge": ("badge",),
+    "@heroui/button": ("button", "spinner"),
+    "@heroui/card": ("card",),
+    "@heroui/checkbox": ("checkbox",),
+    "@heroui/chip": ("chip",),
+    "@heroui/code": ("code",),
+    "@heroui/form": ("form",),
+    "@heroui/image": ("image",),
+    "@heroui/input": ("input",),
+    "@heroui/listbox": ("listbox", "divider"),
+    "@heroui/radio": ("radio",),
+    "@heroui/select": ("select", "listbox", "popover", "scroll-shadow", "spinner"),
+    "@heroui/snippet": ("snippet", "button", "popover"),
+    "@heroui/spacer": ("spacer",),
+    "@heroui/spinner": ("spinner",),
+    "@heroui/switch": ("toggle",),
+    "@heroui/table": ("table", "checkbox", "spacer", "spinner"),
+}
+
+# The HeroUI Tailwind plugin, as recommended for ``rxconfig.py``.
+HEROUI_PLUGIN: dict[str, Any] = {
+    "name": "@heroui/theme",
+    "import": {"name": "heroui", "from": "@heroui/theme"},
+    "call": "heroui",
+}
+
+
+def theme_components(
+    app_or_pages: Union[rx.App, Iterable[rx.Component]],
+) -> list[str]:
+    """Find the HeroUI theme modules an app needs.
+
+    Args:
+        app_or_pages: The app, or the page components to analyze.
+
+    Returns:
+        The sorted names of the theme modules, e.g. ``["button", "spinner"]``.
+    """
+    names = set()
+    for package in used_packages(app_or_pages):
+        names.update(THEME_COMPONENTS.get(format_library_name(package), ()))
+    return sorted(names)
+
+
+def tailwind_config(
+    app_or_pages: Union[rx.App, Iterable[rx.Component]],
+    base: Optional[dict[str, Any]] = None,
+    safelist: Optional[Iterable[str]] = None,
+) -> dict[str, Any]:
+    """Build a Tailwind config that only scans the HeroUI components an app renders.
+
+    Instead of the whole ``@heroui/theme`` distribution, Tailwind scans the
+    compiled pages and the theme modules of the components actually used, which
+    makes rebuilds faster and the generated CSS smaller. Tailwind's granularity
+    is the theme module, so every variant of a used component is kept.
+
+    Args:
+        app_or_pages: The app, or the page components to analyze.
+        base: The rest of the Tailwind config (theme, plugins, ...); defaults to
+            the HeroUI plugin with class-based dark mode.
+        safelist: Class names to always generate, such as class names computed
+            on the backend that never appear in the compiled pages.
+
+    Returns:
+        The Tailwind config, for the ``tailwind`` argument of ``rx.Config``.
+    """
+    config = dict(
+        base
+        if base is not None
+        else {"theme": {"extend": {}}, "darkMode": "class", "plugins": [HEROUI_PLUGIN]}
+    )
+    content: list[Any] = list(PAGES_CONTENT)
+    components = theme_components(app_or_pages)
+    if len(components) == 1:
+        content.append(f"{THEME_DIST}/components/{components[0]}.js")
+    elif components:
+        content.append(f"{THEME_DIST}/components/({'|'.join(components)}).js")
+    if safelist:
+        # Reflex's Tailwind template has no ``safelist``, raw content does the same.
+        content.append({"raw": " ".join(sorted(set(safelist))), "extension": "html"})
+    config["content"] = content
+    return config
@@ -1,10 +1,13 @@
 import reflex as rx
 from typing import Any, Optional, Literal
+from reflex.event import input_event
+from ..cache.cache import CachedRender
+from ..input.input import limit_value_events
+from ..npm.npm import lib_deps, versioned
+from ..props.props import LiteralProps
 
-lib_deps: list = ["@heroui/theme", "@heroui/system", "framer-motion"]
 
-
-class Textarea(rx.Component):
+class Textarea(LiteralProps, CachedRender, rx.Component):
     """A component that allows users to input multiline text.
 
     Attributes:
@@ -16,9 +19,12 @@ class Textarea(rx.Component):
         size: The size of the textarea.
         radius: The border radius of the textarea.
         label: The label text of the textarea.
+        name: The name of the textarea's value when its form is submitted.
         placeholder: The placeholder text of the textarea.
         description: The description text of the textarea.
         error_message: The error message text of the textarea.
+        min_length: The minimum number of characters required.
+        max_length: The maximum number of characters allowed.
         min_rows: The minimum number of visible rows.
         max_rows: The maximum number of visible rows.
         disable_resize: Whether to disable resizing of the textarea.
@@ -32,9 +38,12 @@ class Textarea(rx.Component):
         disable_animation: Whether to disable animations.
         auto_focus: Whether the textarea should automatically get focus when mounted.
         full_width: Whether the textarea should take the full width of its container.
+        on_value_change: Event handler called with the new value. Can be rate limited
+            in the browser with the ``debounce_ms``, ``throttle_ms`` and ``emit``
+            arguments of ``create``.
     """
 
-    library = "@heroui/input"
+    library = versioned("@heroui/input")
     lib_dependencies: list = lib_deps
     tag = "Textarea"
 
@@ -51,12 +60,15 @@ class Textarea(rx.Component):
     label: rx.Var[Optional[Any]]
     value: rx.Var[Optional[str]]
     default_value: rx.Var[Optional[str]]
+    name: rx.Var[Optional[str]]
     placeholder: rx.Var[Optional[str]]
     start_content: rx.Var[Optional[Any]]
     end_content: rx.Var[Optional[Any]]
     description: rx.Var[Optional[str]]
     error_message: rx.Var[Optional[str]]
     validate: rx.Var[Optional[str]]
+    min_length: rx.Var[Optional[int]]
+    max_length: rx.Var[Optional[int]]
     validation_behavior: rx.Var[Literal["native", "aria"]] = "native"
     label_placement: rx.Var[Literal["inside", "outside", "outside-left"]] = "inside"
     full_width: rx.Var[bool] = True
@@ -67,8 +79,32 @@ class Textarea(rx.Component):
     disable_animation: rx.Var[bool] = False
 
     # Events
-    on_change: rx.EventHandler[lambda e: [e]]
+    on_change: rx.EventHandler[input_event]
     on_value_change: rx.EventHandler[lambda value: [value]]
     on_clear: rx.EventHandler[lambda x: x]
     # not tested the below thing yet feel free to test it:
     on_height_change: rx.EventHandler[lambda height, meta: [height, meta["row_height"]]]  # noqa: F821
+
+    @classmethod
+    def create(
+        cls,
+        *children,
+        debounce_ms: Optional[int] = None,
+        throttle_ms: Optional[int] = None,
+        emit: Literal["change", "blur"] = "change",
+        **props,
+    ) -> rx.Component:
+        """Create a Textarea, optionally rate limiting its value events.
+
+        Args:
+            *children: The children of the component.
+            debounce_ms: Send the value once typing pauses for this many milliseconds.
+            throttle_ms: Send at most one value every this many milliseconds.
+            emit: Set to ``"blur"`` to send the value only when the textarea loses focus.
+            **props: The props of the component.
+
+        Returns:
+            The Textarea component.
+        """
+        props = limit_value_events(props, debounce_ms, throttle_ms, emit)
+        return super().create(*children, **props)
@@ -0,0 +1,3 @@
+from .theme import SHADES, Theme, foreground, palette, theme_css
+
+theme = Theme.create
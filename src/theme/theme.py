@@ -0,0 +1,184 @@
+import colorsys
+import re
+from functools import lru_cache
+from typing import Optional
+
+from reflex.components.el.elements.metadata import StyleEl
+
+
+SHADES = (50, 100, 200, 300, 400, 500, 600, 700, 800, 900)
+
+# How much white (tints) or black (shades) is mixed into the base color.
+_MIX = tuple((1.0, weight) for weight in (0.9, 0.8, 0.6, 0.4, 0.2)) + tuple(
+    (0.0, weight) for weight in (0.0, 0.2, 0.4, 0.6, 0.8)
+)
+
+_WHITE = "0 0% 100%"
+_BLACK = "0 0% 0%"
+
+_LIGHT_SELECTOR = ":root,.light,[data-theme=light]"
+_DARK_SELECTOR = ".dark,[data-theme=dark]"
+
+_HEX_RE = re.compile(r"#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})")
+
+
+def _rgb(color: str) -> tuple[float, float, float]:
+    """Parse a ``#rgb`` or ``#rrggbb`` color into RGB channels between 0 and 1.
+
+    Raises:
+        ValueError: If the color is not a hex color.
+    """
+    match = _HEX_RE.fullmatch(color) if isinstance(color, str) else None
+    if match is None:
+        raise ValueError(f"Expected a hex color like '#006FEE', got {color!r}.")
+    value = match[1]
+    if len(value) == 3:
+        value = "".join(c * 2 for c in value)
+    return tuple(int(value[i : i + 2], 16) / 255 for i in (0, 2, 4))
+
+
+def _hsl(r: float, g: float, b: float) -> str:
+    """Format RGB channels as the ``H S% L%`` triple HeroUI's variables hold."""
+    h, l, s = colorsys.rgb_to_hls(r, g, b)
+    return f"{h * 360:.2f} {s * 100:.2f}% {l * 100:.2f}%"
+
+
+def _luminance(r: float, g: float, b: float) -> float:
+    """The WCAG relative luminance of a color."""
+    r, g, b = (
+        c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4 for c in (r, g, b)
+    )
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+
+@lru_cache(maxsize=4096)
+def palette(color: str) -> tuple[str, ...]:
+    """Generate the 50-900 shade scale of a base color.
+
+    The base color is shade 500; lighter shades mix in white and darker shades
+    mix in black, all channels at once. Results are cached, so themes sharing a
+    brand color compute it once.
+
+    Args:
+        color: The base color, as ``#rgb`` or ``#rrggbb``.
+
+    Returns:
+        The ``H S% L%`` value of each shade in ``SHADES``.
+    """
+    r, g, b = _rgb(color)
+    return tuple(
+        _hsl(r + (t - r) * w, g + (t - g) * w, b + (t - b) * w) for t, w in _MIX
+    )
+
+
+@lru_cache(maxsize=4096)
+def foreground(color: str) -> str:
+    """Pick black or white text, whichever contrasts more with a color.
+
+    Args:
+        color: The background color, as ``#rgb`` or ``#rrggbb``.
+
+    Returns:
+        The ``H S% L%`` value of the foreground color.
+    """
+    # White wins when (1 + 0.05) / (L + 0.05) > (L + 0.05) / 0.05.
+    return _WHITE if _luminance(*_rgb(color)) < 0.179 else _BLACK
+
+
+@lru_cache(maxsize=1024)
+def theme_css(
+    primary: Optional[str] = None,
+    secondary: Optional[str] = None,
+    success: Optional[str] = None,
+    warning: Optional[str] = None,
+    danger: Optional[str] = None,
+    default: Optional[str] = None,
+    prefix: str = "heroui",
+) -> str:
+    """Build the CSS variables of a theme for the HeroUI Tailwind plugin.
+
+    Each given semantic color gets its 50-900 scale, ``DEFAULT`` and
+    ``foreground`` variables, for light mode and (with the scale reversed) dark
+    mode. Colors left out keep the plugin's values.
+
+    Args:
+        primary: The base color of ``primary``.
+        secondary: The base color of ``secondary``.
+        success: The base color of ``success``.
+        warning: The base color of ``warning``.
+        danger: The base color of ``danger``.
+        default: The base color of ``default``, the neutral gray.
+        prefix: The variable prefix configured in the HeroUI plugin.
+
+    Returns:
+        The stylesheet setting the variables.
+    """
+    colors = {
+        "default": default,
+        "primary": primary,
+        "secondary": secondary,
+        "success": success,
+        "warning": warning,
+        "danger": danger,
+    }
+    light, dark = [], []
+    for name, color in colors.items():
+        if color is None:
+            continue
+        scale = palette(color)
+        var = f"--{prefix}-{name}"
+        for mode, shades in ((light, scale), (dark, scale[::-1])):
+            mode.extend(
+                f"{var}-{shade}:{value}" for shade, value in zip(SHADES, shades)
+            )
+            mode.append(f"{var}:{scale[5]}")
+            mode.append(f"{var}-foreground:{foreground(color)}")
+    if not light:
+        return ""
+    return f"{_LIGHT_SELECTOR}{{{';'.join(light)}}}{_DARK_SELECTOR}{{{';'.join(dark)}}}"
+
+
+class Theme(StyleEl):
+    """A stylesheet setting the HeroUI color variables from brand colors.
+
+    Render it once per page, e.g. as the first child of ``hero.provider``; the
+    components pick the colors up through the Tailwind plugin's variables.
+    """
+
+    @classmethod
+    def create(
+        cls,
+        *children,
+        primary: Optional[str] = None,
+        secondary: Optional[str] = None,
+        success: Optional[str] = None,
+        warning: Optional[str] = None,
+        danger: Optional[str] = None,
+        default: Optional[str] = None,
+        prefix: str = "heroui",
+        **props,
+    ) -> StyleEl:
+        """Create a Theme from base colors, or from CSS built with ``theme_css``.
+
+        Args:
+            *children: The stylesheet, e.g. a state var holding a tenant's
+                ``theme_css``; built from the colors when left out.
+            primary: The base color of ``primary``.
+            secondary: The base color of ``secondary``.
+            success: The base color of ``success``.
+            warning: The base color of ``warning``.
+            danger: The base color of ``danger``.
+            default: The base color of ``default``, the neutral gray.
+            prefix: The variable prefix configured in the HeroUI plugin.
+            **props: The props of the component.
+
+        Returns:
+            The Theme component.
+        """
+        if not children:
+            children = (
+                theme_css(
+                    primary, secondary, success, warning, danger, default, prefix
+                ),
+            )
+        return super().create(*children, **props)
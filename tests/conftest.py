@@ -0,0 +1,26 @@
+import pytest
+import reflex as rx
+from reflex.compiler import compiler
+from reflex.components.component import StatefulComponent
+
+from tests.states import FormState
+
+
+@pytest.fixture
+def compile_page():
+    """Compile a component as a page and return the page's JavaScript."""
+
+    def compile_page(component: rx.Component) -> str:
+        component._add_style_recursive({})
+        component = StatefulComponent.compile_from(component) or component
+        return compiler.compile_page("test", component, FormState)[1]
+
+    return compile_page
+
+
+@pytest.fixture
+def example_page(compile_page):
+    """Compile the index page of the example app and return its JavaScript."""
+    from examples.examples.examples import index
+
+    return compile_page(index())
@@ -0,0 +1,15 @@
+import reflex as rx
+
+
+class FormState(rx.State):
+    """A state with handlers for the components under test."""
+
+    text: str = ""
+
+    @rx.event
+    def set_text(self, value: str):
+        self.text = value
+
+    @rx.event
+    def save(self, data: dict):
+        pass
@@ -0,0 +1,66 @@
+import reflex as rx
+
+import heroui as hero
+
+
+class SearchState(rx.State):
+    """The state of a type-ahead search."""
+
+    query: str = ""
+
+    @rx.event
+    def search(self, query: str):
+        self.query = query
+
+
+def _input_change(component: rx.Component) -> str:
+    return str(rx.Var.create(component.event_triggers["on_input_change"]))
+
+
+def test_input_changes_are_debounced():
+    autocomplete = hero.autocomplete(on_input_change=SearchState.search)
+    assert "debounce" in _input_change(autocomplete)
+    autocomplete = hero.autocomplete(
+        on_input_change=SearchState.search, debounce_ms=None
+    )
+    assert "debounce" not in _input_change(autocomplete)
+
+
+def test_controlled_input_is_not_debounced():
+    autocomplete = hero.autocomplete(
+        input_value=SearchState.query, on_input_change=SearchState.search
+    )
+    assert "debounce" not in _input_change(autocomplete)
+
+
+def test_prefix_matches_ignore_case_and_come_sorted():
+    index = hero.PrefixIndex(["banana", "Apple", "apricot", "avocado", "apple"])
+    assert len(index) == 5
+    assert index.search("ap") == ["Apple", "apple", "apricot"]
+    assert index.search("AV") == ["avocado"]
+    assert index.search("cherry") == []
+    assert index.search("") == ["Apple", "apple", "apricot", "avocado", "banana"]
+
+
+def test_infix_matches_come_after_prefix_matches():
+    corpus = ["bread", "cornbread", "breadcrumb", "shortbread", "bred"]
+    assert hero.PrefixIndex(corpus).search("bread") == ["bread", "breadcrumb"]
+    index = hero.PrefixIndex(corpus, substring=True)
+    assert index.search("bread") == ["bread", "breadcrumb", "cornbread", "shortbread"]
+    assert index.search("BREAD", k=3) == ["bread", "breadcrumb", "cornbread"]
+    assert index.search("rea") == ["bread", "breadcrumb", "cornbread", "shortbread"]
+
+
+def test_results_are_limited_and_cached():
+    index = hero.PrefixIndex([f"sku-{i:04}" for i in range(1000)], cache_size=2)
+    assert index.search("sku-00", k=3) == ["sku-0000", "sku-0001", "sku-0002"]
+    assert len(index.search("sku")) == 10
+    assert (index.hits, index.misses) == (0, 2)
+
+    index.search("SKU-00", k=3).clear()
+    assert index.search("sku-00", k=3) == ["sku-0000", "sku-0001", "sku-0002"]
+    assert (index.hits, index.misses) == (2, 2)
+
+    index.search("sku-1")
+    index.search("sku", k=10)
+    assert (index.hits, index.misses) == (2, 4)
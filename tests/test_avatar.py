@@ -0,0 +1,67 @@
+import reflex as rx
+
+import heroui as hero
+
+
+class TeamState(hero.AvatarGroupState, rx.State):
+    """An avatar group state with the members kept on the server."""
+
+
+def _members(count: int) -> list[dict]:
+    return [{"key": str(i), "name": f"Member {i}", "src": ""} for i in range(count)]
+
+
+def test_max_follows_the_members_sent_by_default():
+    group = hero.avatar_group(items=TeamState.members, total=TeamState.total)
+    assert str(group.max) == str(TeamState.members.length())
+
+
+def test_explicit_max_is_kept():
+    group = hero.avatar_group(items=TeamState.members, total=TeamState.total, max=3)
+    assert str(group.max) == "3"
+    assert "members.length < 3" in str(group.total)
+
+
+def test_overflow_loads_on_click_only(compile_page):
+    page = compile_page(
+        hero.avatar_group(
+            items=TeamState.members,
+            total=TeamState.total,
+            on_overflow=TeamState.load_overflow,
+        )
+    )
+    assert "load_overflow" in page
+    assert "onMouseEnter" not in page
+    assert "onClick" in page
+
+
+def test_overflow_never_loads_past_the_total():
+    state = TeamState(_reflex_internal_init=True)
+    state._set_all_members(_members(60))
+    assert len(state.members) == TeamState.max_visible
+    state.load_overflow()
+    assert (state.members_offset, len(state.members)) == (5, 50)
+    state.load_overflow()
+    assert (state.members_offset, len(state.members)) == (55, 5)
+    state.load_overflow()
+    assert state.members_offset == 55
+    assert state.members == _members(60)[55:]
+
+
+def test_overflow_sends_only_the_new_window(compile_page):
+    page = compile_page(
+        hero.avatar_group(
+            items=TeamState.members,
+            window_offset=TeamState.members_offset,
+            total=TeamState.total,
+            on_overflow=TeamState.load_overflow,
+        )
+    )
+    assert ".slice(0, " in page
+    assert "members_offset" in page
+    assert page.count(".map(") == 1
+
+
+def test_only_the_loaders_are_events():
+    assert "_set_all_members" not in TeamState.event_handlers
+    assert {"load_overflow", "refresh_members"} <= set(TeamState.event_handlers)
@@ -0,0 +1,66 @@
+import pytest
+import reflex as rx
+
+import heroui as hero
+from src.cache.cache import RenderCache, render_cache, static_key
+from tests.states import FormState
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setattr(render_cache, "enabled", True)
+    render_cache.clear()
+    yield render_cache
+    render_cache.clear()
+
+
+def test_identical_components_render_once(cache):
+    first = hero.button("Save", color="primary").render()
+    second = hero.button("Save", color="primary").render()
+    assert first == second
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_rendered_output_is_not_shared(cache):
+    hero.button("Save", color="primary").render()["props"].append("extra")
+    rendered = hero.button("Save", color="primary").render()
+    rendered["children"][0]["contents"] = "changed"
+    assert "extra" not in hero.button("Save", color="primary").render()["props"]
+    assert "changed" not in str(hero.button("Save", color="primary").render())
+
+
+def test_state_bound_components_bypass_the_cache(cache):
+    assert static_key(hero.button(FormState.text)) is None
+    assert static_key(hero.button("Save", is_disabled=FormState.text == "")) is None
+    assert static_key(hero.button("Save", on_press=FormState.set_text(""))) is None
+    hero.button(FormState.text).render()
+    assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = RenderCache(maxsize=2)
+    cache.put("a", ({}, {}))
+    cache.put("b", ({}, {}))
+    assert cache.get("a") is not None
+    cache.put("c", ({}, {}))
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_output_is_the_same_with_the_cache_off(cache, compile_page):
+    def page():
+        return rx.fragment(
+            hero.card(hero.card_body(hero.chip("New", color="success"))),
+            hero.button("Save", color="primary"),
+            hero.button("Save", color="primary"),
+            hero.input(
+                label="Name", value=FormState.text, on_change=FormState.set_text
+            ),
+        )
+
+    cached = compile_page(page())
+    assert cache.hits > 0
+    cache.enabled = False
+    assert compile_page(page()) == cached
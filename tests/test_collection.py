@@ -0,0 +1,55 @@
+import re
+
+import reflex as rx
+
+import heroui as hero
+
+
+class TagState(rx.State):
+    """Lists of tags and members rendered as collections."""
+
+    tags: list[str] = ["python", "reflex", "heroui"]
+    members: list[dict[str, str]] = [{"id": "u1", "name": "Ada"}]
+
+    @rx.event
+    def remove(self, tag: str):
+        pass
+
+    @rx.event
+    def pick(self, key: str):
+        pass
+
+
+def _template(page: str, tag: str) -> tuple[str, str]:
+    """Get the parameter and props of the item template of the page's one map."""
+    assert page.count(".map(") == 1
+    (item,) = re.findall(r"\.map\(\((\w+),\w+\)=>", page)
+    props = re.search(rf"jsx\(\n{tag},\n(\{{.*?\}}),\n", page, re.DOTALL).group(1)
+    return item, props
+
+
+def test_chip_list_maps_once_and_closes_by_key(compile_page):
+    page = compile_page(
+        hero.chip_list(TagState.tags, on_close=TagState.remove, variant="flat")
+    )
+    item, props = _template(page, "Chip")
+    assert f"key:{item}," in props
+    assert re.search(
+        rf'onClose:.*tag_state\.remove", \(\{{ \["tag"\] : {item} \}}\)', props
+    )
+    assert 'variant:"flat"' in props
+    assert '"python"' not in page
+
+
+def test_button_list_keys_dict_items_by_their_field(compile_page):
+    page = compile_page(
+        hero.button_list(
+            TagState.members, on_press=TagState.pick, key_field="id", label_field="name"
+        )
+    )
+    item, props = _template(page, "Button")
+    assert f'key:{item}["id"],' in props
+    assert re.search(
+        rf'onPress:.*tag_state\.pick", \(\{{ \["key"\] : {item}\["id"\] \}}\)', props
+    )
+    assert f'}},\n{item}["name"]\n' in page
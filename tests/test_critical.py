@@ -0,0 +1,111 @@
+import re
+import shutil
+from pathlib import Path
+
+import pytest
+import reflex as rx
+
+import heroui as hero
+from src.provider.critical import CRITICAL_CSS_MARKER, critical_css
+
+CSS = """
+/* HeroUI theme */
+@charset "utf-8";
+:root{--heroui-primary:210 100% 50%}
+.z-0{z-index:0}
+.bg-primary{background:hsl(var(--heroui-primary))}
+.bg-danger,.text-danger{color:red}
+.dark .bg-primary{background:black}
+.group:hover .group-hover\\:opacity-100{opacity:1}
+.animate-spin{animation:spin 1s linear infinite}
+.animate-ping{animation:ping 1s infinite}
+@keyframes spin{to{transform:rotate(360deg)}}
+@keyframes ping{75%,to{opacity:0}}
+@media (min-width:640px){.sm\\:flex{display:flex}.sm\\:hidden{display:none}}
+@font-face{font-family:Inter;src:url(inter.woff2)}
+"""
+
+PAGE = """<!DOCTYPE html><html><head>
+<meta name="heroui-critical-css"/>
+<link rel="stylesheet" href="/_next/static/css/app.css"/>
+</head><body><div class="bg-primary sm:flex animate-spin">x</div></body></html>"""
+
+
+def test_critical_css_keeps_the_rules_the_markup_uses():
+    critical = critical_css(CSS, {"bg-primary", "sm:flex", "animate-spin", "dark"})
+    assert '@charset "utf-8";' in critical
+    assert ":root{--heroui-primary:210 100% 50%}" in critical
+    assert ".bg-primary{" in critical
+    assert ".dark .bg-primary{background:black}" in critical
+    assert "@media (min-width:640px){.sm\\:flex{display:flex}}" in critical
+    assert "@font-face" in critical
+    assert "@keyframes spin" in critical
+    assert ".z-0" not in critical
+    assert "danger" not in critical
+    assert "group-hover" not in critical
+    assert "sm\\:hidden" not in critical
+    assert "ping" not in critical
+    assert "HeroUI theme" not in critical
+
+
+# The marker, rendered by next/head into the <head> of the prerendered page.
+HEAD_MARKER = re.compile(
+    rf'jsx\(\nNextHead,\n\{{\}},\njsx\("meta",\{{name:"{CRITICAL_CSS_MARKER}"\}},\)'
+)
+
+
+def test_provider_marks_the_head_of_the_page(compile_page):
+    page = compile_page(hero.provider(rx.text("content"), critical_css=True))
+    assert 'import NextHead from "next/head"' in page
+    assert HEAD_MARKER.search(page)
+    assert CRITICAL_CSS_MARKER not in compile_page(hero.provider(rx.text("content")))
+
+
+def test_example_page_marks_its_head(example_page):
+    assert len(HEAD_MARKER.findall(example_page)) == 1
+
+
+def test_inline_critical_css_only_changes_opted_in_pages(tmp_path):
+    css = tmp_path / "_next/static/css/app.css"
+    css.parent.mkdir(parents=True)
+    css.write_text(CSS)
+    (tmp_path / "index.html").write_text(PAGE)
+    other = PAGE.replace('<meta name="heroui-critical-css"/>', "")
+    (tmp_path / "other.html").write_text(other)
+
+    sizes = hero.inline_critical_css(tmp_path)
+    assert list(sizes) == ["index.html"]
+    inlined, total = sizes["index.html"]
+    assert inlined < total == len(CSS.encode())
+
+    html = (tmp_path / "index.html").read_text()
+    assert "<style data-heroui-critical>" in html
+    assert html.index("<style data-heroui-critical>") < html.index('media="print"')
+    assert "<noscript><link" in html
+    assert (tmp_path / "other.html").read_text() == other
+
+    assert hero.inline_critical_css(tmp_path) == {}
+
+
+# Written by ``reflex export --frontend-only --no-zip`` in examples/.
+EXPORT_DIR = Path(__file__).parents[1] / "examples" / ".web" / "_static"
+
+
+@pytest.mark.skipif(
+    not (EXPORT_DIR / "index.html").exists(),
+    reason="the example app has not been exported",
+)
+def test_example_export_inlines_the_critical_css(tmp_path):
+    export = shutil.copytree(EXPORT_DIR, tmp_path / "_static")
+    sizes = hero.inline_critical_css(export)
+    inlined, total = sizes["index.html"]
+    assert 0 < inlined < total
+
+    html = (export / "index.html").read_text()
+    head = html[: html.index("</head>")]
+    assert f'name="{CRITICAL_CSS_MARKER}"' in head
+    assert "<style data-heroui-critical>" in head
+    start = html.index("<style data-heroui-critical>")
+    critical = html[start : html.index("</style>", start)]
+    # The alert and chip of the page are success-colored.
+    assert "success" in critical
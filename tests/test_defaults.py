@@ -0,0 +1,95 @@
+import pytest
+import reflex as rx
+
+import heroui as hero
+from src.provider.defaults import LIBRARY_DEFAULTS, apply_defaults
+
+
+def _props(component: rx.Component) -> list[str]:
+    return component.render()["props"]
+
+
+def test_defaults_fill_props_left_out():
+    button = hero.button("Save")
+    apply_defaults(rx.fragment(button), {"button": {"size": "sm"}})
+    assert 'size:"sm"' in _props(button)
+
+
+def test_explicit_prop_equal_to_library_default_is_not_overridden():
+    button = hero.button("Save", size="md")
+    apply_defaults(rx.fragment(button), {"button": {"size": "sm"}})
+    assert 'size:"sm"' not in _props(button)
+    assert button.size is None
+
+
+def test_explicit_prop_wins_over_default():
+    button = hero.button("Save", size="lg")
+    apply_defaults(rx.fragment(button), {"button": {"size": "sm"}})
+    assert 'size:"lg"' in _props(button)
+
+
+def test_library_defaults_are_dropped():
+    button = hero.button("Save")
+    apply_defaults(rx.fragment(button), {})
+    assert _props(button) == []
+
+
+def test_collection_components_drop_library_defaults():
+    for name in ("listbox", "select", "table", "autocomplete"):
+        assert name in LIBRARY_DEFAULTS
+    select = hero.select(hero.select_item("One", key="one"), label="Pick")
+    apply_defaults(rx.fragment(select), {})
+    props = _props(select)
+    assert 'variant:"flat"' not in props
+    assert any(prop.startswith("label:") for prop in props)
+
+
+def test_provider_resolves_defaults():
+    chip = hero.chip("new", size="md")
+    other = hero.chip("old")
+    hero.provider(chip, other, defaults={"chip": {"size": "sm"}})
+    assert chip.size is None
+    assert 'size:"sm"' in _props(other)
+
+
+class TagState(rx.State):
+    """Items rendered with ``rx.foreach``."""
+
+    tags: list[str] = []
+    rows: list[dict] = []
+
+
+def test_item_templates_and_component_props_get_defaults(compile_page):
+    page = compile_page(
+        hero.provider(
+            hero.chip_list(TagState.tags),
+            hero.button("Save", start_content=hero.spinner()),
+            hero.table(
+                hero.table_header(hero.table_column("Name", key="name")),
+                hero.table_body(items=TagState.rows, columns=["name"]),
+                aria_label="Rows",
+            ),
+            defaults={
+                "chip": {"size": "sm"},
+                "spinner": {"color": "warning"},
+                "table_row": {"text_value": "row"},
+            },
+        )
+    )
+    assert 'Chip,\n{key:item,size:"sm"}' in page
+    assert 'color:"warning"' in page
+    assert 'textValue:"row"' in page
+
+
+@pytest.mark.parametrize(
+    "defaults, error, match",
+    [
+        ({"buton": {"size": "sm"}}, ValueError, "Unknown component 'buton'"),
+        ({"chip_list": {"size": "sm"}}, ValueError, "Unknown component"),
+        ({"button": {"sise": "sm"}}, ValueError, "sise"),
+        ({"button": {"size": "huge"}}, TypeError, "Button.size"),
+    ],
+)
+def test_defaults_are_checked_up_front(defaults, error, match):
+    with pytest.raises(error, match=match):
+        apply_defaults(rx.fragment(rx.text("no buttons here")), defaults)
@@ -0,0 +1,235 @@
+import json
+import shutil
+import subprocess
+
+import pytest
+import reflex as rx
+
+import heroui as hero
+
+
+class ClickState(rx.State):
+    """Handlers taking the payload of an event."""
+
+    @rx.event
+    def handle(self, info: dict):
+        pass
+
+    @rx.event
+    def handle_nothing(self):
+        pass
+
+    @rx.event
+    def handle_value(self, value: str):
+        pass
+
+    @rx.event
+    def handle_checked(self, checked: bool):
+        pass
+
+
+# The primitive fields of a browser event, which is what sending the whole event
+# costs at best; nested objects such as ``target`` and ``view`` come on top.
+MOUSE_EVENT = {
+    "type": "click",
+    "isTrusted": True,
+    "bubbles": True,
+    "cancelable": True,
+    "defaultPrevented": False,
+    "eventPhase": 3,
+    "timeStamp": 5123.400000035763,
+    "detail": 1,
+    "altKey": False,
+    "ctrlKey": False,
+    "metaKey": True,
+    "shiftKey": False,
+    "button": 0,
+    "buttons": 0,
+    "clientX": 412,
+    "clientY": 237,
+    "movementX": 0,
+    "movementY": 0,
+    "offsetX": 38,
+    "offsetY": 14,
+    "pageX": 412,
+    "pageY": 1237,
+    "screenX": 1612,
+    "screenY": 502,
+    "x": 412,
+    "y": 237,
+}
+PRESS_EVENT = {
+    "type": "press",
+    "pointerType": "mouse",
+    "altKey": False,
+    "ctrlKey": False,
+    "metaKey": True,
+    "shiftKey": False,
+    "x": 38,
+    "y": 14,
+}
+IMAGE_EVENT = {
+    **MOUSE_EVENT,
+    "type": "load",
+    "target": {"naturalWidth": 1200, "naturalHeight": 800, "currentSrc": "/a.webp"},
+}
+
+# Runs the compiled JS of an event trigger on sample arguments, with Reflex's
+# ``Event`` and ``addEvents`` replaced to print the payload of each event queued.
+TRIGGER = """
+const Event = (name, payload) => payload;
+const addEvents = (events) => console.log(JSON.stringify(events));
+(%s)(...%s);
+"""
+
+
+def _payloads(component: rx.Component, trigger: str, *args) -> list[dict]:
+    """Get the payloads a trigger sends when called with sample browser arguments."""
+    if shutil.which("node") is None:
+        pytest.skip("node is not installed")
+    chain = str(rx.Var.create(component.event_triggers[trigger]))
+    script = TRIGGER % (chain, json.dumps(args))
+    result = subprocess.run(
+        ["node", "-e", script], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+def _payload(component: rx.Component, trigger: str, event: dict) -> dict:
+    """Get the payload of the single handler of a trigger, for a sample event."""
+    (payload,) = _payloads(component, trigger, event)
+    return payload
+
+
+def _size(payload: dict) -> int:
+    return len(json.dumps(payload, separators=(",", ":")).encode())
+
+
+@pytest.mark.parametrize(
+    "component, trigger, event, keys",
+    [
+        (
+            hero.button("Open", on_click=ClickState.handle),
+            "on_click",
+            MOUSE_EVENT,
+            {"button", "alt_key", "ctrl_key", "meta_key", "shift_key"},
+        ),
+        (
+            hero.button("Open", on_press=ClickState.handle),
+            "on_press",
+            PRESS_EVENT,
+            {"pointer_type", "alt_key", "ctrl_key", "meta_key", "shift_key"},
+        ),
+        (
+            hero.image(src="/a.webp", on_load=ClickState.handle),
+            "on_load",
+            IMAGE_EVENT,
+            {"natural_width", "natural_height", "src"},
+        ),
+    ],
+)
+def test_payload_is_smaller_than_the_event(component, trigger, event, keys):
+    payload = _payload(component, trigger, event)
+    assert set(payload["info"]) == keys
+    assert _size(payload) < _size(event)
+
+
+def test_click_sends_mouse_fields():
+    button = hero.button("Open", on_click=ClickState.handle)
+    payload = _payload(button, "on_click", MOUSE_EVENT)
+    assert payload == {
+        "info": {
+            "button": 0,
+            "alt_key": False,
+            "ctrl_key": False,
+            "meta_key": True,
+            "shift_key": False,
+        }
+    }
+    assert _size(payload) * 4 < _size(MOUSE_EVENT)
+
+
+def test_handlers_without_arguments_send_nothing():
+    button = hero.button("Open", on_click=ClickState.handle_nothing)
+    assert _payload(button, "on_click", MOUSE_EVENT) == {}
+
+
+def test_lambdas_pick_fields():
+    button = hero.button(
+        "Open", on_press=lambda info: ClickState.handle_value(info["pointer_type"])
+    )
+    assert _payload(button, "on_press", PRESS_EVENT) == {"value": "mouse"}
+
+
+PRESS_INFO = {
+    "pointer_type": "mouse",
+    "alt_key": False,
+    "ctrl_key": False,
+    "meta_key": True,
+    "shift_key": False,
+}
+CHECKBOX_EVENT = {**MOUSE_EVENT, "type": "change", "target": {"checked": True}}
+INPUT_EVENT = {**MOUSE_EVENT, "type": "change", "target": {"value": "hello"}}
+
+
+@pytest.mark.parametrize(
+    "component, trigger, args, payload",
+    [
+        (
+            hero.snippet("pip install heroui", on_copy=ClickState.handle_value),
+            "on_copy",
+            ["pip install heroui"],
+            {"value": "pip install heroui"},
+        ),
+        (
+            hero.card(on_press=ClickState.handle),
+            "on_press",
+            [PRESS_EVENT],
+            {"info": PRESS_INFO},
+        ),
+        (
+            hero.card(on_press_start=ClickState.handle),
+            "on_press_start",
+            [PRESS_EVENT],
+            {"info": PRESS_INFO},
+        ),
+        (
+            hero.card(on_press_change=ClickState.handle_checked),
+            "on_press_change",
+            [True],
+            {"checked": True},
+        ),
+        (
+            hero.chip("Tag", on_close=ClickState.handle),
+            "on_close",
+            [PRESS_EVENT],
+            {"info": PRESS_INFO},
+        ),
+        (
+            hero.checkbox("Agree", on_change=ClickState.handle_checked),
+            "on_change",
+            [CHECKBOX_EVENT],
+            {"checked": True},
+        ),
+        (
+            hero.switch(on_change=ClickState.handle_checked),
+            "on_change",
+            [CHECKBOX_EVENT],
+            {"checked": True},
+        ),
+        (
+            hero.input(on_change=ClickState.handle_value),
+            "on_change",
+            [INPUT_EVENT],
+            {"value": "hello"},
+        ),
+        (
+            hero.textarea(on_change=ClickState.handle_value),
+            "on_change",
+            [INPUT_EVENT],
+            {"value": "hello"},
+        ),
+    ],
+)
+def test_changed_triggers_send_their_payload(component, trigger, args, payload):
+    assert _payloads(component, trigger, *args) == [payload]
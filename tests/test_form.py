@@ -0,0 +1,139 @@
+import json
+import re
+import shutil
+import subprocess
+
+import pytest
+import reflex as rx
+
+import heroui as hero
+from src.form.form import UNCONTROLLED_FORM
+
+
+class ProfileState(rx.State):
+    """The state of the README's profile form."""
+
+    errors: dict[str, str] = {}
+
+    @rx.event
+    def save(self, data: dict):
+        pass
+
+    @rx.event
+    def draft(self, data: dict):
+        pass
+
+
+def _profile_form(**props) -> rx.Component:
+    return hero.form(
+        hero.input(name="email", type="email", label="Email", is_required=True),
+        hero.textarea(name="bio", label="Bio", max_length=500),
+        hero.checkbox("Newsletter", name="newsletter"),
+        hero.checkbox_group(
+            hero.checkbox("UI", value="ui"),
+            hero.checkbox("Data", value="data"),
+            name="topics",
+        ),
+        hero.button("Save", type="submit", color="primary"),
+        on_submit=ProfileState.save,
+        validation_errors=ProfileState.errors,
+        **props,
+    )
+
+
+def test_form_fields_render_as_native_props(compile_page):
+    page = compile_page(_profile_form())
+    assert 'type:"submit"' in page
+    assert 'css:({ ["type"]' not in page
+    assert "maxLength:500" in page
+    for name in ("email", "bio", "newsletter", "topics"):
+        assert f'name:"{name}"' in page
+    assert page.count("function HeroForm(") == 1
+
+
+def test_textarea_takes_length_limits():
+    props = hero.textarea(min_length=10, max_length=500).render()["props"]
+    assert "minLength:10" in props
+    assert "maxLength:500" in props
+
+
+def test_sync_needs_a_dirty_handler():
+    with pytest.raises(ValueError, match="on_dirty"):
+        _profile_form(sync_ms=5000)
+    with pytest.raises(ValueError, match="positive"):
+        _profile_form(sync_ms=0, on_dirty=ProfileState.draft)
+    _profile_form(sync_ms=5000, on_dirty=ProfileState.draft)
+
+
+def test_form_events_are_wired_through_hero_form(compile_page):
+    page = compile_page(_profile_form(sync_ms=5000, on_dirty=ProfileState.draft))
+    props = re.search(r"jsx\(\nHeroForm,\n(\{.*?\}),\n", page, re.DOTALL).group(1)
+    assert re.search(r"onSubmit:\(\(_data\) => .*profile_state\.save", props)
+    # A handler of a custom prop is memoized into a callback next to the form.
+    (callback,) = re.findall(r"onDirty:(on_dirty_\w+)", props)
+    definition = page[page.index(f"const {callback} = useCallback(") :]
+    assert "profile_state.draft" in definition.splitlines()[0]
+    assert "syncMs:5000" in props
+
+
+def test_validation_behavior_is_inherited_when_unset():
+    assert not any(
+        prop.startswith("validationBehavior")
+        for prop in _profile_form().render()["props"]
+    )
+    form = _profile_form(validation_behavior="aria")
+    assert 'validationBehavior:"aria"' in form.render()["props"]
+
+
+# Fields as heroFormInvalid sees them: attributes, type, value and validity.
+FIELDS = {
+    "valid": [{"name": "email", "value": "a@b.c"}],
+    "displayed_error": [{"name": "email", "value": "a@b.c", "aria-invalid": "true"}],
+    "required_empty": [{"name": "bio", "value": "", "aria-required": "true"}],
+    "required_box": [{"name": "terms", "type": "checkbox", "aria-required": "true"}],
+    "constraint": [
+        {"name": "bio", "value": "ok"},
+        {"name": "email", "value": "nope", "valid": False},
+    ],
+    "disabled_constraint": [
+        {"name": "email", "value": "nope", "valid": False, "willValidate": False}
+    ],
+}
+
+INVALID = """
+%s
+const field = ({ valid = true, willValidate = true, ...attrs }) => ({
+  ...attrs,
+  willValidate,
+  validity: { valid },
+  checked: false,
+  getAttribute: (name) => attrs[name] ?? null,
+});
+const cases = %s;
+const invalid = {};
+for (const [name, fields] of Object.entries(cases)) {
+  const form = { querySelectorAll: () => fields.map(field) };
+  invalid[name] = heroFormInvalid(form)?.name ?? null;
+}
+console.log(JSON.stringify(invalid));
+"""
+
+
+def test_aria_validation_checks_field_constraints():
+    if shutil.which("node") is None:
+        pytest.skip("node is not installed")
+    helpers = UNCONTROLLED_FORM[: UNCONTROLLED_FORM.index("function HeroForm")]
+    result = subprocess.run(
+        ["node", "-e", INVALID % (helpers, json.dumps(FIELDS))],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert json.loads(result.stdout) == {
+        "valid": None,
+        "displayed_error": "email",
+        "required_empty": "bio",
+        "required_box": "terms",
+        "constraint": "email",
+        "disabled_constraint": None,
+    }
@@ -0,0 +1,53 @@
+import pytest
+
+from src.code.highlight import HIGHLIGHT_THEMES, Highlighter, highlight
+
+pytest.importorskip("pygments")
+
+CODE = "def greet(name):\n    return f'hi {name}'\n"
+
+
+@pytest.fixture
+def theme(monkeypatch):
+    classes = dict(HIGHLIGHT_THEMES["heroui"])
+    monkeypatch.setitem(HIGHLIGHT_THEMES, "test", classes)
+    return classes
+
+
+def test_results_are_cached(tmp_path, theme):
+    first = Highlighter(cache_dir=tmp_path)
+    chunks = first.highlight(CODE, "python", "test")
+    assert '<span class="text-primary">def</span>' in chunks[0]
+    assert first.highlight(CODE, "python", "test") == chunks
+    assert (first.hits, first.misses) == (1, 1)
+
+    second = Highlighter(cache_dir=tmp_path)
+    assert second.highlight(CODE, "python", "test") == chunks
+    assert (second.hits, second.misses) == (1, 0)
+
+
+def test_changing_the_theme_invalidates_both_caches(tmp_path, theme):
+    Highlighter(cache_dir=tmp_path).highlight(CODE, "python", "test")
+
+    theme["Keyword"] = "text-danger"
+    fresh = Highlighter(cache_dir=tmp_path)
+    chunks = fresh.highlight(CODE, "python", "test")
+    assert '<span class="text-danger">def</span>' in chunks[0]
+    assert fresh.misses == 1
+
+    theme["Keyword"] = "text-primary"
+    chunks = highlight(CODE, "python", "test")
+    assert '<span class="text-primary">def</span>' in chunks[0]
+
+
+def test_chunks_split_on_lines():
+    chunks = Highlighter().highlight("a = 1\nb = 2\nc = 3\n", "python", chunk_lines=2)
+    assert len(chunks) == 2
+    assert chunks[0].count("\n") == 2
+
+
+def test_unknown_theme_and_language():
+    with pytest.raises(ValueError, match="theme"):
+        Highlighter().highlight(CODE, "python", "nope")
+    with pytest.raises(ValueError, match="language"):
+        Highlighter().highlight(CODE, "not-a-language")
@@ -0,0 +1,90 @@
+import base64
+import io
+import sys
+
+import pytest
+
+import heroui as hero
+from src.image.pipeline import ImagePipeline
+
+PILImage = pytest.importorskip("PIL.Image")
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    PILImage.new("RGB", (1000, 500), "red").save(assets / "photo.jpg")
+    return ImagePipeline(breakpoints=(320, 640, 1280), assets_dir=assets)
+
+
+def test_variants_stop_at_the_source_width(pipeline):
+    result = pipeline.process(pipeline.resolve("/photo.jpg"))
+    assert (result.width, result.height) == (1000, 500)
+    assert [w for w, _ in result.variants] == [320, 640, 1000]
+    for w, url in result.variants:
+        with PILImage.open(pipeline.assets_dir / url.lstrip("/")) as variant:
+            assert variant.size == (w, w // 2)
+            assert variant.format == "WEBP"
+    assert result.src_set == ", ".join(f"{url} {w}w" for w, url in result.variants)
+
+
+def test_image_gets_src_set_sizes_and_dimensions(pipeline):
+    result = pipeline.process(pipeline.resolve("/photo.jpg"))
+    props = hero.image(src="/photo.jpg", pipeline=pipeline).render()["props"]
+    assert f'srcSet:"{result.src_set}"' in props
+    assert 'sizes:"100vw"' in props
+    assert "width:1000" in props
+    assert "height:500" in props
+
+    props = hero.image(src="/photo.jpg", width=400, pipeline=pipeline).render()
+    assert 'sizes:"400px"' in props["props"]
+    assert "height:200" in props["props"]
+
+
+def test_without_pillow_the_src_is_left_alone(pipeline, monkeypatch):
+    monkeypatch.setitem(sys.modules, "PIL", None)
+    props = hero.image(src="/photo.jpg", pipeline=pipeline).render()["props"]
+    assert not any(prop.startswith(("srcSet", "width", "height")) for prop in props)
+    with pytest.raises(ImportError, match="Pillow"):
+        ImagePipeline(assets_dir=pipeline.assets_dir).process(
+            pipeline.assets_dir / "photo.jpg"
+        )
+
+
+def test_palette_transparency_is_kept(pipeline):
+    source = PILImage.new("P", (400, 200), 1)
+    source.putpalette([255, 255, 255, 255, 0, 0])
+    source.info["transparency"] = 1
+    source.save(pipeline.assets_dir / "logo.png")
+
+    result = pipeline.process(pipeline.resolve("/logo.png"))
+    with PILImage.open(pipeline.assets_dir / result.variants[0][1].lstrip("/")) as out:
+        assert out.mode == "RGBA"
+        assert out.getpixel((0, 0))[3] == 0
+
+
+def test_output_dir_must_be_inside_the_assets(tmp_path):
+    with pytest.raises(ValueError, match="inside assets_dir"):
+        ImagePipeline(assets_dir=tmp_path / "assets", output_dir=tmp_path / "out")
+    pipeline = ImagePipeline(
+        assets_dir=tmp_path / "assets", output_dir=tmp_path / "assets" / "out"
+    )
+    assert pipeline._url("a.webp") == "/out/a.webp"
+
+
+def test_blurred_placeholder_replaces_the_skeleton(pipeline):
+    result = pipeline.process(pipeline.resolve("/photo.jpg"))
+    assert result.placeholder.startswith("data:image/webp;base64,")
+    with PILImage.open(
+        io.BytesIO(base64.b64decode(result.placeholder.split(",", 1)[1]))
+    ) as thumbnail:
+        assert thumbnail.size == (16, 8)
+        assert thumbnail.getpixel((8, 4))[0] > 200
+
+    props = hero.image(src="/photo.jpg", pipeline=pipeline).render()["props"]
+    assert f'fallbackSrc:"{result.placeholder}"' in props
+    assert "disableSkeleton:true" in props
+
+    props = hero.image(src="/photo.jpg", placeholder=False, pipeline=pipeline)
+    assert not any(p.startswith("fallbackSrc") for p in props.render()["props"])
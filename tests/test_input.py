@@ -0,0 +1,147 @@
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+import reflex as rx
+
+import heroui as hero
+from tests.states import FormState
+
+# Replays a typing burst (one keystroke per ``interval`` ms, then a blur) through
+# the debounce and throttle helpers of the Reflex frontend, as ``addEvents`` in
+# its state.js applies them, on a virtual clock. Prints the number of events sent.
+BURST = """
+let now = 0, id = 0;
+const timers = new Map();
+globalThis.setTimeout = (fn, ms) => (timers.set(++id, [now + ms, fn]), id);
+globalThis.clearTimeout = (timer) => timers.delete(timer);
+const advance = (to) => {
+  for (;;) {
+    const due = [...timers].filter(([, [t]]) => t <= to).sort((a, b) => a[1][0] - b[1][0]);
+    if (!due.length) break;
+    const [timer, [t, fn]] = due[0];
+    timers.delete(timer);
+    now = t;
+    fn();
+  }
+  now = to;
+};
+const { default: debounce } = await import("./debounce.mjs");
+const { default: throttle } = await import("./throttle.mjs");
+const [triggers, keystrokes, interval] = JSON.parse(process.argv[2]);
+let sent = 0;
+const addEvents = (name, actions) => {
+  if (actions.throttle && !throttle(name, actions.throttle)) return;
+  if (actions.debounce) debounce(name, () => sent++, actions.debounce);
+  else sent++;
+};
+for (let key = 0; key < keystrokes; key++) {
+  advance(key * interval);
+  for (const name of ["on_change", "on_value_change"]) {
+    if (name in triggers) addEvents(name, triggers[name]);
+  }
+}
+advance(keystrokes * interval);
+if ("on_blur" in triggers) addEvents("on_blur", triggers.on_blur);
+advance(now + 60000);
+console.log(sent);
+"""
+
+
+@pytest.fixture
+def typing_burst(tmp_path):
+    """Count the events a field sends for a burst of keystrokes and a blur."""
+    if shutil.which("node") is None:
+        pytest.skip("node is not installed")
+    helpers = Path(rx.__file__).parent / ".templates" / "web" / "utils" / "helpers"
+    for name in ("debounce", "throttle"):
+        shutil.copy(helpers / f"{name}.js", tmp_path / f"{name}.mjs")
+    (tmp_path / "burst.mjs").write_text(BURST)
+
+    def typing_burst(field, keystrokes: int = 20, interval: int = 50) -> int:
+        triggers = {
+            trigger: chain.event_actions
+            for trigger, chain in field.event_triggers.items()
+        }
+        args = json.dumps([triggers, keystrokes, interval])
+        result = subprocess.run(
+            ["node", "burst.mjs", args],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return int(result.stdout)
+
+    return typing_burst
+
+
+def test_typing_burst_event_counts(typing_burst):
+    # 20 keystrokes, 50 ms apart, then a blur.
+    assert typing_burst(hero.input(on_value_change=FormState.set_text)) == 20
+    debounced = hero.input(on_value_change=FormState.set_text, debounce_ms=300)
+    assert typing_burst(debounced) == 1
+    # Keystrokes at 0 and 500 ms, then the settled value on blur.
+    throttled = hero.input(on_value_change=FormState.set_text, throttle_ms=500)
+    assert typing_burst(throttled) == 3
+    assert typing_burst(hero.input(on_change=FormState.set_text, emit="blur")) == 1
+
+
+def test_debounce_limits_both_value_events():
+    field = hero.input(
+        on_value_change=FormState.set_text,
+        on_change=FormState.set_text,
+        debounce_ms=300,
+    )
+    for trigger in ("on_value_change", "on_change"):
+        assert field.event_triggers[trigger].event_actions == {"debounce": 300}
+
+
+def test_throttle_also_sends_the_settled_value_on_blur():
+    field = hero.textarea(on_value_change=FormState.set_text, throttle_ms=500)
+    assert field.event_triggers["on_value_change"].event_actions == {"throttle": 500}
+    assert "on_blur" in field.event_triggers
+
+
+def test_emit_blur_sends_no_event_per_keystroke(compile_page):
+    field = hero.input(on_change=FormState.set_text, emit="blur")
+    assert set(field.event_triggers) == {"on_blur"}
+    page = compile_page(field)
+    assert "onBlur" in page
+    assert "onChange" not in page
+
+
+def test_debounced_handler_is_emitted_once_per_pause(compile_page):
+    page = compile_page(hero.input(on_value_change=FormState.set_text, debounce_ms=300))
+    assert page.count("set_text") == 1
+    assert '["debounce"] : 300' in page
+
+
+def test_rate_limit_rejects_a_controlled_value():
+    with pytest.raises(ValueError, match="default_value"):
+        hero.input(
+            value=FormState.text,
+            on_value_change=FormState.set_text,
+            debounce_ms=300,
+        )
+
+
+def test_rate_limit_modes_are_exclusive():
+    with pytest.raises(ValueError, match="Only one"):
+        hero.input(on_value_change=FormState.set_text, debounce_ms=1, emit="blur")
+
+
+def test_controlled_value_without_rate_limit_stays_controlled():
+    field = hero.input(value=FormState.text, on_value_change=FormState.set_text)
+    assert str(field.value) == str(FormState.text)
+    assert "debounce" not in field.event_triggers["on_value_change"].event_actions
+
+
+@pytest.mark.parametrize("limit", [{"emit": "blur"}, {"throttle_ms": 500}])
+def test_blur_modes_take_one_value_event(limit):
+    with pytest.raises(ValueError, match="only one"):
+        hero.input(
+            on_change=FormState.set_text, on_value_change=FormState.set_text, **limit
+        )
@@ -0,0 +1,36 @@
+from reflex.components.component import StatefulComponent
+
+import heroui as hero
+from tests.states import FormState
+
+
+def _imports(page: str) -> list[str]:
+    return [line for line in page.splitlines() if line.startswith("import ")]
+
+
+def test_static_components_are_imported_dynamically(compile_page):
+    page = compile_page(hero.lazy(hero.card(hero.card_body("Below the fold"))))
+    assert not any("@heroui/card" in line for line in _imports(page))
+    assert "lazy(() => import('@heroui/card')" in page
+
+
+def test_memoized_interactive_components_are_imported_dynamically(compile_page):
+    page = compile_page(
+        hero.lazy(
+            hero.card(hero.card_body(hero.button("Save", on_press=FormState.save)))
+        )
+    )
+    assert not any("@heroui/button" in line for line in _imports(page))
+    assert "const LazyButton = lazy(() => import('@heroui/button')" in page
+    assert "LazyButton,\n" in page
+
+
+def test_shared_memoized_components_keep_their_static_import():
+    lazy = hero.lazy(hero.button("Save", on_press=FormState.save))
+    lazy._add_style_recursive({})
+    lazy = StatefulComponent.compile_from(lazy)
+    memoized = lazy.children[0]
+    assert isinstance(memoized, StatefulComponent)
+
+    memoized.rendered_as_shared = True
+    assert not any("LazyButton" in code for code in lazy._get_all_dynamic_imports())
@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+import reflex as rx
+from reflex.utils.format import format_event_handler
+
+import heroui as hero
+from src.loading import loading
+
+
+class OrdersState(rx.State):
+    """Handlers covered by loading boundaries."""
+
+    @rx.event
+    def refresh(self):
+        pass
+
+    @rx.event
+    def export(self):
+        pass
+
+    @hero.background_event
+    async def build(self):
+        pass
+
+    @rx.event(background=True)
+    async def untracked(self):
+        pass
+
+
+def test_boundaries_wait_for_their_handlers(compile_page):
+    page = compile_page(
+        rx.fragment(
+            hero.loading_boundary(rx.text("orders"), on=OrdersState.refresh),
+            hero.loading_boundary(
+                rx.text("export"), on=[OrdersState.export, OrdersState.build]
+            ),
+        )
+    )
+    for handler in (OrdersState.refresh, OrdersState.export, OrdersState.build):
+        assert f'"{format_event_handler(handler)}"' in page
+    assert page.count("const heroPending") == 1
+    assert page.count("function HeroLoadingBoundary(") == 1
+
+
+def test_background_tasks_are_tracked():
+    boundary = hero.loading_boundary(
+        rx.text("report"), on=[OrdersState.refresh, OrdersState.build]
+    )
+    assert str(boundary.background) == f'["{format_event_handler(OrdersState.build)}"]'
+    assert "finished" in str(boundary.finished)
+    assert (
+        hero.loading_boundary(rx.text("x"), on=OrdersState.refresh).background is None
+    )
+
+
+def test_untracked_background_tasks_are_rejected():
+    with pytest.raises(ValueError, match="background_event"):
+        hero.loading_boundary(rx.text("x"), on=OrdersState.untracked)
+    with pytest.raises(TypeError):
+        hero.loading_boundary(rx.text("x"), on="refresh")
+
+
+class _Proxy:
+    """Stands in for the state proxy a background task runs against."""
+
+    def __init__(self):
+        self.tasks = loading.BackgroundTasks(_reflex_internal_init=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    async def get_state(self, state_cls):
+        return self.tasks
+
+    def get_full_name(self):
+        return OrdersState.get_full_name()
+
+
+def test_finished_runs_are_counted_even_on_errors():
+    @hero.background_event
+    async def fail(self):
+        raise RuntimeError
+
+    proxy = _Proxy()
+    asyncio.run(OrdersState.build.fn(proxy))
+    with pytest.raises(RuntimeError):
+        asyncio.run(fail(proxy))
+    name = OrdersState.get_full_name()
+    assert proxy.tasks.finished == {f"{name}.build": 1, f"{name}.fail": 1}
+
+
+def test_background_events_must_be_async():
+    with pytest.raises(TypeError, match="async"):
+        hero.background_event(lambda self: None)
@@ -0,0 +1,56 @@
+import re
+
+import reflex as rx
+from reflex.utils.format import format_library_name
+
+import heroui as hero
+from src.npm.npm import PACKAGE_VERSIONS, lib_deps, versioned
+
+
+def _components() -> list[type[rx.Component]]:
+    return [
+        value
+        for name in hero.__all__
+        if isinstance(value := getattr(hero, name), type)
+        and issubclass(value, rx.Component)
+    ]
+
+
+def test_versions_are_caret_ranges():
+    for package, version in PACKAGE_VERSIONS.items():
+        assert re.fullmatch(r"\^\d+\.\d+\.\d+", version), package
+    assert versioned("@heroui/button") == "@heroui/button@^2.2.0"
+
+
+def test_every_heroui_import_resolves_to_a_listed_package():
+    libraries = set(lib_deps)
+    for component in _components():
+        if isinstance(component.library, str):
+            libraries.add(component.library)
+        dependencies = component.get_fields()["lib_dependencies"].default
+        if isinstance(dependencies, list):
+            libraries.update(dependencies)
+    page = rx.fragment(
+        hero.form(hero.input(name="email")),
+        hero.select(hero.select_item("One", key="one"), on_load_more=rx.noop()),
+        hero.provider(rx.text("content"), lazy_motion=True),
+    )
+    libraries.update(page._get_all_imports())
+
+    heroui = {
+        library
+        for library in libraries
+        if format_library_name(library).startswith("@heroui/")
+    }
+    assert len(heroui) > 20
+    for library in heroui:
+        assert library == versioned(format_library_name(library)), library
+
+
+def test_used_packages_lists_only_rendered_components():
+    page = hero.provider(hero.button("Save"), hero.chip("New"))
+    packages = hero.used_packages([page])
+    assert versioned("@heroui/button") in packages
+    assert versioned("@heroui/chip") in packages
+    assert versioned("framer-motion") in packages
+    assert not any("@heroui/table" in package for package in packages)
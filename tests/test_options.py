@@ -0,0 +1,61 @@
+import json
+
+import reflex as rx
+
+import heroui as hero
+
+
+class SkuState(hero.OptionsState, rx.State):
+    """An options state with the full list kept on the server."""
+
+
+def _sent(state: rx.State) -> dict:
+    delta = state.get_delta()
+    state._clean()
+    return next(iter(delta.values()))
+
+
+def test_each_load_sends_only_the_new_window():
+    state = SkuState(_reflex_internal_init=True)
+    options = [{"key": str(i), "label": f"Option {i}"} for i in range(450)]
+    state._set_all_options(options)
+    first = _sent(state)
+    assert first["options_offset"] == 0
+    assert len(first["options"]) == SkuState.page_size
+
+    sizes = []
+    for offset in (200, 400):
+        state.load_more()
+        sent = _sent(state)
+        assert sent["options_offset"] == offset
+        assert sent["options"] == options[offset : offset + 200]
+        sizes.append(len(json.dumps(sent["options"])))
+    assert sizes[1] < sizes[0]
+    assert state.has_more is False
+
+
+def test_reset_starts_over_from_the_first_window():
+    state = SkuState(_reflex_internal_init=True)
+    state._set_all_options([{"key": str(i), "label": str(i)} for i in range(500)])
+    state.load_more()
+    state.reset_options()
+    assert state.options_offset == 0
+    assert state.options[0]["key"] == "0"
+
+
+def test_windows_are_appended_in_the_browser(compile_page):
+    page = compile_page(
+        hero.select(
+            items=SkuState.options,
+            window_offset=SkuState.options_offset,
+            on_load_more=SkuState.load_more,
+            has_more=SkuState.has_more,
+        )
+    )
+    assert ".slice(0, reflex___state" in page
+    assert "options_offset).concat(" in page
+
+
+def test_only_the_loaders_are_events():
+    assert "_set_all_options" not in SkuState.event_handlers
+    assert {"load_more", "reset_options"} <= set(SkuState.event_handlers)
@@ -0,0 +1,26 @@
+import pytest
+
+import heroui as hero
+from src.props import props
+
+
+def test_invalid_literal_raises():
+    with pytest.raises(TypeError, match="Button.color"):
+        hero.button("Save", color="blue")
+
+
+@pytest.mark.parametrize("value", ["nope", 13, "13", "1rem"])
+def test_spacer_checks_the_spacing_scale(value):
+    with pytest.raises(TypeError, match="Spacer.x"):
+        hero.spacer(x=value)
+
+
+def test_spacer_takes_scale_keys_as_numbers_or_strings():
+    spacer = hero.spacer(x=0.5, y="px")
+    assert spacer.render()["props"] == ["x:0.5", 'y:"px"']
+    assert str(hero.spacer(x="4").x) == '"4"'
+
+
+def test_invalid_values_pass_through_without_validation(monkeypatch):
+    monkeypatch.setattr(props, "VALIDATE_PROPS", False)
+    assert str(hero.spacer(x="nope").x) == '"nope"'
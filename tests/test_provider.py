@@ -0,0 +1,43 @@
+import inspect
+from pathlib import Path
+
+import reflex as rx
+
+import heroui as hero
+from src.provider.provider import LazyMotion, dom_animation_features
+
+
+def test_lazy_motion_imports_features_from_their_own_module(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    dom_animation_features.cache_clear()
+    provider = hero.provider(rx.text("content"), lazy_motion=True)
+    motion = provider.children[0]
+    assert isinstance(motion, LazyMotion)
+
+    features = str(motion.features)
+    assert 'import("framer-motion")' not in features
+    assert 'import("$/public/external/src/provider/provider/' in features
+
+    linked = tmp_path / "assets/external/src/provider/provider/motion_features.js"
+    module = Path(inspect.getfile(LazyMotion)).with_name("motion_features.js")
+    assert linked.resolve() == module.resolve()
+    assert "export default domAnimation" in linked.read_text()
+
+
+def test_lazy_motion_is_left_out_without_animations(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    provider = hero.provider(
+        rx.text("content"), lazy_motion=True, disable_animation=True
+    )
+    assert not isinstance(provider.children[0], LazyMotion)
+
+
+def test_features_are_linked_once(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    dom_animation_features.cache_clear()
+    first = hero.provider(rx.text("a"), lazy_motion=True).children[0].features
+    linked = tmp_path / "assets/external/src/provider/provider/motion_features.js"
+    linked.unlink()
+    second = hero.provider(rx.text("b"), lazy_motion=True).children[0].features
+    assert str(first) == str(second)
+    assert not linked.exists()
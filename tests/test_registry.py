@@ -0,0 +1,10 @@
+import heroui
+
+
+def test_all_lists_every_lazy_attribute():
+    assert heroui.__all__ == sorted(heroui._ATTR_TO_MODULE)
+
+
+def test_attributes_resolve_to_their_module():
+    for name in heroui.__all__:
+        assert getattr(heroui, name) is not None
@@ -0,0 +1,132 @@
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+
+import pytest
+import reflex as rx
+
+import heroui as hero
+from tests.states import FormState
+
+
+def _static_card() -> rx.Component:
+    return hero.card(
+        hero.static(hero.chip("Static chip"), hero.snippet("pip install heroui")),
+        class_name=rx.cond(FormState.text == "", "empty", "filled"),
+    )
+
+
+def test_subtree_is_hoisted_once_into_a_memo_component(compile_page):
+    page = compile_page(_static_card())
+    (tag,) = set(re.findall(r"\b(Static_[0-9a-f]{32})\b", page))
+
+    assert page.count(f"function {tag}_body") == 1
+    assert page.count(f"const {tag} = memo({tag}_body);") == 1
+    assert page.count('"Static chip"') == 1
+    # The stateful card references the memo component without props, so state
+    # changes re-render the card but never the hoisted subtree.
+    assert f"jsx({tag},{{}},)" in page
+    body = page[page.index(f"function {tag}_body") :]
+    assert "useContext(StateContexts" not in body.split(f"const {tag} = memo")[0]
+
+
+def test_state_changes_cannot_rerender_the_subtree(compile_page):
+    page = compile_page(_static_card())
+    (tag,) = set(re.findall(r"\b(Static_[0-9a-f]{32})\b", page))
+    body = page[page.index(f"function {tag}_body") : page.index(f"const {tag} = memo")]
+
+    # Defined at module level, so the memo component keeps its identity across
+    # renders of the page, and its body reads no state.
+    assert re.search(rf"^const {tag} = memo\({tag}_body\);$", page, re.MULTILINE)
+    assert page.index(f"const {tag} = memo") < page.index("export default function")
+    assert "reflex___state" not in body
+    assert "useContext" not in body
+    # Every reference passes no props: React.memo's shallow comparison of {} with
+    # {} always bails out, whatever state the parent re-rendered for.
+    assert re.findall(rf"jsx\({tag},([^)]*)\)", page) == ["{},"]
+
+    other = compile_page(
+        hero.card(
+            hero.static(hero.chip("Static chip"), hero.snippet("pip install heroui")),
+            class_name=rx.cond(FormState.text == "x", "a", "b"),
+        )
+    )
+    assert f"const {tag} = memo({tag}_body);" in other
+
+
+def test_state_vars_are_rejected():
+    with pytest.raises(ValueError, match="must not render state vars"):
+        hero.static(rx.text(FormState.text))
+
+
+def test_eager_hydration_renders_the_memo_component_directly(compile_page):
+    page = compile_page(hero.static(hero.chip("Static chip")))
+    assert "HeroLazyHydrate" not in page
+
+
+@pytest.mark.parametrize("hydrate", ["visible", "idle", "never"])
+def test_lazy_hydration_wraps_the_memo_component(compile_page, hydrate):
+    page = compile_page(hero.static(hero.chip("Static chip"), hydrate=hydrate))
+    (tag,) = set(re.findall(r"\b(Static_[0-9a-f]{32})\b", page))
+
+    assert page.count("function HeroLazyHydrate(") == 1
+    assert f'HeroLazyHydrate,\n{{when:"{hydrate}"}},\njsx({tag},{{}},)' in page
+    assert "{when}" not in page
+
+
+def test_unknown_hydrate_mode_is_rejected():
+    with pytest.raises(ValueError, match="Invalid hydrate mode"):
+        hero.static(hero.chip("Static chip"), hydrate="later")
+
+
+def test_example_page_hoists_its_static_block(example_page):
+    (tag,) = set(re.findall(r"\b(Static_[0-9a-f]{32})\b", example_page))
+    body = example_page[example_page.index(f"function {tag}_body") :]
+    body = body[: body.index(f"const {tag} = memo")]
+    assert 'title:"\\ud83d\\udc1a Sea of Packages"' in body
+    assert 'color:"success"' in body
+    assert "echo 'Hello, World!'" in body
+
+
+# Written by ``reflex export --frontend-only --no-zip`` in examples/.
+EXPORTED_INDEX = (
+    Path(__file__).parents[1] / "examples" / ".web" / "_static" / "index.html"
+)
+
+
+_VOID_TAGS = {"area", "base", "br", "col", "hr", "img", "input", "link", "meta"}
+
+
+class _ClassesAround(HTMLParser):
+    """Collects the classes of the elements enclosing a piece of text."""
+
+    def __init__(self, text: str):
+        super().__init__()
+        self.text = text
+        self.stack: list[str] = []
+        self.found: list[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag not in _VOID_TAGS:
+            self.stack.append(dict(attrs).get("class") or "")
+
+    def handle_endtag(self, tag):
+        if self.stack:
+            self.stack.pop()
+
+    def handle_data(self, data):
+        if self.text in data and not self.found:
+            self.found = " ".join(self.stack).split()
+
+
+@pytest.mark.skipif(
+    not EXPORTED_INDEX.exists(), reason="the example app has not been exported"
+)
+def test_exported_html_has_the_static_markup():
+    parser = _ClassesAround("Sea of Packages")
+    html = EXPORTED_INDEX.read_text()
+    parser.feed(html)
+    assert parser.found, "the alert title is missing from the exported HTML"
+    assert any(name.startswith(("bg-success", "text-success")) for name in parser.found)
+    # React escapes quotes in server-rendered text.
+    assert "echo &#x27;Hello, World!&#x27;" in html
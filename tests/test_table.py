@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+import reflex as rx
+
+import heroui as hero
+
+
+class OrdersState(hero.TableState, rx.State):
+    """A table state serving rows held in memory."""
+
+
+def _orders(count: int) -> list[dict]:
+    return [{"key": str(i), "name": f"Order {i:03d}", "total": i} for i in range(count)]
+
+
+def _sent(state: rx.State) -> dict:
+    delta = state.get_delta()
+    state._clean()
+    return next(iter(delta.values()))
+
+
+def test_each_load_sends_only_the_new_chunk():
+    state = OrdersState(_reflex_internal_init=True)
+    rows = _orders(250)
+    asyncio.run(state._set_all_rows(rows))
+    assert _sent(state)["rows"] == rows[:100]
+
+    asyncio.run(state.load_more())
+    sent = _sent(state)
+    assert sent["rows_offset"] == 100
+    assert sent["rows"] == rows[100:200]
+
+    asyncio.run(state.load_more())
+    assert _sent(state)["rows"] == rows[200:]
+    assert state.has_more is False
+
+
+def test_default_source_sorts_and_filters_in_memory():
+    state = OrdersState(_reflex_internal_init=True)
+    asyncio.run(state._set_all_rows(_orders(250)))
+    asyncio.run(state.sort({"column": "total", "direction": "descending"}))
+    assert state.rows_offset == 0
+    assert state.rows[0]["total"] == 249
+
+    asyncio.run(state.filter("order 00"))
+    assert [row["key"] for row in state.rows] == [str(i) for i in range(9, -1, -1)]
+
+
+def test_sessions_share_the_rows():
+    rows = _orders(250)
+    first = OrdersState(_reflex_internal_init=True)
+    asyncio.run(first._set_all_rows(rows))
+    second = OrdersState(_reflex_internal_init=True)
+    asyncio.run(second.reload())
+    asyncio.run(second.sort({"column": "total", "direction": "descending"}))
+
+    assert "_set_all_rows" not in OrdersState.event_handlers
+    assert "_all_rows" not in OrdersState.backend_vars
+    assert first.rows == rows[:100]
+    assert first._view is None
+    assert second.rows[0] == rows[249]
+    assert second._view[:3] == [249, 248, 247]
+
+
+def test_chunks_are_appended_in_the_browser(compile_page):
+    page = compile_page(
+        hero.table(
+            hero.table_header(hero.table_column("Name", key="name")),
+            hero.table_body(
+                items=OrdersState.rows,
+                window_offset=OrdersState.rows_offset,
+                columns=["name"],
+            ),
+            aria_label="Orders",
+        )
+    )
+    assert "rows_offset).concat(" in page
+
+
+def test_items_without_columns_are_rejected():
+    with pytest.raises(ValueError, match="columns"):
+        hero.table_body(items=OrdersState.rows)
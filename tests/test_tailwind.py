@@ -0,0 +1,64 @@
+import reflex as rx
+from reflex.utils.format import format_library_name
+
+import heroui as hero
+from src.tailwind.tailwind import PAGES_CONTENT, THEME_COMPONENTS, THEME_DIST
+
+
+def _theme_paths(config: dict) -> list:
+    return [path for path in config["content"] if path not in PAGES_CONTENT]
+
+
+def test_config_scans_only_the_components_used():
+    page = rx.fragment(hero.button("Save"), hero.chip("new"))
+    config = hero.tailwind_config([page])
+    assert _theme_paths(config) == [f"{THEME_DIST}/components/(button|chip|spinner).js"]
+    assert "input" not in str(config["content"])
+    assert config["plugins"] == [hero.HEROUI_PLUGIN]
+
+
+def test_config_includes_the_parts_a_component_renders():
+    assert hero.theme_components([hero.snippet("pip")]) == [
+        "button",
+        "popover",
+        "snippet",
+    ]
+
+
+def test_single_component_and_safelist():
+    config = hero.tailwind_config(
+        [hero.avatar(name="A")], base={}, safelist=["text-danger", "text-danger"]
+    )
+    assert _theme_paths(config) == [
+        f"{THEME_DIST}/components/avatar.js",
+        {"raw": "text-danger", "extension": "html"},
+    ]
+    assert "plugins" not in config
+
+
+def test_pages_without_heroui_scan_no_theme_modules():
+    config = hero.tailwind_config([rx.text("plain")])
+    assert config["content"] == PAGES_CONTENT
+
+
+def test_example_page_scans_only_the_packages_it_uses():
+    from examples.examples.examples import index
+
+    packages = {format_library_name(spec) for spec in hero.used_packages([index()])}
+    assert {"@heroui/alert", "@heroui/snippet", "@heroui/switch"} <= packages
+    assert not packages & {"@heroui/select", "@heroui/table", "@heroui/autocomplete"}
+
+    (glob,) = _theme_paths(hero.tailwind_config([index()]))
+    scanned = glob.removeprefix(f"{THEME_DIST}/components/(").removesuffix(").js")
+    expected = {
+        name for package in packages for name in THEME_COMPONENTS.get(package, ())
+    }
+    assert scanned.split("|") == sorted(expected)
+    # The theme modules only unused packages need are left out of the scan.
+    unused = {
+        name
+        for package, names in THEME_COMPONENTS.items()
+        if package not in packages
+        for name in names
+    }
+    assert unused - expected >= {"autocomplete", "listbox", "select", "table"}
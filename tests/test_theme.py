@@ -0,0 +1,68 @@
+import colorsys
+
+import pytest
+
+import heroui as hero
+from src.theme.theme import _luminance, _rgb
+
+
+def _lightness(value: str) -> float:
+    return float(value.split()[2].rstrip("%"))
+
+
+def _contrast(a: float, b: float) -> float:
+    return (max(a, b) + 0.05) / (min(a, b) + 0.05)
+
+
+def test_palette_is_a_scale_around_the_base_color():
+    scale = hero.palette("#006FEE")
+    assert len(scale) == len(hero.SHADES) == 10
+    h, l, s = colorsys.rgb_to_hls(0, 0x6F / 255, 0xEE / 255)
+    assert scale[hero.SHADES.index(500)] == (
+        f"{h * 360:.2f} {s * 100:.2f}% {l * 100:.2f}%"
+    )
+    lightness = [_lightness(value) for value in scale]
+    assert lightness == sorted(lightness, reverse=True)
+    assert lightness[0] > 90
+    assert lightness[-1] < 10
+    # Mixing in white or black keeps the hue.
+    assert {value.split()[0] for value in scale} == {f"{h * 360:.2f}"}
+
+
+def test_short_and_long_hex_colors_agree():
+    assert hero.palette("#0af") == hero.palette("#00AAFF")
+
+
+@pytest.mark.parametrize(
+    "color",
+    ["#000000", "#FFFFFF", "#006FEE", "#17C964", "#F5A524", "#F31260", "#7828C8"],
+)
+def test_foreground_has_the_better_contrast(color):
+    background = _luminance(*_rgb(color))
+    white, black = _contrast(background, 1.0), _contrast(background, 0.0)
+    if hero.foreground(color) == "0 0% 100%":
+        assert white >= black
+    else:
+        assert black >= white
+    # Black or white always reaches the WCAG AA ratio for normal text.
+    assert max(white, black) >= 4.5
+
+
+def test_theme_css_sets_light_and_dark_variables():
+    css = hero.theme_css(primary="#006FEE")
+    light, dark = css.split(".dark,[data-theme=dark]")
+    scale = hero.palette("#006FEE")
+    assert f"--heroui-primary-50:{scale[0]}" in light
+    assert f"--heroui-primary-50:{scale[-1]}" in dark
+    assert f"--heroui-primary:{scale[5]}" in light
+    assert "--heroui-primary-foreground:0 0% 100%" in dark
+    assert "secondary" not in css
+    assert hero.theme_css() == ""
+
+
+@pytest.mark.parametrize("color", ["blue", "#12345", "#ggg", "006FEE", "#006FEE80", ""])
+def test_invalid_colors_are_named(color):
+    with pytest.raises(ValueError, match=f"got {color!r}"):
+        hero.palette(color)
+    with pytest.raises(ValueError, match=f"got {color!r}"):
+        hero.theme(danger=color)